@@ -0,0 +1,45 @@
+"""Enforce uppercase requirement human-readable IDs.
+
+Revision ID: 059
+Revises: 058
+Create Date: 2026-10-18
+
+get_requirement_by_any_id accepts readable IDs in any case and looks them
+up by uppercasing the input. That only uses the unique index on
+requirements.human_readable_id if the stored values are themselves
+uppercase, which the HRID trigger produces but nothing guaranteed.
+
+Solution:
+- Normalize any existing lowercase/mixed-case IDs
+- Add a CHECK constraint so stored IDs stay uppercase, instead of adding a
+  functional index on upper(human_readable_id)
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '059'
+down_revision: Union[str, None] = '058'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Uppercase existing readable IDs and enforce it going forward."""
+    op.execute("""
+        UPDATE requirements
+        SET human_readable_id = upper(human_readable_id)
+        WHERE human_readable_id <> upper(human_readable_id)
+    """)
+
+    op.execute("""
+        ALTER TABLE requirements
+        ADD CONSTRAINT ck_requirements_hrid_uppercase
+        CHECK (human_readable_id = upper(human_readable_id))
+    """)
+
+
+def downgrade() -> None:
+    """Drop the uppercase constraint (normalized IDs are left as-is)."""
+    op.execute("ALTER TABLE requirements DROP CONSTRAINT ck_requirements_hrid_uppercase")
@@ -0,0 +1,35 @@
+"""Add a GIN index on requirement_versions.tags.
+
+Revision ID: 060
+Revises: 059
+Create Date: 2026-10-18
+
+GET /requirements?tags=a&tags=b filters in SQL with the array containment
+operator (tags @> ARRAY['a', 'b']) on the resolved version. Without an index
+PostgreSQL evaluates that against every version row; a GIN index on the
+array answers containment directly.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '060'
+down_revision: Union[str, None] = '059'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the GIN index for tag containment filters."""
+    op.create_index(
+        'ix_requirement_versions_tags',
+        'requirement_versions',
+        ['tags'],
+        postgresql_using='gin'
+    )
+
+
+def downgrade() -> None:
+    """Drop the tags GIN index."""
+    op.drop_index('ix_requirement_versions_tags', table_name='requirement_versions')
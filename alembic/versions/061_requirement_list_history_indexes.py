@@ -0,0 +1,47 @@
+"""Add composite indexes for requirement list and history reads.
+
+Revision ID: 061
+Revises: 060
+Create Date: 2026-10-18
+
+- requirement_history (requirement_id, changed_at DESC): GET
+  /requirements/{id}/history filters on requirement_id and returns the
+  newest N entries; the composite index serves filter, order and limit
+  without a sort over the requirement's full history.
+- requirements (project_id, type): GET /requirements?project_id=...&type=...
+  previously had to combine two single-column indexes.
+
+Children lookups already use the existing requirements.parent_id index.
+Requirements have no created_at column and status lives on versions, so
+no (organization_id, created_at) or (project_id, type, status) index applies.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '061'
+down_revision: Union[str, None] = '060'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the composite indexes."""
+    op.create_index(
+        'ix_requirement_history_requirement_changed_at',
+        'requirement_history',
+        ['requirement_id', sa.text('changed_at DESC')]
+    )
+    op.create_index(
+        'ix_requirements_project_type',
+        'requirements',
+        ['project_id', 'type']
+    )
+
+
+def downgrade() -> None:
+    """Drop the composite indexes."""
+    op.drop_index('ix_requirements_project_type', table_name='requirements')
+    op.drop_index('ix_requirement_history_requirement_changed_at', table_name='requirement_history')
@@ -0,0 +1,45 @@
+"""Enforce uppercase work item human-readable IDs.
+
+Revision ID: 062
+Revises: 061
+Create Date: 2026-10-18
+
+resolve_work_item_id and resolve_requirement_id accept readable IDs in any
+case and look them up by uppercasing the input, so the comparison uses the
+unique index on human_readable_id instead of lower() over every row. The
+work item HRID trigger only produces uppercase IDs; this makes it a
+guarantee, as migration 059 did for requirements.
+
+Solution:
+- Normalize any existing lowercase/mixed-case IDs
+- Add a CHECK constraint so stored IDs stay uppercase
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '062'
+down_revision: Union[str, None] = '061'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Uppercase existing readable IDs and enforce it going forward."""
+    op.execute("""
+        UPDATE work_items
+        SET human_readable_id = upper(human_readable_id)
+        WHERE human_readable_id <> upper(human_readable_id)
+    """)
+
+    op.execute("""
+        ALTER TABLE work_items
+        ADD CONSTRAINT ck_work_items_hrid_uppercase
+        CHECK (human_readable_id = upper(human_readable_id))
+    """)
+
+
+def downgrade() -> None:
+    """Drop the uppercase constraint (normalized IDs are left as-is)."""
+    op.execute("ALTER TABLE work_items DROP CONSTRAINT ck_work_items_hrid_uppercase")
@@ -0,0 +1,50 @@
+"""Add partial indexes for open-task list queries.
+
+Revision ID: 063
+Revises: 062
+Create Date: 2026-10-18
+
+GET /tasks excludes completed and cancelled tasks unless include_completed
+is set, and almost always filters by organization. Open tasks are a small
+and shrinking share of the table, so partial indexes over them stay small:
+
+- (organization_id, status, priority, due_date, created_at) for the default
+  list and its status/priority filters.
+- (organization_id, due_date) WHERE due_date IS NOT NULL for overdue_only,
+  which becomes a range scan on due_date < now().
+
+The list ORDER BY maps priority through a CASE, so PostgreSQL still sorts
+the filtered rows; the indexes remove the scan over closed tasks.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '063'
+down_revision: Union[str, None] = '062'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the partial indexes."""
+    op.create_index(
+        'ix_tasks_open_org_status_priority_due',
+        'tasks',
+        ['organization_id', 'status', 'priority', 'due_date', 'created_at'],
+        postgresql_where=sa.text("status NOT IN ('completed', 'cancelled')")
+    )
+    op.create_index(
+        'ix_tasks_open_org_due_date',
+        'tasks',
+        ['organization_id', 'due_date'],
+        postgresql_where=sa.text("due_date IS NOT NULL AND status NOT IN ('completed', 'cancelled')")
+    )
+
+
+def downgrade() -> None:
+    """Drop the partial indexes."""
+    op.drop_index('ix_tasks_open_org_due_date', table_name='tasks')
+    op.drop_index('ix_tasks_open_org_status_priority_due', table_name='tasks')
@@ -0,0 +1,44 @@
+"""Add trigram indexes for work item search.
+
+Revision ID: 064
+Revises: 063
+Create Date: 2026-10-18
+
+GET /work-items?search=... matches title, description and
+human_readable_id with ILIKE '%term%'. A leading wildcard cannot use a
+B-tree index, so every search scanned the whole table. pg_trgm GIN indexes
+answer ILIKE substring matches directly (for terms of three or more
+characters), and the OR of the three columns becomes a BitmapOr of index
+scans. Substring semantics are unchanged, so partial IDs such as "CR-01"
+still match, unlike a word-based tsvector search.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '064'
+down_revision: Union[str, None] = '063'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+SEARCH_COLUMNS = ('title', 'description', 'human_readable_id')
+
+
+def upgrade() -> None:
+    """Enable pg_trgm and create a trigram index per search column."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in SEARCH_COLUMNS:
+        op.create_index(
+            f'ix_work_items_{column}_trgm',
+            'work_items',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Drop the trigram indexes (the extension is left installed)."""
+    for column in reversed(SEARCH_COLUMNS):
+        op.drop_index(f'ix_work_items_{column}_trgm', table_name='work_items')
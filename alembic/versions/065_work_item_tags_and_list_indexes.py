@@ -0,0 +1,53 @@
+"""Add work item indexes for tag filters and list ordering.
+
+Revision ID: 065
+Revises: 064
+Create Date: 2026-10-18
+
+- work_items.tags (GIN): GET /work-items?tags=a,b filters with a single
+  array containment test (tags @> ARRAY['a', 'b']), which a GIN index
+  answers in one scan.
+- (project_id, created_at DESC) and (organization_id, created_at DESC): the
+  list is ordered newest first and scoped by project or organization, so
+  PostgreSQL can walk the index in order and stop at the page limit
+  instead of sorting every matching row. Status filters are applied while
+  walking; a leading status column would not help the default NOT IN
+  (completed, cancelled) filter keep that order.
+"""
+from typing import Sequence, Union
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = '065'
+down_revision: Union[str, None] = '064'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Create the tag and list-order indexes."""
+    op.create_index(
+        'ix_work_items_tags',
+        'work_items',
+        ['tags'],
+        postgresql_using='gin'
+    )
+    op.create_index(
+        'ix_work_items_project_created_at',
+        'work_items',
+        ['project_id', sa.text('created_at DESC')]
+    )
+    op.create_index(
+        'ix_work_items_organization_created_at',
+        'work_items',
+        ['organization_id', sa.text('created_at DESC')]
+    )
+
+
+def downgrade() -> None:
+    """Drop the tag and list-order indexes."""
+    op.drop_index('ix_work_items_organization_created_at', table_name='work_items')
+    op.drop_index('ix_work_items_project_created_at', table_name='work_items')
+    op.drop_index('ix_work_items_tags', table_name='work_items')
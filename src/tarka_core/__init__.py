@@ -57,6 +57,7 @@ from .crud import (
 from .schemas import (
     # Requirement schemas
     RequirementCreate,
+    RequirementBatchCreate,
     RequirementUpdate,
     RequirementResponse,
     RequirementListItem,
@@ -71,6 +72,7 @@ from .schemas import (
     ProjectCreate,
     ProjectUpdate,
     ProjectResponse,
+    ProjectListItem,
     ProjectListResponse,
     # Project Member schemas
     ProjectMemberCreate,
@@ -131,6 +133,7 @@ __all__ = [
     "users_share_organization",
     # Schemas
     "RequirementCreate",
+    "RequirementBatchCreate",
     "RequirementUpdate",
     "RequirementResponse",
     "RequirementListItem",
@@ -143,6 +146,7 @@ __all__ = [
     "ProjectCreate",
     "ProjectUpdate",
     "ProjectResponse",
+    "ProjectListItem",
     "ProjectListResponse",
     "ProjectMemberCreate",
     "ProjectMemberUpdate",
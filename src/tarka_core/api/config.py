@@ -15,9 +15,23 @@ class Settings(BaseSettings):
     # Database
     database_url: str = "postgresql://raas:raas@db:5432/raas"
 
+    # Connection pool. Sync handlers run in FastAPI's threadpool (40 threads
+    # by default) and hold a connection for the whole request, so size +
+    # overflow should cover it; lower these when running many workers
+    # against one PostgreSQL server.
+    db_pool_size: int = 10
+    db_max_overflow: int = 30
+    db_pool_timeout: int = 30
+    db_pool_recycle: int = 1800
+
     # CORS - Open for local development
     cors_origins: list[str] = ["*"]
 
+    # Response compression: bodies at least this large are gzipped when the
+    # client accepts it. Level 6 trades a little ratio for much less CPU than 9.
+    gzip_minimum_size: int = 1024
+    gzip_compresslevel: int = 6
+
     class Config:
         env_file = ".env"
         case_sensitive = False
@@ -8,14 +8,17 @@ from .config import get_settings
 settings = get_settings()
 
 # Create database engine
-# Conservative pool settings for local development
+# Pool sizing comes from settings (DB_POOL_SIZE, DB_MAX_OVERFLOW, ...)
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,          # Verify connections before using
-    pool_size=5,                 # Base pool of 5 connections
-    max_overflow=10,             # Allow up to 15 total connections
-    pool_recycle=3600,           # Recycle connections every hour
-    pool_timeout=30,             # Timeout after 30 seconds
+    pool_pre_ping=True,                        # Verify connections before using
+    pool_size=settings.db_pool_size,           # Connections kept open
+    max_overflow=settings.db_max_overflow,     # Extra connections under load
+    pool_recycle=settings.db_pool_recycle,     # Recycle connections (seconds)
+    pool_timeout=settings.db_pool_timeout,     # Wait for a free connection (seconds)
+    # Compiled SQL is cached per statement shape. List endpoints combine many
+    # optional filters, so the default 500 entries can churn and recompile.
+    query_cache_size=2000,
 )
 
 # Create session factory
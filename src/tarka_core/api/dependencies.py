@@ -3,8 +3,12 @@
 These dependencies work in both solo mode and team mode.
 """
 from typing import Optional
+from uuid import UUID
+
 from fastapi import Request
+from sqlalchemy.orm import Session
 
+from tarka_core import crud
 from tarka_core.models import User
 
 
@@ -23,3 +27,32 @@ def get_current_user_optional(request: Request) -> Optional[User]:
         User object if authenticated, None if solo mode
     """
     return getattr(request.state, "user", None)
+
+
+def get_request_organization_ids(request: Request, db: Session, user_id: UUID) -> list[UUID]:
+    """
+    Get the user's organization IDs, memoized for the lifetime of the request.
+
+    Access checks and list filters can both need the membership list while
+    handling one request; only the first call queries the database.
+
+    The list comes from crud.get_user_organization_ids, which caches it per
+    worker process for up to ORGANIZATION_IDS_TTL seconds. Membership
+    revocation is therefore eventually consistent: a user removed from an
+    organization can still pass these access filters on other workers until
+    their cached entry expires.
+
+    Args:
+        request: FastAPI request
+        db: Database session
+        user_id: User UUID
+
+    Returns:
+        List of organization UUIDs where user is a member
+    """
+    cached = getattr(request.state, "organization_ids", None)
+    if cached is not None and cached[0] == user_id:
+        return cached[1]
+    organization_ids = crud.get_user_organization_ids(db, user_id)
+    request.state.organization_ids = (user_id, organization_ids)
+    return organization_ids
@@ -1,11 +1,14 @@
 """RaaS Core FastAPI application - Solo developer mode (no authentication)."""
 import logging
+from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 
 from .config import get_settings
 from .routers import requirements, organizations, projects, users, guardrails, tasks, work_items, github, deployments, agents
+from ..github_integration import close_http_client
 
 # Configure logging
 logging.basicConfig(
@@ -17,6 +20,16 @@ logger = logging.getLogger("raas-core")
 settings = get_settings()
 logger.info("Starting RaaS Core API (solo mode - no authentication)")
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Application lifespan: release shared resources on shutdown."""
+    yield
+    # Flush coalesced webhook bookkeeping and close pooled GitHub API
+    # connections (CR-010)
+    await github.stop_last_sync_flusher()
+    await close_http_client()
+
 # Create FastAPI app
 app = FastAPI(
     title="RaaS Core API",
@@ -24,6 +37,7 @@ app = FastAPI(
     version="1.0.0",
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
 )
 
 # CORS middleware - Open for local development
@@ -35,6 +49,13 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# Compress large JSON bodies (requirement lists, history, markdown content)
+app.add_middleware(
+    GZipMiddleware,
+    minimum_size=settings.gzip_minimum_size,
+    compresslevel=settings.gzip_compresslevel,
+)
+
 # Include all business logic routers with /api/v1 prefix
 app.include_router(organizations.router, prefix="/api/v1/organizations")
 app.include_router(projects.router, prefix="/api/v1/projects")
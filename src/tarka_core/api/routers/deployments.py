@@ -92,7 +92,7 @@ def deployment_to_list_item(deployment: Deployment) -> DeploymentListItem:
 
 
 @router.post("/", response_model=DeploymentResponse, status_code=status.HTTP_201_CREATED)
-async def create_deployment(
+def create_deployment(
     data: DeploymentCreate,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -145,7 +145,7 @@ async def create_deployment(
 
 
 @router.get("/", response_model=DeploymentListResponse)
-async def list_deployments(
+def list_deployments(
     release_id: Optional[UUID] = None,
     environment: Optional[Environment] = None,
     status_filter: Optional[DeploymentStatus] = Query(None, alias="status"),
@@ -185,7 +185,7 @@ async def list_deployments(
 
 
 @router.get("/environment/{environment}", response_model=DeploymentListResponse)
-async def list_deployments_by_environment(
+def list_deployments_by_environment(
     environment: Environment,
     status_filter: Optional[DeploymentStatus] = Query(None, alias="status"),
     page: int = Query(1, ge=1),
@@ -220,7 +220,7 @@ async def list_deployments_by_environment(
 
 
 @router.get("/{deployment_id}", response_model=DeploymentResponse)
-async def get_deployment(
+def get_deployment(
     deployment_id: UUID,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -241,7 +241,7 @@ async def get_deployment(
 
 
 @router.post("/{deployment_id}/transition", response_model=DeploymentResponse)
-async def transition_deployment(
+def transition_deployment(
     deployment_id: UUID,
     data: DeploymentTransition,
     db: Session = Depends(get_db),
@@ -329,7 +329,7 @@ async def transition_deployment(
 
 
 @router.get("/release/{release_id}", response_model=ReleaseDeploymentsResponse)
-async def get_release_deployments(
+def get_release_deployments(
     release_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
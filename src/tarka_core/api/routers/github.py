@@ -5,12 +5,20 @@ Endpoints for:
 - RAAS-FEAT-044: Work Item to GitHub Issue Sync
 - RAAS-FEAT-045: GitHub Webhook Event Handling
 """
+import asyncio
 import logging
+import re
+import time
 from datetime import datetime
-from typing import Optional
+from functools import partial
+from types import MappingProxyType
+from typing import Callable, Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Header, Request, status
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Header, Request, status
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import column, select, update, values
 from sqlalchemy.orm import Session
 
 from ...models import (
@@ -34,9 +42,10 @@ from ...github_integration import (
     encrypt_credentials,
     decrypt_credentials,
     generate_webhook_secret,
+    get_http_client,
     verify_webhook_signature,
 )
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..dependencies import get_current_user_optional
 from .work_items import resolve_work_item_id
 
@@ -44,28 +53,133 @@ logger = logging.getLogger("raas-core.github_api")
 
 router = APIRouter(prefix="/github", tags=["github"])
 
+# Default Work Item type -> GitHub label mapping for new configurations.
+# Read-only; copied when assigned so the JSONB column gets its own dict.
+_DEFAULT_LABEL_MAPPING = MappingProxyType({
+    "cr": "raas:change-request",
+    "bug": "raas:bug",
+    "debt": "raas:technical-debt",
+    "release": "raas:release",
+})
+
+# Upper bound on a credentials check against the GitHub API
+VERIFY_TOKEN_TIMEOUT = 10.0
+
+GitHubClientFactory = Callable[[GitHubConfiguration], GitHubClient]
+
+
+def get_github_client_factory() -> GitHubClientFactory:
+    """Dependency returning a GitHubClient factory bound to the shared HTTP client."""
+    return partial(GitHubClient, http_client=get_http_client())
+
+
+def _touch_config(config_id: UUID, **fields) -> None:
+    """Write sync bookkeeping (last_sync_at, last_error, ...) for a configuration.
+
+    Runs as a background task with its own short-lived session so the
+    timestamp commit stays off the response critical path.
+    """
+    db = SessionLocal()
+    try:
+        db.query(GitHubConfiguration).filter(
+            GitHubConfiguration.id == config_id
+        ).update(fields, synchronize_session=False)
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not update GitHub config {config_id} bookkeeping: {e}")
+    finally:
+        db.close()
+
+
+# Coalesced last_sync_at updates for webhook deliveries. A busy repository can
+# send hundreds of events a minute and only the latest timestamp per
+# configuration matters, so deliveries record it here and a flusher writes all
+# pending values in a single UPDATE every LAST_SYNC_FLUSH_INTERVAL seconds.
+LAST_SYNC_FLUSH_INTERVAL = 1.0
+
+_pending_last_sync: dict[UUID, datetime] = {}
+_pending_lock = asyncio.Lock()
+_flusher_task: Optional[asyncio.Task] = None
+
+
+def _write_last_sync(pending: dict[UUID, datetime]) -> None:
+    """Write coalesced last_sync_at values with one UPDATE ... FROM (VALUES ...)."""
+    rows = values(
+        column("id", GitHubConfiguration.id.type),
+        column("ts", GitHubConfiguration.last_sync_at.type),
+        name="v",
+    ).data(list(pending.items()))
+
+    db = SessionLocal()
+    try:
+        db.execute(
+            update(GitHubConfiguration)
+            .where(GitHubConfiguration.id == rows.c.id)
+            .values(last_sync_at=rows.c.ts)
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+    except Exception as e:
+        db.rollback()
+        logger.warning(f"Could not flush last_sync_at for {len(pending)} GitHub configs: {e}")
+    finally:
+        db.close()
+
+
+async def flush_pending_last_sync() -> None:
+    """Flush all queued last_sync_at updates to the database."""
+    async with _pending_lock:
+        if not _pending_last_sync:
+            return
+        pending = dict(_pending_last_sync)
+        _pending_last_sync.clear()
+    await run_in_threadpool(_write_last_sync, pending)
+
+
+async def _last_sync_flusher() -> None:
+    """Background loop flushing queued last_sync_at updates."""
+    while True:
+        await asyncio.sleep(LAST_SYNC_FLUSH_INTERVAL)
+        await flush_pending_last_sync()
+
+
+async def _queue_last_sync(config_id: UUID, synced_at: datetime) -> None:
+    """Queue a last_sync_at update, starting the flusher on first use."""
+    global _flusher_task
+    async with _pending_lock:
+        _pending_last_sync[config_id] = synced_at
+    if _flusher_task is None or _flusher_task.done():
+        _flusher_task = asyncio.create_task(_last_sync_flusher())
+
+
+async def stop_last_sync_flusher() -> None:
+    """Stop the flusher and write any remaining updates (application shutdown)."""
+    global _flusher_task
+    if _flusher_task is not None:
+        _flusher_task.cancel()
+        try:
+            await _flusher_task
+        except asyncio.CancelledError:
+            pass
+        _flusher_task = None
+    await flush_pending_last_sync()
+
+
+# Webhook routing cache: (owner, name) -> (expires_at, route), where route is
+# (config_id, webhook_secret_encrypted) or None for repositories without an
+# active configuration. Lets unknown repositories and forged deliveries be
+# rejected without a database round-trip. Cleared on any configuration change;
+# other workers pick changes up within WEBHOOK_ROUTE_TTL seconds.
+WEBHOOK_ROUTE_TTL = 60.0
+WEBHOOK_ROUTE_CACHE_MAX = 1024
+
+_webhook_routes: dict[tuple[str, str], tuple[float, Optional[tuple[UUID, Optional[bytes]]]]] = {}
+
 
 def config_to_response(config: GitHubConfiguration) -> GitHubConfigurationResponse:
     """Convert GitHubConfiguration model to response schema."""
-    return GitHubConfigurationResponse(
-        id=config.id,
-        project_id=config.project_id,
-        repository_owner=config.repository_owner,
-        repository_name=config.repository_name,
-        full_repo_name=config.full_repo_name,
-        auth_type=config.auth_type,
-        has_credentials=config.encrypted_credentials is not None,
-        webhook_configured=config.webhook_id is not None,
-        label_mapping=config.label_mapping or {},
-        auto_create_issues=config.auto_create_issues,
-        sync_pr_status=config.sync_pr_status,
-        sync_releases=config.sync_releases,
-        is_active=config.is_active,
-        last_sync_at=config.last_sync_at,
-        last_error=config.last_error,
-        created_at=config.created_at,
-        updated_at=config.updated_at,
-    )
+    return GitHubConfigurationResponse.model_validate(config)
 
 
 # =============================================================================
@@ -74,7 +188,7 @@ def config_to_response(config: GitHubConfiguration) -> GitHubConfigurationRespon
 
 
 @router.post("/configurations", response_model=GitHubConfigurationResponse, status_code=status.HTTP_201_CREATED)
-async def create_configuration(
+def create_configuration(
     data: GitHubConfigurationCreate,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -85,7 +199,7 @@ async def create_configuration(
     Credentials are encrypted before storage.
     """
     # Check project exists
-    project = db.query(Project).filter(Project.id == data.project_id).first()
+    project = db.get(Project, data.project_id)
     if not project:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
@@ -93,9 +207,9 @@ async def create_configuration(
         )
 
     # Check no existing config
-    existing = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == data.project_id
-    ).first()
+    existing = db.scalar(
+        select(GitHubConfiguration).where(GitHubConfiguration.project_id == data.project_id)
+    )
     if existing:
         raise HTTPException(
             status_code=status.HTTP_409_CONFLICT,
@@ -112,12 +226,7 @@ async def create_configuration(
         repository_name=data.repository_name,
         auth_type=data.auth_type,
         encrypted_credentials=encrypted_creds,
-        label_mapping=data.label_mapping or {
-            "cr": "raas:change-request",
-            "bug": "raas:bug",
-            "debt": "raas:technical-debt",
-            "release": "raas:release",
-        },
+        label_mapping=data.label_mapping or dict(_DEFAULT_LABEL_MAPPING),
         auto_create_issues=data.auto_create_issues,
         sync_pr_status=data.sync_pr_status,
         sync_releases=data.sync_releases,
@@ -126,6 +235,7 @@ async def create_configuration(
 
     db.add(config)
     db.commit()
+    _webhook_routes.clear()
     db.refresh(config)
 
     logger.info(f"Created GitHub config for project {data.project_id}: {config.full_repo_name}")
@@ -133,15 +243,15 @@ async def create_configuration(
 
 
 @router.get("/configurations/{project_id}", response_model=GitHubConfigurationResponse)
-async def get_configuration(
+def get_configuration(
     project_id: UUID,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """Get GitHub configuration for a project."""
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == project_id
-    ).first()
+    config = db.scalar(
+        select(GitHubConfiguration).where(GitHubConfiguration.project_id == project_id)
+    )
 
     if not config:
         raise HTTPException(
@@ -153,16 +263,16 @@ async def get_configuration(
 
 
 @router.patch("/configurations/{project_id}", response_model=GitHubConfigurationResponse)
-async def update_configuration(
+def update_configuration(
     project_id: UUID,
     data: GitHubConfigurationUpdate,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """Update GitHub configuration for a project."""
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == project_id
-    ).first()
+    config = db.scalar(
+        select(GitHubConfiguration).where(GitHubConfiguration.project_id == project_id)
+    )
 
     if not config:
         raise HTTPException(
@@ -170,32 +280,37 @@ async def update_configuration(
             detail=f"No GitHub configuration for project {project_id}"
         )
 
-    # Update fields
-    if data.repository_owner is not None:
-        config.repository_owner = data.repository_owner
-    if data.repository_name is not None:
-        config.repository_name = data.repository_name
-    if data.credentials is not None:
-        config.encrypted_credentials = encrypt_credentials(data.credentials)
-    if data.label_mapping is not None:
-        config.label_mapping = data.label_mapping
-    if data.auto_create_issues is not None:
-        config.auto_create_issues = data.auto_create_issues
-    if data.sync_pr_status is not None:
-        config.sync_pr_status = data.sync_pr_status
-    if data.sync_releases is not None:
-        config.sync_releases = data.sync_releases
-    if data.is_active is not None:
-        config.is_active = data.is_active
-
-    config.updated_at = datetime.utcnow()
-    config.last_error = None  # Clear any previous errors
+    # Update fields; nothing here needs to see pending changes, so keep the
+    # session from flushing part-way through the setter block
+    with db.no_autoflush:
+        if data.repository_owner is not None:
+            config.repository_owner = data.repository_owner
+        if data.repository_name is not None:
+            config.repository_name = data.repository_name
+        if data.credentials is not None:
+            config.encrypted_credentials = encrypt_credentials(data.credentials)
+        if data.label_mapping is not None:
+            config.label_mapping = data.label_mapping
+        if data.auto_create_issues is not None:
+            config.auto_create_issues = data.auto_create_issues
+        if data.sync_pr_status is not None:
+            config.sync_pr_status = data.sync_pr_status
+        if data.sync_releases is not None:
+            config.sync_releases = data.sync_releases
+        if data.is_active is not None:
+            config.is_active = data.is_active
 
+        config.updated_at = datetime.utcnow()
+        config.last_error = None  # Clear any previous errors
+
+    # Every field is set in Python, so build the response before commit
+    # expires the instance instead of re-SELECTing it with refresh()
+    response = config_to_response(config)
     db.commit()
-    db.refresh(config)
+    _webhook_routes.clear()
 
     logger.info(f"Updated GitHub config for project {project_id}")
-    return config_to_response(config)
+    return response
 
 
 @router.delete("/configurations/{project_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -203,11 +318,12 @@ async def delete_configuration(
     project_id: UUID,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
+    github_client: GitHubClientFactory = Depends(get_github_client_factory),
 ):
     """Delete GitHub configuration for a project."""
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == project_id
-    ).first()
+    config = db.scalar(
+        select(GitHubConfiguration).where(GitHubConfiguration.project_id == project_id)
+    )
 
     if not config:
         raise HTTPException(
@@ -218,13 +334,14 @@ async def delete_configuration(
     # Try to delete webhook if configured
     if config.webhook_id:
         try:
-            client = GitHubClient(config)
+            client = github_client(config)
             await client.delete_webhook(config.webhook_id)
         except Exception as e:
             logger.warning(f"Could not delete webhook: {e}")
 
     db.delete(config)
     db.commit()
+    _webhook_routes.clear()
 
     logger.info(f"Deleted GitHub config for project {project_id}")
 
@@ -232,13 +349,15 @@ async def delete_configuration(
 @router.post("/configurations/{project_id}/verify", response_model=dict)
 async def verify_configuration(
     project_id: UUID,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
+    github_client: GitHubClientFactory = Depends(get_github_client_factory),
 ):
     """Verify GitHub credentials can access the repository."""
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == project_id
-    ).first()
+    config = db.scalar(
+        select(GitHubConfiguration).where(GitHubConfiguration.project_id == project_id)
+    )
 
     if not config:
         raise HTTPException(
@@ -246,17 +365,32 @@ async def verify_configuration(
             detail=f"No GitHub configuration for project {project_id}"
         )
 
-    client = GitHubClient(config)
+    client = github_client(config)
     try:
-        is_valid = await client.verify_token()
-        config.last_error = None if is_valid else "Token verification failed"
-        config.updated_at = datetime.utcnow()
-        db.commit()
+        is_valid = await asyncio.wait_for(
+            client.verify_token(), timeout=VERIFY_TOKEN_TIMEOUT
+        )
+        background_tasks.add_task(
+            _touch_config,
+            config.id,
+            last_error=None if is_valid else "Token verification failed",
+            updated_at=datetime.utcnow(),
+        )
 
         return {
             "valid": is_valid,
             "repository": config.full_repo_name,
         }
+    except asyncio.TimeoutError:
+        message = f"GitHub did not respond within {VERIFY_TOKEN_TIMEOUT:g}s"
+        config.last_error = message
+        config.updated_at = datetime.utcnow()
+        db.commit()
+
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Verification timed out: {message}"
+        )
     except Exception as e:
         config.last_error = str(e)
         config.updated_at = datetime.utcnow()
@@ -274,15 +408,16 @@ async def setup_webhook(
     webhook_url: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
+    github_client: GitHubClientFactory = Depends(get_github_client_factory),
 ):
     """Set up a GitHub webhook for the repository.
 
     The webhook_url should be the public URL for the RaaS webhook endpoint.
     E.g., https://raas.example.com/api/v1/github/webhook
     """
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == project_id
-    ).first()
+    config = db.scalar(
+        select(GitHubConfiguration).where(GitHubConfiguration.project_id == project_id)
+    )
 
     if not config:
         raise HTTPException(
@@ -293,19 +428,21 @@ async def setup_webhook(
     # Generate webhook secret
     secret = generate_webhook_secret()
 
-    client = GitHubClient(config)
+    client = github_client(config)
     try:
         webhook_data = await client.create_webhook(webhook_url, secret)
 
         # Store webhook info
-        config.webhook_id = str(webhook_data["id"])
+        webhook_id = str(webhook_data["id"])
+        config.webhook_id = webhook_id
         config.webhook_secret_encrypted = encrypt_credentials(secret)
         config.updated_at = datetime.utcnow()
         config.last_error = None
         db.commit()
+        _webhook_routes.clear()
 
         return {
-            "webhook_id": config.webhook_id,
+            "webhook_id": webhook_id,
             "webhook_url": webhook_url,
             "events": ["issues", "pull_request", "release"],
         }
@@ -327,8 +464,10 @@ async def setup_webhook(
 @router.post("/sync-issue", response_model=GitHubIssueSyncResponse)
 async def sync_work_item_to_issue(
     data: GitHubIssueSyncRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
+    github_client: GitHubClientFactory = Depends(get_github_client_factory),
 ):
     """Sync a Work Item to a GitHub Issue.
 
@@ -349,10 +488,12 @@ async def sync_work_item_to_issue(
             detail="Work Item must have a project to sync to GitHub"
         )
 
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.project_id == work_item.project_id,
-        GitHubConfiguration.is_active == True,
-    ).first()
+    config = db.scalar(
+        select(GitHubConfiguration).where(
+            GitHubConfiguration.project_id == work_item.project_id,
+            GitHubConfiguration.is_active == True,
+        )
+    )
 
     if not config:
         raise HTTPException(
@@ -367,7 +508,7 @@ async def sync_work_item_to_issue(
         if req.human_readable_id:
             affected_hrids.append(req.human_readable_id)
 
-    client = GitHubClient(config)
+    client = github_client(config)
 
     # Check if issue already exists
     refs = work_item.implementation_refs or {}
@@ -388,10 +529,11 @@ async def sync_work_item_to_issue(
             refs["github_issue_number"] = issue_data["number"]
             work_item.implementation_refs = refs
             work_item.updated_at = datetime.utcnow()
+            db.commit()
 
-        config.last_sync_at = datetime.utcnow()
-        config.last_error = None
-        db.commit()
+        background_tasks.add_task(
+            _touch_config, config.id, last_sync_at=datetime.utcnow(), last_error=None
+        )
 
         return GitHubIssueSyncResponse(
             work_item_id=work_item.id,
@@ -416,6 +558,93 @@ async def sync_work_item_to_issue(
 # =============================================================================
 
 
+# Top-level "repository" object and its full_name, matched on the raw body so
+# the route can be resolved and the signature checked before parsing JSON
+_REPOSITORY_KEY_RE = re.compile(rb'"repository"\s*:\s*\{')
+_FULL_NAME_RE = re.compile(rb'"full_name"\s*:\s*"([^"/]+)/([^"]+)"')
+
+
+def _peek_repository(body: bytes) -> Optional[tuple[str, str]]:
+    """Extract (owner, name) of the payload repository from the raw body.
+
+    GitHub places the top-level repository object after the event-specific
+    objects, so the last "repository" key is used. This is only a routing
+    hint; the parsed payload stays authoritative.
+    """
+    last = None
+    for last in _REPOSITORY_KEY_RE.finditer(body):
+        pass
+    if last is None:
+        return None
+    match = _FULL_NAME_RE.search(body, last.end())
+    if not match:
+        return None
+    return match.group(1).decode(), match.group(2).decode()
+
+
+def _repository_from_payload(payload: dict) -> Optional[tuple[str, str]]:
+    """Get (owner, name) of the payload repository from the parsed payload."""
+    repository = payload.get("repository") or {}
+    repo_owner = (repository.get("owner") or {}).get("login")
+    repo_name = repository.get("name")
+    if not repo_owner or not repo_name:
+        return None
+    return repo_owner, repo_name
+
+
+def _parse_payload(body: bytes) -> dict:
+    """Parse a webhook body, raising 400 on invalid JSON."""
+    try:
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid JSON payload"
+        )
+
+
+def _get_webhook_route(
+    db: Session, repo: tuple[str, str]
+) -> Optional[tuple[UUID, Optional[bytes]]]:
+    """Resolve a repository to (config_id, webhook_secret_encrypted), cached."""
+    now = time.monotonic()
+    cached = _webhook_routes.get(repo)
+    if cached and cached[0] > now:
+        return cached[1]
+
+    row = db.execute(
+        select(GitHubConfiguration.id, GitHubConfiguration.webhook_secret_encrypted).where(
+            GitHubConfiguration.repository_owner == repo[0],
+            GitHubConfiguration.repository_name == repo[1],
+            GitHubConfiguration.is_active == True,
+        )
+    ).first()
+    route = (row.id, row.webhook_secret_encrypted) if row else None
+    if len(_webhook_routes) >= WEBHOOK_ROUTE_CACHE_MAX:
+        # Bound memory when deliveries arrive for many unknown repositories
+        _webhook_routes.clear()
+    _webhook_routes[repo] = (now + WEBHOOK_ROUTE_TTL, route)
+    return route
+
+
+def _verify_route_signature(
+    route: tuple[UUID, Optional[bytes]],
+    repo: tuple[str, str],
+    body: bytes,
+    signature: Optional[str],
+) -> None:
+    """Verify the delivery signature if the configuration has a webhook secret."""
+    secret_encrypted = route[1]
+    if secret_encrypted and signature:
+        secret = decrypt_credentials(secret_encrypted)
+        if not verify_webhook_signature(body, signature, secret):
+            logger.warning(f"Invalid webhook signature for {repo[0]}/{repo[1]}")
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Invalid webhook signature"
+            )
+
+
 @router.post("/webhook", status_code=status.HTTP_200_OK)
 async def handle_webhook(
     request: Request,
@@ -433,44 +662,45 @@ async def handle_webhook(
     # Get raw body for signature verification
     body = await request.body()
 
-    # Parse payload
-    try:
-        payload = await request.json()
-    except Exception:
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid JSON payload"
-        )
+    # GitHub sends ping to verify webhook - answer before any config lookup
+    # or signature work since it changes nothing
+    if x_github_event == "ping":
+        return {"status": "pong", "zen": _parse_payload(body).get("zen")}
 
-    # Get repository info to find config
-    repository = payload.get("repository", {})
-    repo_owner = repository.get("owner", {}).get("login")
-    repo_name = repository.get("name")
+    # Locate the repository from the raw body so unknown repositories and bad
+    # signatures are rejected before the payload is parsed
+    payload = None
+    repo = _peek_repository(body)
+    if repo is None:
+        payload = _parse_payload(body)
+        repo = _repository_from_payload(payload)
 
-    if not repo_owner or not repo_name:
+    if repo is None:
         logger.warning("Webhook received without repository info")
         return {"status": "ignored", "reason": "no_repository"}
 
-    # Find matching config
-    config = db.query(GitHubConfiguration).filter(
-        GitHubConfiguration.repository_owner == repo_owner,
-        GitHubConfiguration.repository_name == repo_name,
-        GitHubConfiguration.is_active == True,
-    ).first()
-
-    if not config:
-        logger.debug(f"No config for {repo_owner}/{repo_name}")
+    route = _get_webhook_route(db, repo)
+    if route is None:
+        logger.debug(f"No config for {repo[0]}/{repo[1]}")
         return {"status": "ignored", "reason": "no_config"}
 
-    # Verify signature if webhook secret is configured
-    if config.webhook_secret_encrypted and x_hub_signature_256:
-        secret = decrypt_credentials(config.webhook_secret_encrypted)
-        if not verify_webhook_signature(body, x_hub_signature_256, secret):
-            logger.warning(f"Invalid webhook signature for {repo_owner}/{repo_name}")
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid webhook signature"
-            )
+    _verify_route_signature(route, repo, body, x_hub_signature_256)
+
+    if payload is None:
+        payload = _parse_payload(body)
+        parsed_repo = _repository_from_payload(payload)
+        if parsed_repo != repo:
+            # The raw-body scan matched the wrong object; route on the parsed
+            # repository instead
+            if parsed_repo is None:
+                return {"status": "ignored", "reason": "no_repository"}
+            repo = parsed_repo
+            route = _get_webhook_route(db, repo)
+            if route is None:
+                return {"status": "ignored", "reason": "no_config"}
+            _verify_route_signature(route, repo, body, x_hub_signature_256)
+
+    repository = payload.get("repository", {})
 
     # Handle event
     handler = GitHubWebhookHandler(db)
@@ -489,12 +719,7 @@ async def handle_webhook(
         release = payload.get("release", {})
         result = await handler.handle_release_event(action, release, repository)
 
-    elif x_github_event == "ping":
-        # GitHub sends ping to verify webhook
-        return {"status": "pong", "zen": payload.get("zen")}
-
-    config.last_sync_at = datetime.utcnow()
-    db.commit()
+    await _queue_last_sync(route[0], datetime.utcnow())
 
     return {
         "status": "processed",
@@ -5,7 +5,6 @@ from uuid import UUID
 
 from fastapi import APIRouter, Depends, HTTPException, Query, status, Request
 from sqlalchemy.orm import Session
-from math import ceil
 
 from tarka_core import crud, schemas, models
 from tarka_core.permissions import (
@@ -37,7 +36,7 @@ router = APIRouter(tags=["guardrails"])
 
 
 @router.get("/template", response_model=schemas.GuardrailTemplateResponse)
-async def get_guardrail_template():
+def get_guardrail_template():
     """
     Get the markdown template for creating a new guardrail.
 
@@ -49,7 +48,7 @@ async def get_guardrail_template():
 
 
 @router.post("/", response_model=schemas.GuardrailResponse, status_code=status.HTTP_201_CREATED)
-async def create_guardrail(
+def create_guardrail(
     guardrail: schemas.GuardrailCreate,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_current_user_optional),
@@ -93,7 +92,7 @@ async def create_guardrail(
 
 
 @router.get("/{guardrail_id}", response_model=schemas.GuardrailResponse)
-async def get_guardrail(
+def get_guardrail(
     guardrail_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_current_user_optional),
@@ -129,7 +128,7 @@ async def get_guardrail(
 
 
 @router.patch("/{guardrail_id}", response_model=schemas.GuardrailResponse)
-async def update_guardrail(
+def update_guardrail(
     guardrail_id: str,
     guardrail_update: schemas.GuardrailUpdate,
     db: Session = Depends(get_db),
@@ -179,7 +178,7 @@ async def update_guardrail(
 
 
 @router.delete("/{guardrail_id}", status_code=status.HTTP_204_NO_CONTENT)
-async def delete_guardrail(
+def delete_guardrail(
     guardrail_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_current_user_optional),
@@ -222,7 +221,7 @@ async def delete_guardrail(
 
 
 @router.get("/", response_model=schemas.GuardrailListResponse)
-async def list_guardrails(
+def list_guardrails(
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
     organization_id: Optional[UUID] = Query(None, description="Filter by organization"),
@@ -266,7 +265,7 @@ async def list_guardrails(
         user_id=current_user.id if current_user else None,
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 0
+    total_pages = (total + page_size - 1) // page_size
 
     return schemas.GuardrailListResponse(
         items=guardrails,
@@ -2,7 +2,6 @@
 import logging
 from typing import Optional
 from uuid import UUID
-from math import ceil
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
@@ -113,7 +112,7 @@ def list_organizations(
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0,
+        total_pages=(total + page_size - 1) // page_size,
     )
 
 
@@ -1,12 +1,14 @@
 """Projects API endpoints with RBAC permission checks."""
 import logging
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from math import ceil
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.orm import Session
 from tarka_core import crud, schemas, models
+from tarka_core.etag import etag_for_version, etag_matches
+from tarka_core.pagination import decode_cursor, encode_cursor
 from tarka_core.permissions import (
     check_org_permission,
     check_project_permission,
@@ -34,6 +36,11 @@ def _handle_permission_error(e: PermissionDeniedError) -> HTTPException:
     )
 
 
+def _project_cursor(project: models.Project) -> str:
+    """Build the keyset cursor for continuing after a project."""
+    return encode_cursor(project.created_at, project.id)
+
+
 router = APIRouter(tags=["projects"])
 
 
@@ -88,17 +95,18 @@ def create_project(
             settings=project.settings,
             user_id=current_user.id if current_user else None,
         )
-        logger.info(f"Created project '{result.name}' ({result.slug}) (ID: {result.id})")
+        logger.info("Created project '%s' (%s) (ID: %s)", result.name, result.slug, result.id)
         return result
     except Exception as e:
-        logger.error(f"Error creating project: {e}", exc_info=True)
+        logger.error("Error creating project: %s", e, exc_info=True)
         raise
 
 
 @router.get("/", response_model=schemas.ProjectListResponse)
 def list_projects(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (offset pagination; prefer cursor)", deprecated=True),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor"),
     organization_id: Optional[UUID] = Query(None, description="Filter by organization"),
     status: Optional[models.ProjectStatus] = Query(None, description="Filter by status"),
     visibility: Optional[models.ProjectVisibility] = Query(None, description="Filter by visibility"),
@@ -111,39 +119,65 @@ def list_projects(
 
     In team mode, only returns projects from organizations where user is a member.
 
-    - **page**: Page number (starts at 1)
+    Projects are returned newest first. Every response carries next_cursor when
+    more results exist; passing it back as cursor continues with keyset
+    pagination, which stays fast at any depth and skips the total count.
+
+    - **page**: Page number (starts at 1, ignored when cursor is given)
     - **page_size**: Number of items per page (1-100)
+    - **cursor**: Opaque cursor from a previous response
     - **organization_id**: Filter by organization
     - **status**: Filter by project status
     - **visibility**: Filter by visibility (public/private)
     - **search**: Search text in name and description
     """
-    skip = (page - 1) * page_size
-
-    # Get projects filtered by user's organization membership in team mode
-    projects, total = crud.get_projects(
-        db=db,
-        skip=skip,
-        limit=page_size,
+    filters = dict(
         organization_id=organization_id,
         status_filter=status,
         visibility_filter=visibility,
         search=search,
         user_id=current_user.id if current_user else None,
+        summary=True,
     )
 
+    if cursor:
+        try:
+            after = decode_cursor(cursor, datetime.fromisoformat, UUID)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Fetch one extra row to learn whether another page exists
+        projects, _ = crud.get_projects(db=db, limit=page_size + 1, cursor=after, **filters)
+        has_more = len(projects) > page_size
+        projects = projects[:page_size]
+
+        return schemas.ProjectListResponse(
+            items=projects,
+            page_size=page_size,
+            next_cursor=_project_cursor(projects[-1]) if has_more else None,
+        )
+
+    skip = (page - 1) * page_size
+
+    # Get projects filtered by user's organization membership in team mode
+    projects, total = crud.get_projects(db=db, skip=skip, limit=page_size, **filters)
+    has_more = skip + len(projects) < total
+
     return schemas.ProjectListResponse(
         items=projects,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0,
+        total_pages=(total + page_size - 1) // page_size,
+        next_cursor=_project_cursor(projects[-1]) if has_more and projects else None,
     )
 
 
 @router.get("/{project_id}", response_model=schemas.ProjectResponse)
 def get_project(
     project_id: UUID,
+    request: Request,
+    response: Response,
     db: Session = Depends(get_db),
     current_user: Optional[models.User] = Depends(get_current_user_optional),
 ):
@@ -151,6 +185,9 @@ def get_project(
     Get a specific project by ID.
 
     Requires membership in the project's organization.
+
+    Responses carry an ETag derived from updated_at; send it back as
+    If-None-Match to get 304 Not Modified when the project is unchanged.
     """
     project = crud.get_project(db, project_id)
     if not project:
@@ -166,6 +203,11 @@ def get_project(
         except PermissionDeniedError as e:
             raise _handle_permission_error(e)
 
+    # Every project column update bumps updated_at (onupdate), so it versions the response
+    etag = etag_for_version(project.id, project.updated_at.isoformat())
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    response.headers["ETag"] = etag
     return project
 
 
@@ -187,13 +229,13 @@ def update_project(
     - **visibility**: New visibility (optional)
     - **tags**: New tags list (optional)
     """
-    # Check project exists
-    existing = crud.get_project(db, project_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # In team mode, verify user has project admin or org admin/owner role
+    # In team mode, verify user has project admin or org admin/owner role.
+    # Solo mode has no permission check to run, so it skips the lookup too:
+    # crud.update_project's UPDATE ... RETURNING returns no row for a missing
+    # project, which becomes the 404 below.
     if current_user:
+        if not crud.get_project(db, project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
         try:
             check_project_permission(
                 db, current_user.id, project_id,
@@ -216,11 +258,14 @@ def update_project(
             settings=project_update.settings,
             organization_id=project_update.organization_id,
         )
-        return project
     except Exception as e:
-        logger.error(f"Error updating project {project_id}: {e}", exc_info=True)
+        logger.error("Error updating project %s: %s", project_id, e, exc_info=True)
         raise
 
+    if not project:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
+
 
 @router.delete("/{project_id}", status_code=204)
 def delete_project(
@@ -235,13 +280,15 @@ def delete_project(
 
     Use with caution!
     """
-    # Check project exists
-    existing = crud.get_project(db, project_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # In team mode, verify user has project admin or org admin/owner role
+    # In team mode, verify user has project admin or org admin/owner role,
+    # and hand the loaded project to crud.delete_project so it is not fetched
+    # twice. In solo mode crud.delete_project loads it itself (the ORM delete
+    # needs the instance to run its cascades) and reports a missing project.
+    existing = None
     if current_user:
+        existing = crud.get_project(db, project_id)
+        if not existing:
+            raise HTTPException(status_code=404, detail="Project not found")
         try:
             check_project_permission(
                 db, current_user.id, project_id,
@@ -250,7 +297,7 @@ def delete_project(
         except PermissionDeniedError as e:
             raise _handle_permission_error(e)
 
-    success = crud.delete_project(db, project_id)
+    success = crud.delete_project(db, project_id, db_project=existing)
     if not success:
         raise HTTPException(status_code=404, detail="Project not found")
 
@@ -343,13 +390,12 @@ def update_project_member(
 
     - **role**: New project role
     """
-    # Check project exists
-    project = crud.get_project(db, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # In team mode, verify user has project admin or org admin/owner role
+    # In team mode, verify user has project admin or org admin/owner role.
+    # Solo mode skips the project lookup; if the project does not exist, the
+    # member UPDATE ... RETURNING matches nothing and the 404 is "Member not found".
     if current_user:
+        if not crud.get_project(db, project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
         try:
             check_project_permission(
                 db, current_user.id, project_id,
@@ -365,10 +411,13 @@ def update_project_member(
             user_id=user_id,
             role=member_update.role,
         )
-        return result
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e))
 
+    if not result:
+        raise HTTPException(status_code=404, detail="Member not found")
+    return result
+
 
 @router.delete("/{project_id}/members/{user_id}", status_code=204)
 def remove_project_member(
@@ -382,13 +431,12 @@ def remove_project_member(
 
     Requires Project Admin role or Organization Admin/Owner role.
     """
-    # Check project exists
-    project = crud.get_project(db, project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # In team mode, verify user has project admin or org admin/owner role
+    # In team mode, verify user has project admin or org admin/owner role.
+    # Solo mode skips the project lookup; if the project does not exist, the
+    # member DELETE removes no row and the 404 is "Member not found".
     if current_user:
+        if not crud.get_project(db, project_id):
+            raise HTTPException(status_code=404, detail="Project not found")
         try:
             check_project_permission(
                 db, current_user.id, project_id,
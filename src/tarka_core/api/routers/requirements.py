@@ -1,16 +1,28 @@
 """Requirements API endpoints (solo mode - no authentication)."""
+import json
 import logging
+import re
+from functools import lru_cache
 from typing import Optional
 from uuid import UUID
-from math import ceil
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request, Header
+import yaml
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Header, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from tarka_core import crud, schemas, models
+from tarka_core.etag import etag_for_bytes, etag_matches
+from tarka_core.pagination import decode_cursor, encode_cursor
 from tarka_core.markdown_utils import load_template
 from tarka_core.hierarchy_validation import find_hierarchy_violations
-from tarka_core.api.dependencies import get_current_user_optional
+from tarka_core.api.dependencies import get_current_user_optional, get_request_organization_ids
 from tarka_core.persona_auth import Persona
+from tarka_core.versioning import (
+    get_acceptance_criteria_summary,
+    resolve_version,
+    update_acceptance_criteria_met_status,
+)
 
 from ..database import get_db
 
@@ -18,9 +30,191 @@ logger = logging.getLogger("raas-core.requirements")
 
 router = APIRouter(tags=["requirements"])
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+_REQUIREMENT_TYPE_VALUES = frozenset(t.value for t in models.RequirementType)
+
+# X-Persona header values, lower-cased
+_PERSONA_BY_NAME = {p.value: p for p in Persona}
+_VALID_PERSONA_NAMES = ", ".join(_PERSONA_BY_NAME)
+
+# Top-level `key: value` lines in frontmatter (see _scan_frontmatter)
+_TYPE_LINE_RE = re.compile(r'^type:(.*)$', re.MULTILINE)
+_PARENT_ID_LINE_RE = re.compile(r'^parent_id:(.*)$', re.MULTILINE)
+
+_children_adapter = TypeAdapter(list[schemas.RequirementListItem])
+_history_adapter = TypeAdapter(list[schemas.RequirementHistoryResponse])
+
+# Templates only change on deploy, so shared caches may keep them for a day.
+# Everything else is per-user: private caches must revalidate via the ETag.
+TEMPLATE_CACHE_CONTROL = "public, max-age=86400"
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+
+def _optional_str(value) -> Optional[str]:
+    """Cursor converter for the nullable human_readable_id sort key."""
+    if value is not None and not isinstance(value, str):
+        raise ValueError("expected a string")
+    return value
+
+
+def _requirement_cursor(requirement: models.Requirement) -> str:
+    """Build the keyset cursor for continuing after a requirement."""
+    return encode_cursor(*crud.requirement_sort_key(requirement))
+
+
+def _conditional_json(request: Request, body: bytes) -> Response:
+    """Return a JSON body with an ETag, or 304 if the client already has it.
+
+    Requirement fields such as status, tags and acceptance criteria change
+    without bumping updated_at, so the tag is derived from the body itself.
+    """
+    return _cached_json(request, body, etag_for_bytes(body), PRIVATE_CACHE_CONTROL)
+
+
+def _cached_json(request: Request, body: bytes, etag: str, cache_control: str) -> Response:
+    """Return a JSON body with caching headers, or 304 on an If-None-Match hit."""
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if cache_control == PRIVATE_CACHE_CONTROL:
+        headers["Vary"] = "Authorization"
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _list_response(**fields) -> Response:
+    """Serialize a requirement list page straight to JSON bytes.
+
+    The route keeps response_model for the OpenAPI schema, but returning a
+    Response skips FastAPI's second validation pass (run in the threadpool
+    for sync handlers) over up to 100 items.
+    """
+    payload = schemas.RequirementListResponse(**fields)
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
+@lru_cache(maxsize=None)
+def _template_body(req_type: models.RequirementType) -> tuple[bytes, str]:
+    """Serialize a template response once per type, with its ETag."""
+    body = json.dumps({"type": req_type.value, "template": load_template(req_type)}).encode()
+    return body, etag_for_bytes(body)
+
+
+# Warm the template cache at import so the first request per type is a dict hit
+for _req_type in models.RequirementType:
+    try:
+        _template_body(_req_type)
+    except FileNotFoundError:
+        logger.warning("Template not found for type %s", _req_type.value)
+
+
+def _last_scalar(pattern: re.Pattern, text: str) -> Optional[str]:
+    """Return the last top-level value matched by pattern, unquoted."""
+    values = pattern.findall(text)
+    return values[-1].strip().strip("'\"") if values else None
+
+
+def _scan_frontmatter(frontmatter_text: str) -> Optional[dict]:
+    """Read type and parent_id from frontmatter without a full YAML parse.
+
+    Templates write both as plain `key: value` lines, so a line scan finds
+    them. Returns None whenever the values are not unambiguous (missing,
+    unknown type, non-UUID parent_id, comments, flow syntax...), in which
+    case the caller falls back to the YAML loader. Full parsing and
+    validation still happen in crud.create_requirement.
+    """
+    declared_type = _last_scalar(_TYPE_LINE_RE, frontmatter_text)
+    if declared_type not in _REQUIREMENT_TYPE_VALUES:
+        return None
+    if declared_type == models.RequirementType.EPIC.value:
+        return {"type": declared_type}
+
+    parent_id = _last_scalar(_PARENT_ID_LINE_RE, frontmatter_text)
+    try:
+        UUID(parent_id)
+    except (TypeError, ValueError):
+        return None
+    return {"type": declared_type, "parent_id": parent_id}
+
+
+def _validate_create_payload(requirement: schemas.RequirementCreate):
+    """Run the stateless checks on a create payload before any database work.
+
+    Parses the YAML frontmatter, checks its type matches the request, and
+    checks the type's required reference (project_id for epics, parent_id in
+    the frontmatter otherwise), so malformed input never costs a query.
+
+    Returns:
+        parent_id from the frontmatter as a UUID, or None for epics
+
+    Raises:
+        HTTPException: 400 if the frontmatter or references are missing or invalid,
+            404 if parent_id is not a UUID (no such requirement can exist)
+    """
+    if requirement.type == models.RequirementType.EPIC and not requirement.project_id:
+        raise HTTPException(status_code=400, detail="Epics require a project_id")
+
+    content = requirement.content.strip()
+    if not content.startswith("---"):
+        raise HTTPException(status_code=400, detail="Content must start with YAML frontmatter (---)")
+
+    # Find end of frontmatter without scanning the markdown body
+    end = content.find("\n---", 4) if content.startswith("---\n") else -1
+    if end < 0:
+        raise HTTPException(status_code=400, detail="Markdown must include YAML frontmatter")
+
+    frontmatter_text = content[4:end]
+    frontmatter = _scan_frontmatter(frontmatter_text)
+    if frontmatter is None:
+        # Not the plain one-line form; let the YAML parser decide
+        try:
+            frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
+        except yaml.YAMLError as e:
+            raise HTTPException(status_code=400, detail=f"Invalid YAML frontmatter: {e}")
+        if not isinstance(frontmatter, dict):
+            raise HTTPException(status_code=400, detail="Markdown must include YAML frontmatter")
+
+    declared_type = frontmatter.get("type")
+    if declared_type in _REQUIREMENT_TYPE_VALUES and declared_type != requirement.type.value:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Type mismatch: requirement type parameter is '{requirement.type.value}' "
+                   f"but content frontmatter specifies '{declared_type}'"
+        )
+
+    if requirement.type == models.RequirementType.EPIC:
+        return None
+
+    parent_id = frontmatter.get("parent_id")
+    if not parent_id:
+        raise HTTPException(
+            status_code=400,
+            detail=f"{requirement.type.value} requires a parent_id in the markdown frontmatter"
+        )
+    try:
+        return UUID(str(parent_id))
+    except ValueError:
+        raise HTTPException(status_code=404, detail=f"Parent requirement {parent_id} not found")
+
+
+def _resolve_actor_id(db: Session, x_agent_email: Optional[str]) -> Optional[UUID]:
+    """BUG-003: Look up the agent account for the director/actor audit trail."""
+    if not x_agent_email:
+        return None
+    agent_user = crud.get_agent_by_email(db, x_agent_email)
+    if not agent_user:
+        logger.warning("Agent email %s not found in database", x_agent_email)
+        return None
+    logger.debug("Agent %s resolved to actor_id %s", x_agent_email, agent_user.id)
+    return agent_user.id
+
 
 @router.get("/templates/{req_type}")
-def get_requirement_template(req_type: models.RequirementType):
+def get_requirement_template(req_type: models.RequirementType, request: Request):
     """
     Get the markdown template for a specific requirement type.
 
@@ -31,17 +225,17 @@ def get_requirement_template(req_type: models.RequirementType):
     - **req_type**: The requirement type (epic, component, feature, requirement)
     """
     try:
-        template = load_template(req_type)
-        logger.debug(f"Template loaded for type: {req_type.value}")
-        return {"type": req_type.value, "template": template}
+        body, etag = _template_body(req_type)
+        logger.debug("Template loaded for type: %s", req_type.value)
+        return _cached_json(request, body, etag, TEMPLATE_CACHE_CONTROL)
     except FileNotFoundError as e:
-        logger.error(f"Template not found for type {req_type.value}: {e}")
+        logger.error("Template not found for type %s: %s", req_type.value, e)
         raise HTTPException(
             status_code=404,
             detail=f"Template not found for type: {req_type.value}"
         )
     except Exception as e:
-        logger.error(f"Unexpected error loading template for {req_type.value}: {e}")
+        logger.error("Unexpected error loading template for %s: %s", req_type.value, e)
         raise
 
 
@@ -67,16 +261,12 @@ def create_requirement(
     - **tags**: List of tags (optional)
     - **X-Agent-Email**: Header for agent performing action (for audit trail)
     """
-    # Derive organization_id from parent/project
-    organization_id = None
+    # Reject malformed payloads before touching the database
+    parent_id = _validate_create_payload(requirement)
 
+    # Derive organization_id from parent/project
     if requirement.type == models.RequirementType.EPIC:
         # For epics, get organization from project
-        if not requirement.project_id:
-            raise HTTPException(
-                status_code=400,
-                detail="Epics require a project_id"
-            )
         project = crud.get_project(db, requirement.project_id)
         if not project:
             raise HTTPException(
@@ -85,53 +275,19 @@ def create_requirement(
             )
         organization_id = project.organization_id
     else:
-        # For non-epics, extract parent_id from markdown and get org from parent
-        import yaml
-        import re
-
-        # Extract YAML frontmatter
-        content = requirement.content.strip()
-        if content.startswith("---"):
-            # Find end of frontmatter
-            match = re.match(r'^---\n(.*?)\n---', content, re.DOTALL)
-            if match:
-                try:
-                    frontmatter = yaml.safe_load(match.group(1))
-                    parent_id = frontmatter.get("parent_id")
-
-                    if not parent_id:
-                        raise HTTPException(
-                            status_code=400,
-                            detail=f"{requirement.type.value} requires a parent_id in the markdown frontmatter"
-                        )
-
-                    parent = crud.get_requirement(db, parent_id)
-                    if not parent:
-                        raise HTTPException(
-                            status_code=404,
-                            detail=f"Parent requirement {parent_id} not found"
-                        )
-                    organization_id = parent.organization_id
-                except yaml.YAMLError as e:
-                    raise HTTPException(status_code=400, detail=f"Invalid YAML frontmatter: {e}")
-            else:
-                raise HTTPException(status_code=400, detail="Markdown must include YAML frontmatter")
-        else:
-            raise HTTPException(status_code=400, detail="Content must start with YAML frontmatter (---)")
+        # For non-epics, get org from the parent named in the frontmatter
+        parent = crud.get_requirement(db, parent_id)
+        if not parent:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Parent requirement {parent_id} not found"
+            )
+        organization_id = parent.organization_id
 
     # Get current user (for permission checking in team mode, None in solo mode)
     current_user = get_current_user_optional(request)
     user_id = current_user.id if current_user else None
-
-    # BUG-003: Look up agent for actor_id (director/actor audit trail)
-    actor_id = None
-    if x_agent_email:
-        agent_user = crud.get_agent_by_email(db, x_agent_email)
-        if agent_user:
-            actor_id = agent_user.id
-            logger.debug(f"Agent {x_agent_email} resolved to actor_id {actor_id}")
-        else:
-            logger.warning(f"Agent email {x_agent_email} not found in database")
+    actor_id = _resolve_actor_id(db, x_agent_email)
 
     try:
         result = crud.create_requirement(
@@ -143,22 +299,81 @@ def create_requirement(
             director_id=user_id,  # BUG-003: director is the authenticated user
             actor_id=actor_id,    # BUG-003: actor is the agent (if any)
         )
-        logger.info(f"Created {result.type.value} '{result.title}' (ID: {result.id})")
+        logger.info("Created %s '%s' (ID: %s)", result.type.value, result.title, result.id)
         return result
     except ValueError as e:
         # Validation errors from crud layer (e.g., invalid guardrail references, invalid dependencies)
-        logger.warning(f"Validation error creating requirement: {e}")
+        logger.warning("Validation error creating requirement: %s", e)
         raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
-        logger.error(f"Error creating requirement: {e}", exc_info=True)
+        logger.error("Error creating requirement: %s", e, exc_info=True)
         raise
 
 
+@router.post("/batch", response_model=list[schemas.RequirementResponse], status_code=201)
+def batch_create_requirements(
+    batch: schemas.RequirementBatchCreate,
+    request: Request,
+    x_agent_email: Optional[str] = Header(
+        None,
+        description="Agent email performing this action on behalf of the director (human). "
+                    "Used for director/actor audit trail per BUG-003 and GUARD-SEC-003."
+    ),
+    db: Session = Depends(get_db),
+):
+    """
+    Create several requirements in one request (for import/ingest flows).
+
+    Each item follows the same rules as POST /requirements/. Frontmatter is
+    checked for every item before any query runs; referenced projects and
+    parents are then loaded with one query each. Items are created in order
+    in a single transaction: if any item is rejected, nothing is created, so
+    a failed batch can be retried as is.
+
+    Parents are referenced by UUID, so a parent must already exist before the
+    batch is sent; create one hierarchy level per batch.
+
+    - **requirements**: 1-100 requirement creation payloads
+    - **X-Agent-Email**: Header for agent performing action (for audit trail)
+    """
+    # Run the stateless checks on every item before touching the database
+    items = []
+    for index, requirement in enumerate(batch.requirements):
+        try:
+            parent_id = _validate_create_payload(requirement)
+        except HTTPException as e:
+            raise HTTPException(status_code=e.status_code, detail=f"Item {index}: {e.detail}")
+        items.append((requirement, parent_id))
+
+    current_user = get_current_user_optional(request)
+    user_id = current_user.id if current_user else None
+    actor_id = _resolve_actor_id(db, x_agent_email)
+
+    try:
+        results = crud.create_requirements(
+            db,
+            items,
+            user_id=user_id,
+            director_id=user_id,  # BUG-003: director is the authenticated user
+            actor_id=actor_id,    # BUG-003: actor is the agent (if any)
+        )
+    except crud.RequirementReferenceNotFoundError as e:
+        raise HTTPException(status_code=404, detail=str(e))
+    except ValueError as e:
+        logger.warning("Validation error creating requirement batch: %s", e)
+        raise HTTPException(status_code=400, detail=f"{e} (no items were created)")
+
+    logger.info("Batch-created %s requirements", len(results))
+    return results
+
+
 @router.get("/", response_model=schemas.RequirementListResponse)
 def list_requirements(
     request: Request,
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (offset pagination; prefer cursor)", deprecated=True),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor"),
+    count: bool = Query(True, description="Compute total/total_pages (page mode only)"),
     type: Optional[models.RequirementType] = Query(None, description="Filter by type"),
     status: Optional[models.LifecycleStatus] = Query(None, description="Filter by status"),
     quality_score: Optional[models.QualityScore] = Query(None, description="Filter by quality score"),
@@ -178,8 +393,14 @@ def list_requirements(
     In team mode, only returns requirements from projects in organizations
     where the user is a member.
 
-    - **page**: Page number (starts at 1)
+    Every response carries next_cursor when more results exist; passing it
+    back as cursor continues with keyset pagination, which stays fast at any
+    depth and skips the total count.
+
+    - **page**: Page number (starts at 1, ignored when cursor is given)
     - **page_size**: Number of items per page (1-100)
+    - **cursor**: Opaque cursor from a previous response
+    - **count**: Set false to skip the total count on page-based requests
     - **type**: Filter by requirement type
     - **status**: Filter by lifecycle status
     - **quality_score**: Filter by quality score (OK, NEEDS_REVIEW, LOW_QUALITY)
@@ -196,10 +417,10 @@ def list_requirements(
     # Get user's organization IDs for filtering (None means no filtering in solo mode)
     organization_ids = None
     if current_user:
-        organization_ids = crud.get_user_organization_ids(db, current_user.id)
+        organization_ids = get_request_organization_ids(request, db, current_user.id)
         if not organization_ids:
             # User has no organization memberships - return empty results
-            return schemas.RequirementListResponse(
+            return _list_response(
                 items=[],
                 total=0,
                 page=page,
@@ -207,11 +428,7 @@ def list_requirements(
                 total_pages=0,
             )
 
-    skip = (page - 1) * page_size
-    requirements, total = crud.get_requirements(
-        db=db,
-        skip=skip,
-        limit=page_size,
+    filters = dict(
         type_filter=type,
         status_filter=status,
         quality_score_filter=quality_score,
@@ -226,46 +443,89 @@ def list_requirements(
         blocked_by=blocked_by,
     )
 
-    return schemas.RequirementListResponse(
+    if cursor:
+        try:
+            after = decode_cursor(cursor, int, _optional_str, UUID)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Fetch one extra row to learn whether another page exists
+        requirements, _ = crud.get_requirements(db=db, limit=page_size + 1, cursor=after, **filters)
+        has_more = len(requirements) > page_size
+        requirements = requirements[:page_size]
+
+        return _list_response(
+            items=requirements,
+            page_size=page_size,
+            next_cursor=_requirement_cursor(requirements[-1]) if has_more else None,
+        )
+
+    skip = (page - 1) * page_size
+
+    if not count:
+        requirements, _ = crud.get_requirements(
+            db=db, skip=skip, limit=page_size + 1, with_total=False, **filters
+        )
+        has_more = len(requirements) > page_size
+        requirements = requirements[:page_size]
+
+        return _list_response(
+            items=requirements,
+            page=page,
+            page_size=page_size,
+            next_cursor=_requirement_cursor(requirements[-1]) if has_more else None,
+        )
+
+    requirements, total = crud.get_requirements(db=db, skip=skip, limit=page_size, **filters)
+    has_more = skip + len(requirements) < total
+
+    return _list_response(
         items=requirements,
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0,
+        total_pages=(total + page_size - 1) // page_size,
+        next_cursor=_requirement_cursor(requirements[-1]) if has_more and requirements else None,
     )
 
 
-def _check_requirement_access(
+def _get_accessible_requirement(
     request: Request,
-    requirement: models.Requirement,
     db: Session,
-) -> None:
+    requirement_id: str,
+) -> models.Requirement:
     """
-    Check if current user has access to a requirement via organization membership.
+    Load a requirement by UUID or human-readable ID and check access to it.
 
-    In team mode, user must be a member of the requirement's organization.
-    In solo mode (current_user is None), access is always granted.
+    In team mode, user must be a member of the requirement's organization;
+    existence and membership are resolved in one query. In solo mode
+    (current_user is None), access is always granted.
 
     Raises:
-        HTTPException: 403 if user doesn't have access
+        HTTPException: 404 if not found, 403 if user doesn't have access
     """
     current_user = get_current_user_optional(request)
-    if current_user:
-        organization_ids = crud.get_user_organization_ids(db, current_user.id)
-        if requirement.organization_id not in organization_ids:
-            logger.warning(
-                f"User {current_user.id} denied access to requirement {requirement.id} "
-                f"(org {requirement.organization_id} not in user's orgs)"
-            )
-            raise HTTPException(
-                status_code=403,
-                detail={
-                    "error": "permission_denied",
-                    "message": "You don't have access to this requirement. "
-                               "You must be a member of the requirement's organization.",
-                    "resource_type": "requirement",
-                }
-            )
+    requirement, has_access = crud.get_requirement_with_access(
+        db, requirement_id, current_user.id if current_user else None
+    )
+    if not requirement:
+        raise HTTPException(status_code=404, detail=f"Requirement not found: {requirement_id}")
+
+    if not has_access:
+        logger.warning(
+            "User %s denied access to requirement %s (org %s not in user's orgs)",
+            current_user.id, requirement.id, requirement.organization_id,
+        )
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "permission_denied",
+                "message": "You don't have access to this requirement. "
+                           "You must be a member of the requirement's organization.",
+                "resource_type": "requirement",
+            }
+        )
+    return requirement
 
 
 @router.get("/{requirement_id}", response_model=schemas.RequirementResponse)
@@ -283,23 +543,22 @@ def get_requirement(
     - UUID: afa92d5c-e008-44d6-b2cf-ccacd81481d6
     - Readable: RAAS-FEAT-042 (case-insensitive)
 
+    Responses carry an ETag; send it back as If-None-Match to get 304 Not
+    Modified when the requirement is unchanged.
+
     - **requirement_id**: UUID or human-readable ID of the requirement
     """
     try:
-        requirement = crud.get_requirement_by_any_id(db, requirement_id)
-        if not requirement:
-            logger.warning(f"Requirement not found: {requirement_id}")
-            raise HTTPException(status_code=404, detail=f"Requirement not found: {requirement_id}")
-
-        # Check organization membership in team mode
-        _check_requirement_access(request, requirement, db)
+        # Existence + organization membership (team mode) in one query
+        requirement = _get_accessible_requirement(request, db, requirement_id)
 
-        logger.debug(f"Successfully retrieved requirement {requirement_id}")
-        return requirement
+        logger.debug("Successfully retrieved requirement %s", requirement_id)
+        body = schemas.RequirementResponse.model_validate(requirement).model_dump_json().encode()
+        return _conditional_json(request, body)
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Error retrieving requirement {requirement_id}: {e}", exc_info=True)
+        logger.error("Error retrieving requirement %s: %s", requirement_id, e, exc_info=True)
         raise
 
 
@@ -319,17 +578,16 @@ def get_requirement_children(
     - Readable: RAAS-EPIC-001 (case-insensitive)
 
     Use GET /requirements/{child_id} to fetch full details for specific children.
+    Responses carry an ETag for conditional requests (If-None-Match).
 
     - **requirement_id**: UUID or human-readable ID of the parent requirement
     """
-    requirement = crud.get_requirement_by_any_id(db, requirement_id)
-    if not requirement:
-        raise HTTPException(status_code=404, detail=f"Requirement not found: {requirement_id}")
-
-    # Check organization membership in team mode
-    _check_requirement_access(request, requirement, db)
+    # Existence + organization membership (team mode) in one query
+    requirement = _get_accessible_requirement(request, db, requirement_id)
 
-    return crud.get_requirement_children(db, requirement.id)
+    children = crud.get_requirement_children(db, requirement.id)
+    body = _children_adapter.dump_json(_children_adapter.validate_python(children))
+    return _conditional_json(request, body)
 
 
 @router.get("/{requirement_id}/history", response_model=list[schemas.RequirementHistoryResponse])
@@ -345,18 +603,17 @@ def get_requirement_history(
     In team mode, requires membership in the requirement's organization.
 
     Supports both UUID and human-readable ID formats.
+    Responses carry an ETag for conditional requests (If-None-Match).
 
     - **requirement_id**: UUID or human-readable ID of the requirement
     - **limit**: Maximum number of history entries to return (1-100)
     """
-    requirement = crud.get_requirement_by_any_id(db, requirement_id)
-    if not requirement:
-        raise HTTPException(status_code=404, detail=f"Requirement not found: {requirement_id}")
-
-    # Check organization membership in team mode
-    _check_requirement_access(request, requirement, db)
+    # Existence + organization membership (team mode) in one query
+    requirement = _get_accessible_requirement(request, db, requirement_id)
 
-    return crud.get_requirement_history(db, requirement.id, limit)
+    history = crud.get_requirement_history(db, requirement.id, limit)
+    body = _history_adapter.dump_json(_history_adapter.validate_python(history))
+    return _conditional_json(request, body)
 
 
 @router.patch("/{requirement_id}", response_model=schemas.RequirementResponse)
@@ -390,70 +647,54 @@ def update_requirement(
     - **X-Persona**: Header declaring the workflow persona (developer, tester, etc.)
     """
     # Check requirement exists
-    existing = crud.get_requirement_by_any_id(db, requirement_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail=f"Requirement not found: {requirement_id}")
-
-    # Check organization membership in team mode
-    _check_requirement_access(request, existing, db)
+    # Existence + organization membership (team mode) in one query
+    existing = _get_accessible_requirement(request, db, requirement_id)
 
     # Get current user (for permission checking in team mode, None in solo mode)
     current_user = get_current_user_optional(request)
     user_id = current_user.id if current_user else None
 
     # Look up agent for actor_id (BUG-002 fix: director/actor audit trail)
-    actor_id = None
-    if x_agent_email:
-        agent_user = crud.get_agent_by_email(db, x_agent_email)
-        if agent_user:
-            actor_id = agent_user.id
-            logger.debug(f"Agent {x_agent_email} resolved to actor_id {actor_id}")
-        else:
-            logger.warning(f"Agent email {x_agent_email} not found in database")
+    actor_id = _resolve_actor_id(db, x_agent_email)
 
     # Parse persona from header
-    persona = None
-    if x_persona:
-        try:
-            persona = Persona(x_persona.lower())
-        except ValueError:
-            valid_personas = [p.value for p in Persona]
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid persona: {x_persona}. Valid personas: {', '.join(valid_personas)}"
-            )
+    persona = _PERSONA_BY_NAME.get(x_persona.lower()) if x_persona else None
+    if x_persona and persona is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid persona: {x_persona}. Valid personas: {_VALID_PERSONA_NAMES}"
+        )
 
     try:
         requirement = crud.update_requirement(
             db, existing.id, requirement_update, user_id=user_id, persona=persona,
-            director_id=user_id, actor_id=actor_id  # BUG-002: director/actor audit trail
+            director_id=user_id, actor_id=actor_id,  # BUG-002: director/actor audit trail
+            db_requirement=existing,
         )
 
         return requirement
+    except crud.InvalidStatusTransitionError as e:
+        logger.warning("Status transition rejected for requirement %s: %s", requirement_id, e)
+        raise HTTPException(
+            status_code=400,
+            detail={
+                "error": "invalid_status_transition",
+                "message": str(e)
+            }
+        )
+    except crud.TransitionPersonaError as e:
+        logger.warning("Persona not authorized for requirement %s: %s", requirement_id, e)
+        raise HTTPException(
+            status_code=403,
+            detail={
+                "error": "persona_authorization_failed",
+                "message": str(e)
+            }
+        )
     except ValueError as e:
-        # Catch validation errors (state machine, content length, persona auth, etc.)
-        error_message = str(e)
-        logger.warning(f"Validation failed for requirement {requirement_id}: {error_message}")
-
-        # Determine if this is a state transition error, persona error, or other
-        if "Invalid status transition" in error_message:
-            raise HTTPException(
-                status_code=400,
-                detail={
-                    "error": "invalid_status_transition",
-                    "message": error_message
-                }
-            )
-        elif "not authorized for transition" in error_message or "Persona declaration required" in error_message:
-            raise HTTPException(
-                status_code=403,
-                detail={
-                    "error": "persona_authorization_failed",
-                    "message": error_message
-                }
-            )
-        else:
-            raise HTTPException(status_code=400, detail=error_message)
+        # Other validation errors (content length, hierarchy, reserved tags, etc.)
+        logger.warning("Validation failed for requirement %s: %s", requirement_id, e)
+        raise HTTPException(status_code=400, detail=str(e))
 
 
 @router.delete("/{requirement_id}", status_code=204)
@@ -474,25 +715,21 @@ def delete_requirement(
     - **requirement_id**: UUID or human-readable ID of the requirement
     """
     # Check requirement exists
-    existing = crud.get_requirement_by_any_id(db, requirement_id)
-    if not existing:
-        raise HTTPException(status_code=404, detail=f"Requirement not found: {requirement_id}")
-
-    # Check organization membership in team mode
-    _check_requirement_access(request, existing, db)
+    # Existence + organization membership (team mode) in one query
+    existing = _get_accessible_requirement(request, db, requirement_id)
 
     # Get current user (for permission checking in team mode, None in solo mode)
     current_user = get_current_user_optional(request)
     user_id = current_user.id if current_user else None
 
     try:
-        success = crud.delete_requirement(db, existing.id, user_id=user_id)
+        success = crud.delete_requirement(db, existing.id, user_id=user_id, db_requirement=existing)
         if not success:
             raise HTTPException(status_code=404, detail="Requirement not found")
     except ValueError as e:
         # Permission denied or dependency blocking deletion
         error_message = str(e)
-        logger.warning(f"Delete blocked for requirement {requirement_id}: {error_message}")
+        logger.warning("Delete blocked for requirement %s: %s", requirement_id, error_message)
 
         if "admin role" in error_message.lower() or "permission" in error_message.lower():
             raise HTTPException(status_code=403, detail=error_message)
@@ -504,6 +741,8 @@ def delete_requirement(
 @router.get("/audit/hierarchy-violations")
 def get_hierarchy_violations(
     project_id: Optional[UUID] = Query(None, description="Filter by project ID"),
+    limit: int = Query(500, ge=1, le=5000, description="Maximum violations per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor"),
     db: Session = Depends(get_db),
 ):
     """
@@ -525,13 +764,31 @@ def get_hierarchy_violations(
     - expected_parent_type: What type the parent should be
     - violation: Description of the violation
 
+    Results are paged in requirement ID order; pass next_cursor back as
+    cursor to continue. next_cursor is null once a page comes back with fewer
+    than limit violations. A page that ends exactly at the last violation
+    still carries a next_cursor, and the page it leads to is empty.
+
+    count is the number of violations on this page, not in the project.
+    Responses no longer carry total; walk every page to count them all.
+
     - **project_id**: Optional filter to only check requirements in a specific project
+    - **limit**: Maximum violations per page (1-5000)
+    - **cursor**: Opaque cursor from a previous response
     """
-    violations = find_hierarchy_violations(db, project_id)
+    after = None
+    if cursor:
+        try:
+            (after,) = decode_cursor(cursor, UUID)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+    violations = find_hierarchy_violations(db, project_id, after=after, limit=limit)
     return {
         "violations": violations,
-        "total": len(violations),
+        "count": len(violations),
         "project_id": str(project_id) if project_id else None,
+        "next_cursor": encode_cursor(violations[-1]["requirement_id"]) if len(violations) == limit else None,
     }
 
 
@@ -561,7 +818,6 @@ def list_acceptance_criteria(
         raise HTTPException(status_code=404, detail="Requirement not found")
 
     # Resolve version
-    from tarka_core.versioning import resolve_version
     version = resolve_version(db, requirement, version_number)
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
@@ -620,13 +876,12 @@ def get_acceptance_criteria_summary(
         raise HTTPException(status_code=404, detail="Requirement not found")
 
     # Resolve version
-    from tarka_core.versioning import resolve_version, get_acceptance_criteria_summary as get_summary
     version = resolve_version(db, requirement, version_number)
     if not version:
         raise HTTPException(status_code=404, detail="Version not found")
 
     # Get summary
-    summary = get_summary(version)
+    summary = get_acceptance_criteria_summary(version)
     return schemas.AcceptanceCriteriaSummary(**summary)
 
 
@@ -650,8 +905,6 @@ def update_acceptance_criteria(
     current_user = get_current_user_optional(request)
     user_id = current_user.id if current_user else None
 
-    from tarka_core.versioning import update_acceptance_criteria_met_status
-
     # For solo mode without auth, we still need a user_id for audit
     if not user_id:
         # Use a placeholder - in production this would require auth
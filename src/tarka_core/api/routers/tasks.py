@@ -1,14 +1,16 @@
 """Task Queue API endpoints (RAAS-EPIC-027, RAAS-COMP-065)."""
 import logging
-from datetime import datetime, timezone
+import operator
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
-from math import ceil
 
-from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from pydantic import TypeAdapter
 from sqlalchemy.orm import Session
 from tarka_core import crud, schemas, models
-from tarka_core.api.dependencies import get_current_user_optional
+from tarka_core.api.dependencies import get_current_user_optional, get_request_organization_ids
+from tarka_core.pagination import decode_cursor, encode_cursor
 
 from ..database import get_db
 
@@ -17,46 +19,55 @@ logger = logging.getLogger("raas-core.tasks")
 router = APIRouter(tags=["tasks"])
 
 
+def _optional_datetime(value) -> Optional[datetime]:
+    """Cursor converter for the nullable due_date sort key."""
+    return None if value is None else datetime.fromisoformat(value)
+
+
+def _task_cursor(task: models.Task) -> str:
+    """Build the keyset cursor for continuing after a task."""
+    return encode_cursor(*crud.task_sort_key(task))
+
+
+# TaskResponse fields copied verbatim from the Task row; fetched in one
+# attrgetter call rather than one instrumented attribute access per keyword.
+_TASK_RESPONSE_FIELDS = (
+    "id", "human_readable_id", "organization_id", "project_id",
+    "title", "description", "task_type", "status", "priority", "due_date",
+    "source_type", "source_id", "source_context",
+    # Clarification task fields (CR-003)
+    "context", "artifact_type", "artifact_id",
+    "resolution_content", "resolved_at", "resolved_by",
+    "created_by", "created_at", "updated_at", "completed_at", "completed_by",
+)
+_task_response_values = operator.attrgetter(*_TASK_RESPONSE_FIELDS)
+
+
 def _task_to_response(task: models.Task) -> schemas.TaskResponse:
     """Convert Task model to TaskResponse schema."""
-    return schemas.TaskResponse(
-        id=task.id,
-        human_readable_id=task.human_readable_id,
-        organization_id=task.organization_id,
-        project_id=task.project_id,
-        title=task.title,
-        description=task.description,
-        task_type=task.task_type,
-        status=task.status,
-        priority=task.priority,
-        due_date=task.due_date,
-        source_type=task.source_type,
-        source_id=task.source_id,
-        source_context=task.source_context,
-        # Clarification task fields (CR-003)
-        context=task.context,
-        artifact_type=task.artifact_type,
-        artifact_id=task.artifact_id,
-        resolution_content=task.resolution_content,
-        resolved_at=task.resolved_at,
-        resolved_by=task.resolved_by,
+    return schemas.TaskResponse.model_construct(
+        **dict(zip(_TASK_RESPONSE_FIELDS, _task_response_values(task))),
         assignee_count=len(task.assignees) if task.assignees else 0,
-        created_by=task.created_by,
-        created_at=task.created_at,
-        updated_at=task.updated_at,
-        completed_at=task.completed_at,
-        completed_by=task.completed_by,
     )
 
 
-def _task_to_list_item(task: models.Task) -> schemas.TaskListItem:
-    """Convert Task model to TaskListItem schema."""
+_CLOSED_TASK_STATUSES = frozenset({models.TaskStatus.COMPLETED, models.TaskStatus.CANCELLED})
+
+
+def _task_to_list_item(task: models.Task, now: datetime, assignee_count: int) -> schemas.TaskListItem:
+    """Convert Task model to TaskListItem schema.
+
+    Args:
+        task: Task to convert
+        now: Current naive UTC time (as stored in due_date), taken once per response
+        assignee_count: Number of assignees (see _task_list_items)
+    """
     is_overdue = (
         task.due_date is not None
-        and task.due_date < datetime.now(timezone.utc)
-        and task.status not in [models.TaskStatus.COMPLETED, models.TaskStatus.CANCELLED]
+        and task.due_date < now
+        and task.status not in _CLOSED_TASK_STATUSES
     )
-    return schemas.TaskListItem(
+    return schemas.TaskListItem.model_construct(
         id=task.id,
         human_readable_id=task.human_readable_id,
         organization_id=task.organization_id,
@@ -71,13 +82,20 @@ def _task_to_list_item(task: models.Task) -> schemas.TaskListItem:
         # Clarification task fields (CR-003)
         artifact_type=task.artifact_type,
         artifact_id=task.artifact_id,
-        assignee_count=len(task.assignees) if task.assignees else 0,
+        assignee_count=assignee_count,
         is_overdue=is_overdue,
         created_at=task.created_at,
         updated_at=task.updated_at,
     )
 
 
+def _task_list_items(db: Session, tasks: list[models.Task]) -> list[schemas.TaskListItem]:
+    """Convert a page of tasks, counting assignees in one query."""
+    now = datetime.utcnow()
+    counts = crud.get_task_assignee_counts(db, [t.id for t in tasks])
+    return [_task_to_list_item(t, now, counts.get(t.id, 0)) for t in tasks]
+
+
 @router.post("/", response_model=schemas.TaskResponse, status_code=201)
 def create_task(
     task_data: schemas.TaskCreate,
@@ -105,18 +123,16 @@ def create_task(
     current_user = get_current_user_optional(request)
     user_id = current_user.id if current_user else None
 
-    # Verify organization exists
-    org = crud.get_organization(db, task_data.organization_id)
-    if not org:
+    # Verify organization (and project, if provided) in one query
+    org_exists, project_exists, project_matches_org = crud.validate_org_and_project(
+        db, task_data.organization_id, task_data.project_id
+    )
+    if not org_exists:
         raise HTTPException(status_code=404, detail=f"Organization not found: {task_data.organization_id}")
-
-    # Verify project exists if provided
-    if task_data.project_id:
-        project = crud.get_project(db, task_data.project_id)
-        if not project:
-            raise HTTPException(status_code=404, detail=f"Project not found: {task_data.project_id}")
-        if project.organization_id != task_data.organization_id:
-            raise HTTPException(status_code=400, detail="Project does not belong to the specified organization")
+    if not project_exists:
+        raise HTTPException(status_code=404, detail=f"Project not found: {task_data.project_id}")
+    if not project_matches_org:
+        raise HTTPException(status_code=400, detail="Project does not belong to the specified organization")
 
     try:
         task = crud.create_task(db, task_data, user_id)
@@ -127,11 +143,26 @@ def create_task(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+_task_list_adapter = TypeAdapter(list[schemas.TaskListItem])
+
+
+def _list_response(**fields) -> Response:
+    """Serialize a task list page straight to JSON bytes.
+
+    The route keeps response_model for the OpenAPI schema, but returning a
+    Response lets pydantic-core write the JSON in one pass instead of
+    FastAPI validating the page again before encoding it.
+    """
+    payload = schemas.TaskListResponse(**fields)
+    return Response(content=payload.model_dump_json(), media_type="application/json")
+
+
 @router.get("/", response_model=schemas.TaskListResponse)
 def list_tasks(
     request: Request,
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(50, ge=1, le=100, description="Items per page"),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor"),
     organization_id: Optional[UUID] = Query(None, description="Filter by organization"),
     project_id: Optional[UUID] = Query(None, description="Filter by project"),
     assignee_id: Optional[UUID] = Query(None, description="Filter by assignee"),
@@ -149,8 +180,14 @@ def list_tasks(
     By default, completed and cancelled tasks are excluded. Use include_completed=true to include them.
     Tasks are ordered by priority (critical first), then due_date (earliest first), then created_at.
 
+    Pages can be fetched by number (page) or by cursor: every response whose
+    results continue carries next_cursor, and passing it back as cursor
+    returns the following page without OFFSET (page and total are then
+    omitted).
+
     - **page**: Page number (starts at 1)
     - **page_size**: Number of items per page (1-100)
+    - **cursor**: Opaque cursor from a previous response
     - **organization_id**: Filter by organization
     - **project_id**: Filter by project
     - **assignee_id**: Filter by assignee (tasks assigned to this user)
@@ -165,9 +202,9 @@ def list_tasks(
 
     # If authenticated, filter by user's organizations
     if current_user and not organization_id:
-        org_ids = crud.get_user_organization_ids(db, current_user.id)
+        org_ids = get_request_organization_ids(request, db, current_user.id)
         if not org_ids:
-            return schemas.TaskListResponse(
+            return _list_response(
                 items=[],
                 total=0,
                 page=page,
@@ -177,11 +214,7 @@ def list_tasks(
         # For now, require explicit organization_id filter in team mode
         # Future: could aggregate across all user's orgs
 
-    skip = (page - 1) * page_size
-    tasks, total = crud.get_tasks(
-        db=db,
-        skip=skip,
-        limit=page_size,
+    filters = dict(
         organization_id=organization_id,
         project_id=project_id,
         assignee_id=assignee_id,
@@ -193,12 +226,34 @@ def list_tasks(
         include_completed=include_completed,
     )
 
-    return schemas.TaskListResponse(
-        items=[_task_to_list_item(t) for t in tasks],
+    if cursor:
+        try:
+            after = decode_cursor(cursor, int, _optional_datetime, datetime.fromisoformat, UUID)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+
+        # Fetch one extra row to learn whether another page exists
+        tasks, _ = crud.get_tasks(db=db, limit=page_size + 1, cursor=after, **filters)
+        has_more = len(tasks) > page_size
+        tasks = tasks[:page_size]
+
+        return _list_response(
+            items=_task_list_items(db, tasks),
+            page_size=page_size,
+            next_cursor=_task_cursor(tasks[-1]) if has_more else None,
+        )
+
+    skip = (page - 1) * page_size
+    tasks, total = crud.get_tasks(db=db, skip=skip, limit=page_size, **filters)
+    has_more = skip + len(tasks) < total
+
+    return _list_response(
+        items=_task_list_items(db, tasks),
         total=total,
         page=page,
         page_size=page_size,
-        total_pages=ceil(total / page_size) if total > 0 else 0,
+        total_pages=(total + page_size - 1) // page_size,
+        next_cursor=_task_cursor(tasks[-1]) if has_more and tasks else None,
     )
 
 
@@ -226,7 +281,7 @@ def get_my_tasks(
         )
 
     # Get user's organization IDs for filtering
-    org_ids = crud.get_user_organization_ids(db, current_user.id)
+    org_ids = get_request_organization_ids(request, db, current_user.id)
 
     tasks = crud.get_my_tasks(
         db=db,
@@ -235,7 +290,10 @@ def get_my_tasks(
         include_completed=include_completed,
     )
 
-    return [_task_to_list_item(t) for t in tasks]
+    return Response(
+        content=_task_list_adapter.dump_json(_task_list_items(db, tasks)),
+        media_type="application/json",
+    )
 
 
 @router.get("/{task_id}", response_model=schemas.TaskResponse)
@@ -341,7 +399,7 @@ def complete_task(
     if not task:
         raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
 
-    if task.status in [models.TaskStatus.COMPLETED, models.TaskStatus.CANCELLED]:
+    if task.status in _CLOSED_TASK_STATUSES:
         raise HTTPException(
             status_code=400,
             detail=f"Task is already {task.status.value}"
@@ -429,15 +487,21 @@ def get_task_assignees(
     if not task:
         raise HTTPException(status_code=404, detail=f"Task not found: {task_id}")
 
-    # Build assignee response list
-    assignees = []
-    for user in task.assignees:
-        assignees.append(schemas.TaskAssigneeResponse(
+    # Only the assignees' identity columns are needed; select them directly
+    users = (
+        db.query(models.User.id, models.User.email, models.User.full_name)
+        .join(models.task_assignees, models.task_assignees.c.user_id == models.User.id)
+        .filter(models.task_assignees.c.task_id == task.id)
+        .all()
+    )
+
+    return [
+        schemas.TaskAssigneeResponse.model_construct(
             user_id=user.id,
             email=user.email,
             full_name=user.full_name,
             is_primary=True,  # TODO: Track primary assignee in junction table
             assigned_at=task.created_at,  # TODO: Track actual assignment time
-        ))
-
-    return assignees
+        )
+        for user in users
+    ]
@@ -2,7 +2,6 @@
 import logging
 from typing import Optional
 from uuid import UUID
-from math import ceil
 
 from fastapi import APIRouter, Depends, HTTPException, Query, Request
 from sqlalchemy.orm import Session
@@ -40,7 +39,7 @@ def list_users(
         requesting_user_id=current_user.id if current_user else None,
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 0
+    total_pages = (total + page_size - 1) // page_size
 
     logger.debug(f"Listed {total} users (page {page}/{total_pages})")
 
@@ -83,7 +82,7 @@ def search_users(
         requesting_user_id=current_user.id if current_user else None,
     )
 
-    total_pages = ceil(total / page_size) if total > 0 else 0
+    total_pages = (total + page_size - 1) // page_size
 
     logger.debug(f"User search: found {total} users (page {page}/{total_pages})")
 
@@ -5,14 +5,18 @@ Types: IR (Implementation Request), CR (Change Request), BUG, TASK
 
 Lifecycle: created -> in_progress -> implemented -> validated -> deployed -> completed
 """
+import difflib
 import logging
+import operator
 from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, HTTPException, Query, status
-from sqlalchemy import select, func, or_
-from sqlalchemy.orm import Session, joinedload
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response, status
+from pydantic import TypeAdapter
+from sqlalchemy import String, cast, select, func, or_, tuple_
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.orm import Session, defer, joinedload, lazyload, raiseload, selectinload
 
 from ...models import (
     WorkItem,
@@ -56,6 +60,8 @@ from ...versioning import (
     update_deployed_version_pointer,
     resolve_version,
 )
+from ...etag import etag_for_bytes, etag_for_version, etag_matches
+from ...pagination import decode_cursor, encode_cursor, paginate_with_total
 from ..database import get_db
 from ..dependencies import get_current_user_optional
 
@@ -63,61 +69,151 @@ logger = logging.getLogger("raas-core.work_items")
 
 router = APIRouter(prefix="/work-items", tags=["work-items"])
 
+# Work item types that can be bundled into a release (RAAS-FEAT-102)
+_RELEASABLE_TYPES = frozenset({WorkItemType.CR, WorkItemType.BUG, WorkItemType.DEBT})
+# Statuses at which a release (or included item) has shipped
+_SHIPPED_STATUSES = frozenset({WorkItemStatus.DEPLOYED, WorkItemStatus.COMPLETED})
 
-def resolve_requirement_id(db: Session, identifier: str) -> Optional[UUID]:
-    """Resolve a requirement UUID or human-readable ID to UUID."""
-    # Try as UUID first
+# Responses built only from immutable version data (see diff_requirement_versions)
+IMMUTABLE_CACHE_CONTROL = "private, max-age=86400"
+# Other GET responses: clients may keep them but must revalidate (ETag)
+PRIVATE_CACHE_CONTROL = "private, no-cache"
+
+_history_adapter = TypeAdapter(list[WorkItemHistoryResponse])
+
+
+def _conditional_json(request: Request, body: bytes) -> Response:
+    """Return a JSON body with an ETag, or 304 if the client already has it.
+
+    Work item responses include related rows (assignee, affected
+    requirements, releases) that change without bumping updated_at, so the
+    tag is derived from the body itself.
+    """
+    etag = etag_for_bytes(body)
+    headers = {"ETag": etag, "Cache-Control": PRIVATE_CACHE_CONTROL, "Vary": "Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _parse_uuid(identifier: str) -> Optional[UUID]:
+    """Return identifier as a UUID, or None if it is not one."""
     try:
-        req_uuid = UUID(identifier)
-        req = db.query(Requirement).filter(Requirement.id == req_uuid).first()
-        if req:
-            return req.id
+        return UUID(identifier)
     except ValueError:
-        pass
+        return None
+
+
+def resolve_requirement_id(db: Session, identifier: str) -> Optional[UUID]:
+    """Resolve a requirement UUID or human-readable ID to UUID.
+
+    A UUID string can never be a human-readable ID, so exactly one lookup
+    runs. Stored HRIDs are uppercase, so the HRID comparison uses the
+    unique index (case-insensitive for callers).
+    """
+    req_uuid = _parse_uuid(identifier)
+    if req_uuid is not None:
+        req = db.get(Requirement, req_uuid)
+        return req.id if req else None
+
+    return db.query(Requirement.id).filter(
+        Requirement.human_readable_id == identifier.upper()
+    ).scalar()
 
-    # Try as human-readable ID
-    req = db.query(Requirement).filter(
-        func.lower(Requirement.human_readable_id) == identifier.lower()
+
+def resolve_requirement(db: Session, identifier: str) -> Optional[Requirement]:
+    """Resolve a requirement UUID or human-readable ID to the Requirement.
+
+    Use instead of resolve_requirement_id when the row itself is needed, so
+    it is not looked up a second time by id.
+    """
+    req_uuid = _parse_uuid(identifier)
+    if req_uuid is not None:
+        return db.get(Requirement, req_uuid)
+
+    return db.query(Requirement).filter(
+        Requirement.human_readable_id == identifier.upper()
     ).first()
-    if req:
-        return req.id
 
-    return None
 
+def resolve_work_item_id(db: Session, identifier: str, *, options=()) -> Optional[WorkItem]:
+    """Resolve a Work Item UUID or human-readable ID to WorkItem.
 
-def resolve_work_item_id(db: Session, identifier: str) -> Optional[WorkItem]:
-    """Resolve a Work Item UUID or human-readable ID to WorkItem."""
-    # Try as UUID first
-    try:
-        wi_uuid = UUID(identifier)
-        wi = db.query(WorkItem).filter(WorkItem.id == wi_uuid).first()
-        if wi:
-            return wi
-    except ValueError:
-        pass
+    Like resolve_requirement_id, issues exactly one lookup. Loader options
+    (e.g. _work_item_response_loaders()) are applied to that lookup.
+    """
+    wi_uuid = _parse_uuid(identifier)
+    if wi_uuid is not None:
+        return db.get(WorkItem, wi_uuid, options=options)
 
-    # Try as human-readable ID
-    wi = db.query(WorkItem).filter(
-        func.lower(WorkItem.human_readable_id) == identifier.lower()
+    return db.query(WorkItem).options(*options).filter(
+        WorkItem.human_readable_id == identifier.upper()
     ).first()
-    return wi
+
+
+def _work_item_response_loaders() -> tuple:
+    """Loader options for the relationships work_item_to_response reads.
+
+    Included work items are left lazy: only releases have them. Any other
+    relationship raises on access, so a converter change that reads a
+    relationship not loaded here fails loudly instead of adding a query.
+    """
+    return (
+        joinedload(WorkItem.assignee),
+        joinedload(WorkItem.created_by_user),
+        selectinload(WorkItem.affected_requirements),
+        selectinload(WorkItem.target_versions).joinedload(RequirementVersion.requirement),
+        lazyload(WorkItem.included_work_items),
+        raiseload("*"),
+    )
+
+
+def _reload_for_response(db: Session, work_item: WorkItem) -> WorkItem:
+    """Reload a committed (expired) Work Item with its response relationships."""
+    return db.get(
+        WorkItem, work_item.id,
+        options=_work_item_response_loaders(), populate_existing=True,
+    )
+
+
+def _count_affected_requirements(db: Session, work_item_ids: list[UUID]) -> dict[UUID, int]:
+    """Count affected requirements for a page of Work Items in one grouped query."""
+    if not work_item_ids:
+        return {}
+    rows = db.query(
+        work_item_affects.c.work_item_id, func.count()
+    ).filter(
+        work_item_affects.c.work_item_id.in_(work_item_ids)
+    ).group_by(work_item_affects.c.work_item_id).all()
+    return dict(rows)
 
 
 def add_bidirectional_tags(db: Session, work_item: WorkItem, requirements: list[Requirement]):
-    """Add bidirectional tags between Work Item and requirements (RAAS-FEAT-098)."""
+    """Add bidirectional tags between Work Item and requirements (RAAS-FEAT-098).
+
+    Tag lists are only reassigned when a tag is actually added, so unchanged
+    rows are not marked dirty and rewritten.
+    """
     wi_hrid = work_item.human_readable_id
 
     # Add requirement HRIDs to Work Item tags
-    req_hrids = [r.human_readable_id for r in requirements if r.human_readable_id]
-    current_tags = set(work_item.tags or [])
-    work_item.tags = list(current_tags.union(set(req_hrids)))
+    current_tags = work_item.tags or []
+    seen = set(current_tags)
+    new_tags = []
+    for r in requirements:
+        hrid = r.human_readable_id
+        if hrid and hrid not in seen:
+            seen.add(hrid)
+            new_tags.append(hrid)
+    if new_tags:
+        work_item.tags = current_tags + new_tags
 
     # Add Work Item HRID to each requirement's tags
-    for req in requirements:
-        if wi_hrid:
-            req_tags = set(req.tags or [])
+    if wi_hrid:
+        for req in requirements:
+            req_tags = req.tags or []
             if wi_hrid not in req_tags:
-                req.tags = list(req_tags.union({wi_hrid}))
+                req.tags = req_tags + [wi_hrid]
 
 
 def remove_bidirectional_tags(db: Session, work_item: WorkItem, requirements: list[Requirement]):
@@ -125,12 +221,11 @@ def remove_bidirectional_tags(db: Session, work_item: WorkItem, requirements: li
     wi_hrid = work_item.human_readable_id
 
     # Remove Work Item HRID from each requirement's tags
-    for req in requirements:
-        if wi_hrid:
-            req_tags = set(req.tags or [])
+    if wi_hrid:
+        for req in requirements:
+            req_tags = req.tags or []
             if wi_hrid in req_tags:
-                req_tags.discard(wi_hrid)
-                req.tags = list(req_tags)
+                req.tags = [t for t in req_tags if t != wi_hrid]
 
 
 def create_work_item_history(
@@ -156,6 +251,47 @@ def create_work_item_history(
     db.add(history)
 
 
+def _load_requirements(db: Session, identifiers, with_content: bool = False) -> dict[str, Requirement]:
+    """Load the requirements named by a list of identifiers in one query.
+
+    Identifiers may be UUIDs or human-readable IDs (any case). Versions are
+    loaded with the requirements, since callers read the resolved version
+    (and a CR merge the highest version number). Version markdown is
+    deferred unless with_content is set.
+
+    Returns:
+        Map of each identifier that resolved to its Requirement
+    """
+    uuids = {}
+    hrids = {}
+    for identifier in identifiers:
+        req_uuid = _parse_uuid(identifier)
+        if req_uuid is not None:
+            uuids[identifier] = req_uuid
+        else:
+            hrids[identifier] = identifier.upper()
+
+    if not uuids and not hrids:
+        return {}
+
+    query = db.query(Requirement).filter(
+        or_(
+            Requirement.id.in_(set(uuids.values())),
+            Requirement.human_readable_id.in_(set(hrids.values())),
+        )
+    )
+    versions = selectinload(Requirement.versions)
+    requirements = query.options(
+        versions if with_content else versions.defer(RequirementVersion.content),
+    ).all()
+
+    by_id = {req.id: req for req in requirements}
+    by_hrid = {req.human_readable_id: req for req in requirements if req.human_readable_id}
+    resolved = {key: by_id[value] for key, value in uuids.items() if value in by_id}
+    resolved.update({key: by_hrid[value] for key, value in hrids.items() if value in by_hrid})
+    return resolved
+
+
 def execute_cr_merge(db: Session, work_item: WorkItem, user_id: Optional[UUID]) -> list[RequirementVersion]:
     """
     Execute CR merge: apply proposed content to requirements (RAAS-FEAT-099).
@@ -179,18 +315,14 @@ def execute_cr_merge(db: Session, work_item: WorkItem, user_id: Optional[UUID])
         logger.info(f"CR {work_item.human_readable_id} has no proposed content to merge")
         return []
 
+    requirements_by_key = _load_requirements(db, proposed_content.keys())
+
     created_versions = []
+    next_version_by_req = {}
 
     for req_id_str, new_content in proposed_content.items():
         # Resolve requirement
-        req_id = resolve_requirement_id(db, req_id_str)
-        if not req_id:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail=f"Requirement {req_id_str} not found for CR merge"
-            )
-
-        req = db.query(Requirement).filter(Requirement.id == req_id).first()
+        req = requirements_by_key.get(req_id_str)
         if not req:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
@@ -208,11 +340,12 @@ def execute_cr_merge(db: Session, work_item: WorkItem, user_id: Optional[UUID])
                        f"Content changed since CR creation. Update CR or create new CR."
             )
 
-        # Determine next version number
-        max_version = db.query(func.max(RequirementVersion.version_number)).filter(
-            RequirementVersion.requirement_id == req.id
-        ).scalar() or 0
-        next_version = max_version + 1
+        # Determine next version number (versions were loaded with the requirement;
+        # a requirement listed under both its UUID and HRID gets successive numbers)
+        next_version = next_version_by_req.get(req.id) or (
+            max((v.version_number for v in req.versions), default=0) + 1
+        )
+        next_version_by_req[req.id] = next_version + 1
 
         # Create new version with approved status (CR-006: status on versions)
         new_hash = compute_content_hash(new_content)
@@ -228,8 +361,6 @@ def execute_cr_merge(db: Session, work_item: WorkItem, user_id: Optional[UUID])
             change_reason=f"Applied from CR {work_item.human_readable_id}",
             created_by_user_id=user_id,
         )
-        db.add(version)
-        db.flush()  # Get the version ID
 
         # CR-009: Content now lives on RequirementVersion, no need to update Requirement
         # The new version is automatically resolved via Requirement.resolve_version()
@@ -237,13 +368,29 @@ def execute_cr_merge(db: Session, work_item: WorkItem, user_id: Optional[UUID])
         created_versions.append(version)
         logger.info(f"Created version {next_version} for requirement {req.human_readable_id} from CR {work_item.human_readable_id}")
 
+    # All conflicts are checked before anything is written; insert in one flush
+    db.add_all(created_versions)
+    db.flush()  # Get the version IDs
+
     # Remove CR tags from affected requirements
     remove_bidirectional_tags(db, work_item, work_item.affected_requirements)
 
     return created_versions
 
 
-def work_item_to_response(work_item: WorkItem, db: Session) -> WorkItemResponse:
+# WorkItemResponse fields copied verbatim from the WorkItem row; fetched in one
+# attrgetter call rather than one instrumented attribute access per keyword.
+_WORK_ITEM_RESPONSE_FIELDS = (
+    "id", "human_readable_id", "organization_id", "project_id",
+    "work_item_type", "title", "description", "status", "priority", "assigned_to",
+    "proposed_content", "baseline_hashes", "implementation_refs",
+    "release_tag", "github_release_url",
+    "created_at", "updated_at", "completed_at", "cancelled_at",
+)
+_work_item_response_values = operator.attrgetter(*_WORK_ITEM_RESPONSE_FIELDS)
+
+
+def work_item_to_response(work_item: WorkItem) -> WorkItemResponse:
     """Convert WorkItem model to response schema."""
     assignee_email = None
     assignee_name = None
@@ -260,7 +407,7 @@ def work_item_to_response(work_item: WorkItem, db: Session) -> WorkItemResponse:
     # RAAS-FEAT-099: Build target versions summary
     target_version_summaries = []
     for tv in work_item.target_versions:
-        target_version_summaries.append(TargetVersionSummary(
+        target_version_summaries.append(TargetVersionSummary.model_construct(
             id=tv.id,
             requirement_id=tv.requirement_id,
             requirement_human_readable_id=tv.requirement.human_readable_id if tv.requirement else None,
@@ -273,46 +420,32 @@ def work_item_to_response(work_item: WorkItem, db: Session) -> WorkItemResponse:
     if work_item.work_item_type == WorkItemType.RELEASE:
         included_ids = [wi.id for wi in work_item.included_work_items]
 
-    return WorkItemResponse(
-        id=work_item.id,
-        human_readable_id=work_item.human_readable_id,
-        organization_id=work_item.organization_id,
-        project_id=work_item.project_id,
-        work_item_type=work_item.work_item_type,
-        title=work_item.title,
-        description=work_item.description,
-        status=work_item.status,
-        priority=work_item.priority,
-        assigned_to=work_item.assigned_to,
+    return WorkItemResponse.model_construct(
+        **dict(zip(_WORK_ITEM_RESPONSE_FIELDS, _work_item_response_values(work_item))),
         assignee_email=assignee_email,
         assignee_name=assignee_name,
         tags=work_item.tags or [],
         affects_count=len(affected_ids),
         affected_requirement_ids=affected_ids,
         target_versions=target_version_summaries,
-        proposed_content=work_item.proposed_content,
-        baseline_hashes=work_item.baseline_hashes,
-        implementation_refs=work_item.implementation_refs,
-        release_tag=work_item.release_tag,
-        github_release_url=work_item.github_release_url,
         included_work_item_ids=included_ids,
         includes_count=len(included_ids),
-        created_at=work_item.created_at,
-        updated_at=work_item.updated_at,
         created_by=work_item.created_by_user_id,
         created_by_email=created_by_email,
-        completed_at=work_item.completed_at,
-        cancelled_at=work_item.cancelled_at,
     )
 
 
-def work_item_to_list_item(work_item: WorkItem) -> WorkItemListItem:
-    """Convert WorkItem model to list item schema."""
+def work_item_to_list_item(work_item: WorkItem, affects_count: Optional[int] = None) -> WorkItemListItem:
+    """Convert WorkItem model to list item schema.
+
+    Pass affects_count when it was counted in SQL (see _count_affected_requirements)
+    so affected_requirements is not loaded just to be counted.
+    """
     assignee_email = None
     if work_item.assignee:
         assignee_email = work_item.assignee.email
 
-    return WorkItemListItem(
+    return WorkItemListItem.model_construct(
         id=work_item.id,
         human_readable_id=work_item.human_readable_id,
         organization_id=work_item.organization_id,
@@ -324,7 +457,10 @@ def work_item_to_list_item(work_item: WorkItem) -> WorkItemListItem:
         assigned_to=work_item.assigned_to,
         assignee_email=assignee_email,
         tags=work_item.tags or [],
-        affects_count=len(work_item.affected_requirements) if work_item.affected_requirements else 0,
+        affects_count=(
+            affects_count if affects_count is not None
+            else len(work_item.affected_requirements) if work_item.affected_requirements else 0
+        ),
         created_at=work_item.created_at,
         updated_at=work_item.updated_at,
     )
@@ -336,7 +472,7 @@ def work_item_to_list_item(work_item: WorkItem) -> WorkItemListItem:
 
 
 @router.post("/", response_model=WorkItemResponse, status_code=status.HTTP_201_CREATED)
-async def create_work_item(
+def create_work_item(
     data: WorkItemCreate,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -363,7 +499,6 @@ async def create_work_item(
         github_release_url=data.github_release_url if data.work_item_type == WorkItemType.RELEASE else None,
     )
     db.add(work_item)
-    db.flush()  # Get the ID and human_readable_id
 
     # For Releases: resolve and link included work items (RAAS-FEAT-102)
     if data.work_item_type == WorkItemType.RELEASE and data.includes:
@@ -376,7 +511,7 @@ async def create_work_item(
                     detail=f"Work Item not found for release inclusion: {wi_identifier}"
                 )
             # Only allow CR, BUG, DEBT to be included in releases (not RELEASE itself)
-            if included_wi.work_item_type not in [WorkItemType.CR, WorkItemType.BUG, WorkItemType.DEBT]:
+            if included_wi.work_item_type not in _RELEASABLE_TYPES:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Only CR, BUG, and DEBT work items can be included in releases. "
@@ -389,19 +524,18 @@ async def create_work_item(
     affected_reqs = []
     baseline_hashes = {}
 
+    requirements_by_key = _load_requirements(db, data.affects, with_content=True)
     for req_identifier in data.affects:
-        req_id = resolve_requirement_id(db, req_identifier)
-        if not req_id:
+        req = requirements_by_key.get(req_identifier)
+        if not req:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Requirement not found: {req_identifier}"
             )
-        req = db.query(Requirement).filter(Requirement.id == req_id).first()
-        if req:
-            affected_reqs.append(req)
-            # Store baseline hash for conflict detection
-            if req.content:
-                baseline_hashes[str(req.id)] = req.content_hash or compute_content_hash(req.content)
+        affected_reqs.append(req)
+        # Store baseline hash for conflict detection
+        if req.content:
+            baseline_hashes[str(req.id)] = req.content_hash or compute_content_hash(req.content)
 
     # Link affected requirements
     work_item.affected_requirements = affected_reqs
@@ -441,6 +575,10 @@ async def create_work_item(
 
     work_item.target_versions = target_versions
 
+    # One flush inserts the Work Item with its links and returns the trigger-assigned
+    # human_readable_id that the tags below need
+    db.flush()
+
     # Add bidirectional tags
     if affected_reqs:
         add_bidirectional_tags(db, work_item, affected_reqs)
@@ -452,14 +590,25 @@ async def create_work_item(
     )
 
     db.commit()
-    db.refresh(work_item)
+    work_item = _reload_for_response(db, work_item)
 
     logger.info(f"Created Work Item {work_item.human_readable_id}: {work_item.title}")
-    return work_item_to_response(work_item, db)
+    return work_item_to_response(work_item)
+
+
+def _work_item_cursor(work_item: WorkItem) -> str:
+    """Build the keyset cursor for continuing after a Work Item."""
+    return encode_cursor(work_item.created_at, work_item.id)
+
+
+def _work_item_list_items(db: Session, work_items: list[WorkItem]) -> list[WorkItemListItem]:
+    """Convert a page of Work Items, counting affected requirements in one query."""
+    affects_counts = _count_affected_requirements(db, [wi.id for wi in work_items])
+    return [work_item_to_list_item(wi, affects_counts.get(wi.id, 0)) for wi in work_items]
 
 
 @router.get("/", response_model=WorkItemListResponse)
-async def list_work_items(
+def list_work_items(
     organization_id: Optional[UUID] = None,
     project_id: Optional[UUID] = None,
     work_item_type: Optional[WorkItemType] = None,
@@ -468,16 +617,20 @@ async def list_work_items(
     search: Optional[str] = None,
     tags: Optional[str] = Query(None, description="Comma-separated tags"),
     include_completed: bool = Query(False, description="Include completed/cancelled items"),
-    page: int = Query(1, ge=1),
+    page: int = Query(1, ge=1, description="Page number (offset pagination; prefer cursor)", deprecated=True),
     page_size: int = Query(50, ge=1, le=100),
+    cursor: Optional[str] = Query(None, description="Cursor from a previous response's next_cursor"),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """List Work Items with filtering and pagination."""
-    query = db.query(WorkItem).options(
-        joinedload(WorkItem.assignee),
-        joinedload(WorkItem.affected_requirements),
-    )
+    """List Work Items with filtering and pagination.
+
+    Work Items are returned newest first. Every response carries next_cursor
+    when more results exist; passing it back as cursor continues with keyset
+    pagination, which stays fast at any depth and skips the total count
+    (page, total and total_pages are then omitted).
+    """
+    query = db.query(WorkItem)
 
     # Apply filters
     if organization_id:
@@ -507,53 +660,81 @@ async def list_work_items(
         )
         query = query.filter(search_filter)
 
-    # Filter by tags
+    # Filter by tags: one containment test (tags @> ARRAY[...]) for all of them
     if tags:
         tag_list = [t.strip() for t in tags.split(",")]
-        for tag in tag_list:
-            query = query.filter(WorkItem.tags.contains([tag]))
-
-    # Get total count
-    total = query.count()
+        # Cast to match the varchar[] column type (see TARKA-BUG-021)
+        query = query.filter(WorkItem.tags.op('@>')(cast(tag_list, ARRAY(String))))
+
+    # Newest first; id breaks ties so the order (and the cursor) is total.
+    # List items show the assignee (many-to-one, joined) and only count
+    # affected requirements (_count_affected_requirements), so no collection
+    # is loaded; any other relationship access raises rather than lazy-loading
+    # once per row.
+    query = query.order_by(WorkItem.created_at.desc(), WorkItem.id.desc()).options(
+        joinedload(WorkItem.assignee),
+        raiseload("*"),
+    )
 
-    # Order by priority and creation date
-    query = query.order_by(WorkItem.created_at.desc())
+    if cursor:
+        try:
+            after = decode_cursor(cursor, datetime.fromisoformat, UUID)
+        except ValueError as e:
+            raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(e))
+
+        # Fetch one extra row to learn whether another page exists
+        work_items = query.filter(
+            tuple_(WorkItem.created_at, WorkItem.id) < tuple_(*after)
+        ).limit(page_size + 1).all()
+        has_more = len(work_items) > page_size
+        work_items = work_items[:page_size]
+
+        return WorkItemListResponse(
+            items=_work_item_list_items(db, work_items),
+            page_size=page_size,
+            next_cursor=_work_item_cursor(work_items[-1]) if has_more else None,
+        )
 
-    # Paginate
+    # Paginate; the total comes back with the page
     offset = (page - 1) * page_size
-    work_items = query.offset(offset).limit(page_size).all()
+    work_items, total = paginate_with_total(query, offset, page_size)
+    has_more = offset + len(work_items) < total
 
     return WorkItemListResponse(
-        items=[work_item_to_list_item(wi) for wi in work_items],
+        items=_work_item_list_items(db, work_items),
         total=total,
         page=page,
         page_size=page_size,
         total_pages=(total + page_size - 1) // page_size,
+        next_cursor=_work_item_cursor(work_items[-1]) if has_more and work_items else None,
     )
 
 
 @router.get("/{work_item_id}", response_model=WorkItemResponse)
-async def get_work_item(
+def get_work_item(
     work_item_id: str,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """Get a Work Item by UUID or human-readable ID."""
-    work_item = resolve_work_item_id(db, work_item_id)
+    """Get a Work Item by UUID or human-readable ID.
+
+    Responses carry an ETag; send it back as If-None-Match to get 304 Not
+    Modified when the Work Item is unchanged.
+    """
+    work_item = resolve_work_item_id(db, work_item_id, options=_work_item_response_loaders())
     if not work_item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Work Item not found: {work_item_id}"
         )
 
-    # Eager load relationships
-    db.refresh(work_item, ["assignee", "created_by_user", "affected_requirements"])
-
-    return work_item_to_response(work_item, db)
+    body = work_item_to_response(work_item).model_dump_json().encode()
+    return _conditional_json(request, body)
 
 
 @router.patch("/{work_item_id}", response_model=WorkItemResponse)
-async def update_work_item(
+def update_work_item(
     work_item_id: str,
     data: WorkItemUpdate,
     db: Session = Depends(get_db),
@@ -650,7 +831,7 @@ async def update_work_item(
                         detail=f"Work Item not found for release inclusion: {wi_identifier}"
                     )
                 # Only allow CR, BUG, DEBT to be included in releases
-                if included_wi.work_item_type not in [WorkItemType.CR, WorkItemType.BUG, WorkItemType.DEBT]:
+                if included_wi.work_item_type not in _RELEASABLE_TYPES:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Only CR, BUG, and DEBT work items can be included in releases. "
@@ -671,8 +852,7 @@ async def update_work_item(
 
         # RAAS-FEAT-102: Deployment gate - CR/BUG/DEBT must be in a Release to deploy
         if data.status == WorkItemStatus.DEPLOYED:
-            if work_item.work_item_type in [WorkItemType.CR, WorkItemType.BUG, WorkItemType.DEBT]:
-                db.refresh(work_item, ["included_in_releases"])
+            if work_item.work_item_type in _RELEASABLE_TYPES:
                 if not work_item.included_in_releases:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
@@ -682,7 +862,7 @@ async def update_work_item(
                 # Check if any containing Release is already deployed or completed (BUG-006 fix)
                 deployed_release = None
                 for release in work_item.included_in_releases:
-                    if release.status in [WorkItemStatus.DEPLOYED, WorkItemStatus.COMPLETED]:
+                    if release.status in _SHIPPED_STATUSES:
                         deployed_release = release
                         break
                 if not deployed_release:
@@ -696,7 +876,6 @@ async def update_work_item(
 
         # RAAS-FEAT-102: Release deployment cascade
         if data.status == WorkItemStatus.DEPLOYED and work_item.work_item_type == WorkItemType.RELEASE:
-            db.refresh(work_item, ["included_work_items"])
             for included_wi in work_item.included_work_items:
                 if included_wi.status == WorkItemStatus.VALIDATED:
                     included_wi.status = WorkItemStatus.DEPLOYED
@@ -711,7 +890,6 @@ async def update_work_item(
                     )
                     # BUG-013 fix: Mark affected requirements as deployed
                     # TARKA-FEAT-106: Pass release_id for status tag tracking
-                    db.refresh(included_wi, ["affected_requirements"])
                     for req in included_wi.affected_requirements:
                         update_deployed_version_pointer(db, req, release_id=work_item.id)
                         logger.info(
@@ -727,7 +905,6 @@ async def update_work_item(
                 execute_cr_merge(db, work_item, current_user.id)
             # RAAS-FEAT-102: Release completion cascade
             if work_item.work_item_type == WorkItemType.RELEASE:
-                db.refresh(work_item, ["included_work_items"])
                 for included_wi in work_item.included_work_items:
                     if included_wi.status == WorkItemStatus.DEPLOYED:
                         included_wi.status = WorkItemStatus.COMPLETED
@@ -746,7 +923,6 @@ async def update_work_item(
                         # BUG-013 fix: Ensure affected requirements are marked as deployed
                         # (safety net in case DEPLOYED cascade was skipped or failed)
                         # TARKA-FEAT-106: Pass release_id for status tag tracking
-                        db.refresh(included_wi, ["affected_requirements"])
                         for req in included_wi.affected_requirements:
                             if not req.deployed_version_id:
                                 update_deployed_version_pointer(db, req, release_id=work_item.id)
@@ -767,18 +943,17 @@ async def update_work_item(
         # Resolve new requirements
         new_affected = []
         new_baseline_hashes = {}
+        requirements_by_key = _load_requirements(db, data.affects, with_content=True)
         for req_identifier in data.affects:
-            req_id = resolve_requirement_id(db, req_identifier)
-            if not req_id:
+            req = requirements_by_key.get(req_identifier)
+            if not req:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Requirement not found: {req_identifier}"
                 )
-            req = db.query(Requirement).filter(Requirement.id == req_id).first()
-            if req:
-                new_affected.append(req)
-                if req.content:
-                    new_baseline_hashes[str(req.id)] = req.content_hash or compute_content_hash(req.content)
+            new_affected.append(req)
+            if req.content:
+                new_baseline_hashes[str(req.id)] = req.content_hash or compute_content_hash(req.content)
 
         work_item.affected_requirements = new_affected
         if work_item.work_item_type == WorkItemType.CR:
@@ -801,16 +976,13 @@ async def update_work_item(
         )
 
     db.commit()
-    refresh_attrs = ["assignee", "created_by_user", "affected_requirements"]
-    if work_item.work_item_type == WorkItemType.RELEASE:
-        refresh_attrs.append("included_work_items")
-    db.refresh(work_item, refresh_attrs)
+    work_item = _reload_for_response(db, work_item)
 
-    return work_item_to_response(work_item, db)
+    return work_item_to_response(work_item)
 
 
 @router.post("/{work_item_id}/transition", response_model=WorkItemResponse)
-async def transition_work_item(
+def transition_work_item(
     work_item_id: str,
     data: WorkItemTransition,
     db: Session = Depends(get_db),
@@ -835,9 +1007,8 @@ async def transition_work_item(
 
     # RAAS-FEAT-102: Deployment gate - CR/BUG/DEBT must be in a Release to deploy
     if data.new_status == WorkItemStatus.DEPLOYED:
-        if work_item.work_item_type in [WorkItemType.CR, WorkItemType.BUG, WorkItemType.DEBT]:
+        if work_item.work_item_type in _RELEASABLE_TYPES:
             # Check if this work item is included in a Release
-            db.refresh(work_item, ["included_in_releases"])
             if not work_item.included_in_releases:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
@@ -847,7 +1018,7 @@ async def transition_work_item(
             # Check if any containing Release is already deployed or completed (BUG-006 fix)
             deployed_release = None
             for release in work_item.included_in_releases:
-                if release.status in [WorkItemStatus.DEPLOYED, WorkItemStatus.COMPLETED]:
+                if release.status in _SHIPPED_STATUSES:
                     deployed_release = release
                     break
             if not deployed_release:
@@ -864,7 +1035,6 @@ async def transition_work_item(
     # RAAS-FEAT-102: Release deployment cascade - deploy all included items when Release deploys
     # TARKA-FEAT-106: Also mark affected requirements as deployed via this Release
     if data.new_status == WorkItemStatus.DEPLOYED and work_item.work_item_type == WorkItemType.RELEASE:
-        db.refresh(work_item, ["included_work_items"])
         deployed_requirements = set()  # Track to avoid duplicates across work items
         for included_wi in work_item.included_work_items:
             # Transition validated work items to deployed
@@ -883,8 +1053,7 @@ async def transition_work_item(
 
             # TARKA-FEAT-106: Mark affected requirements as deployed via this Release
             # Only for work items that are now deployed (just transitioned or already deployed/completed)
-            if included_wi.status in [WorkItemStatus.DEPLOYED, WorkItemStatus.COMPLETED]:
-                db.refresh(included_wi, ["affected_requirements"])
+            if included_wi.status in _SHIPPED_STATUSES:
                 for req in included_wi.affected_requirements:
                     if req.id not in deployed_requirements:
                         deployed_requirements.add(req.id)
@@ -899,7 +1068,6 @@ async def transition_work_item(
             execute_cr_merge(db, work_item, current_user.id)
         # RAAS-FEAT-102: Release completion cascade - complete all deployed included items
         if work_item.work_item_type == WorkItemType.RELEASE:
-            db.refresh(work_item, ["included_work_items"])
             for included_wi in work_item.included_work_items:
                 if included_wi.status == WorkItemStatus.DEPLOYED:
                     included_wi.status = WorkItemStatus.COMPLETED
@@ -929,20 +1097,24 @@ async def transition_work_item(
     )
 
     db.commit()
-    db.refresh(work_item, ["assignee", "created_by_user", "affected_requirements"])
+    work_item = _reload_for_response(db, work_item)
 
     logger.info(f"Work Item {work_item.human_readable_id} transitioned: {old_status.value} -> {data.new_status.value}")
-    return work_item_to_response(work_item, db)
+    return work_item_to_response(work_item)
 
 
 @router.get("/{work_item_id}/history", response_model=list[WorkItemHistoryResponse])
-async def get_work_item_history(
+def get_work_item_history(
     work_item_id: str,
+    request: Request,
     limit: int = Query(50, ge=1, le=100),
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """Get Work Item change history."""
+    """Get Work Item change history.
+
+    Responses carry an ETag for conditional requests (If-None-Match).
+    """
     work_item = resolve_work_item_id(db, work_item_id)
     if not work_item:
         raise HTTPException(
@@ -958,7 +1130,7 @@ async def get_work_item_history(
         WorkItemHistory.changed_at.desc()
     ).limit(limit).all()
 
-    return [
+    entries = [
         WorkItemHistoryResponse(
             id=h.id,
             work_item_id=h.work_item_id,
@@ -973,10 +1145,11 @@ async def get_work_item_history(
         )
         for h in history
     ]
+    return _conditional_json(request, _history_adapter.dump_json(entries))
 
 
 @router.get("/{work_item_id}/transitions", response_model=list[str])
-async def get_allowed_transitions(
+def get_allowed_transitions(
     work_item_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -999,23 +1172,23 @@ async def get_allowed_transitions(
 
 
 @router.get("/requirements/{requirement_id}/versions", response_model=RequirementVersionListResponse)
-async def list_requirement_versions(
+def list_requirement_versions(
     requirement_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
     """List all versions of a requirement."""
-    # Resolve requirement ID
-    req_uuid = resolve_requirement_id(db, requirement_id)
-    if not req_uuid:
+    req = resolve_requirement(db, requirement_id)
+    if not req:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Requirement not found: {requirement_id}"
         )
+    req_uuid = req.id
 
-    req = db.query(Requirement).filter(Requirement.id == req_uuid).first()
-
+    # List items carry no markdown, so content is never loaded
     versions = db.query(RequirementVersion).options(
+        defer(RequirementVersion.content),
         joinedload(RequirementVersion.source_work_item),
         joinedload(RequirementVersion.created_by_user),
     ).filter(
@@ -1041,14 +1214,12 @@ async def list_requirement_versions(
             created_by_email=created_by_email,
         ))
 
-    # Get deployed version number (CR-006: replaced current_version_number)
-    deployed_version_num = None
-    if req.deployed_version_id:
-        deployed_ver = db.query(RequirementVersion).filter(
-            RequirementVersion.id == req.deployed_version_id
-        ).first()
-        if deployed_ver:
-            deployed_version_num = deployed_ver.version_number
+    # Get deployed version number (CR-006: replaced current_version_number);
+    # the deployed version is one of the versions just listed
+    deployed_version_num = next(
+        (v.version_number for v in versions if v.id == req.deployed_version_id),
+        None,
+    )
 
     return RequirementVersionListResponse(
         items=items,
@@ -1058,14 +1229,122 @@ async def list_requirement_versions(
     )
 
 
+# Declared before /versions/{version_number}, which would otherwise match "diff"
+@router.get("/requirements/{requirement_id}/versions/diff", response_model=RequirementVersionDiff)
+def diff_requirement_versions(
+    requirement_id: str,
+    request: Request,
+    response: Response,
+    from_version: int = Query(..., description="Source version number"),
+    to_version: int = Query(..., description="Target version number"),
+    db: Session = Depends(get_db),
+    current_user: Optional[User] = Depends(get_current_user_optional),
+):
+    """Get diff between two versions of a requirement.
+
+    Version titles and content never change once written, so the response is
+    tagged by the two version ids and may be cached by the client. Send the
+    ETag back in If-None-Match to get 304 Not Modified without the content
+    being loaded at all.
+    """
+    req_uuid = resolve_requirement_id(db, requirement_id)
+    if not req_uuid:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Requirement not found: {requirement_id}"
+        )
+
+    # Get both versions, without their markdown
+    versions = {
+        v.version_number: v
+        for v in db.query(
+            RequirementVersion.id,
+            RequirementVersion.version_number,
+            RequirementVersion.title,
+            RequirementVersion.content_hash,
+        ).filter(
+            RequirementVersion.requirement_id == req_uuid,
+            RequirementVersion.version_number.in_((from_version, to_version)),
+        )
+    }
+    from_ver = versions.get(from_version)
+    to_ver = versions.get(to_version)
+
+    if not from_ver:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Version {from_version} not found"
+        )
+
+    if not to_ver:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Version {to_version} not found"
+        )
+
+    etag = etag_for_version(from_ver.id, to_ver.id)
+    headers = {"ETag": etag, "Cache-Control": IMMUTABLE_CACHE_CONTROL, "Vary": "Authorization"}
+    if etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    response.headers.update(headers)
+
+    # Equal hashes mean equal markdown: load it once and use it for both sides
+    content_changed = from_ver.content_hash != to_ver.content_hash
+    version_ids = (from_ver.id, to_ver.id) if content_changed else (from_ver.id,)
+    content_by_id = dict(
+        db.query(RequirementVersion.id, RequirementVersion.content).filter(
+            RequirementVersion.id.in_(version_ids)
+        ).all()
+    )
+
+    # Generate simple summary
+    changes = []
+    if from_ver.title != to_ver.title:
+        changes.append(f"Title changed from '{from_ver.title}' to '{to_ver.title}'")
+    if content_changed:
+        changes.append("Content modified")
+
+    summary = "; ".join(changes) if changes else "No changes detected"
+
+    from_content = content_by_id[from_ver.id]
+    to_content = content_by_id[to_ver.id] if content_changed else from_content
+    unified_diff = ""
+    if content_changed:
+        unified_diff = "\n".join(difflib.unified_diff(
+            from_content.splitlines(),
+            to_content.splitlines(),
+            fromfile=f"v{from_version}",
+            tofile=f"v{to_version}",
+            lineterm="",
+        ))
+
+    return RequirementVersionDiff(
+        requirement_id=req_uuid,
+        from_version=from_version,
+        to_version=to_version,
+        from_content=from_content,
+        to_content=to_content,
+        from_title=from_ver.title,
+        to_title=to_ver.title,
+        changes_summary=summary,
+        unified_diff=unified_diff,
+    )
+
+
 @router.get("/requirements/{requirement_id}/versions/{version_number}", response_model=RequirementVersionResponse)
-async def get_requirement_version(
+def get_requirement_version(
     requirement_id: str,
     version_number: int,
+    request: Request,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
 ):
-    """Get a specific version of a requirement."""
+    """Get a specific version of a requirement.
+
+    Version content never changes, but the version's status does, so the
+    response is revalidated with an ETag (If-None-Match) rather than cached
+    outright.
+    """
     req_uuid = resolve_requirement_id(db, requirement_id)
     if not req_uuid:
         raise HTTPException(
@@ -1090,7 +1369,7 @@ async def get_requirement_version(
     wi_hrid = version.source_work_item.human_readable_id if version.source_work_item else None
     created_by_email = version.created_by_user.email if version.created_by_user else None
 
-    return RequirementVersionResponse(
+    payload = RequirementVersionResponse(
         id=version.id,
         requirement_id=version.requirement_id,
         version_number=version.version_number,
@@ -1106,66 +1385,7 @@ async def get_requirement_version(
         created_by=version.created_by_user_id,
         created_by_email=created_by_email,
     )
-
-
-@router.get("/requirements/{requirement_id}/versions/diff", response_model=RequirementVersionDiff)
-async def diff_requirement_versions(
-    requirement_id: str,
-    from_version: int = Query(..., description="Source version number"),
-    to_version: int = Query(..., description="Target version number"),
-    db: Session = Depends(get_db),
-    current_user: Optional[User] = Depends(get_current_user_optional),
-):
-    """Get diff between two versions of a requirement."""
-    req_uuid = resolve_requirement_id(db, requirement_id)
-    if not req_uuid:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Requirement not found: {requirement_id}"
-        )
-
-    # Get both versions
-    from_ver = db.query(RequirementVersion).filter(
-        RequirementVersion.requirement_id == req_uuid,
-        RequirementVersion.version_number == from_version,
-    ).first()
-
-    to_ver = db.query(RequirementVersion).filter(
-        RequirementVersion.requirement_id == req_uuid,
-        RequirementVersion.version_number == to_version,
-    ).first()
-
-    if not from_ver:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Version {from_version} not found"
-        )
-
-    if not to_ver:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"Version {to_version} not found"
-        )
-
-    # Generate simple summary
-    changes = []
-    if from_ver.title != to_ver.title:
-        changes.append(f"Title changed from '{from_ver.title}' to '{to_ver.title}'")
-    if from_ver.content_hash != to_ver.content_hash:
-        changes.append("Content modified")
-
-    summary = "; ".join(changes) if changes else "No changes detected"
-
-    return RequirementVersionDiff(
-        requirement_id=req_uuid,
-        from_version=from_version,
-        to_version=to_version,
-        from_content=from_ver.content,
-        to_content=to_ver.content,
-        from_title=from_ver.title,
-        to_title=to_ver.title,
-        changes_summary=summary,
-    )
+    return _conditional_json(request, payload.model_dump_json().encode())
 
 
 # =============================================================================
@@ -1177,7 +1397,7 @@ async def diff_requirement_versions(
 
 
 @router.post("/releases/backfill-deployments", response_model=dict)
-async def backfill_release_deployments(
+def backfill_release_deployments(
     db: Session = Depends(get_db),
 ):
     """BUG-013 fix: Retrospectively mark requirements as deployed for completed Releases.
@@ -1192,6 +1412,8 @@ async def backfill_release_deployments(
     completed_releases = db.query(WorkItem).filter(
         WorkItem.work_item_type == WorkItemType.RELEASE,
         WorkItem.status == WorkItemStatus.COMPLETED,
+    ).options(
+        selectinload(WorkItem.included_work_items).selectinload(WorkItem.affected_requirements),
     ).all()
 
     results = {
@@ -1208,7 +1430,6 @@ async def backfill_release_deployments(
             "work_items": [],
         }
 
-        db.refresh(release, ["included_work_items"])
         for included_wi in release.included_work_items:
             wi_detail = {
                 "work_item_id": included_wi.human_readable_id,
@@ -1216,7 +1437,6 @@ async def backfill_release_deployments(
                 "requirements_skipped": [],
             }
 
-            db.refresh(included_wi, ["affected_requirements"])
             for req in included_wi.affected_requirements:
                 if not req.deployed_version_id:
                     # TARKA-FEAT-106: Pass release_id for status tag tracking
@@ -1267,7 +1487,7 @@ from ...schemas import (
 
 
 @router.get("/{work_item_id}/diffs", response_model=WorkItemDiffsResponse)
-async def get_work_item_diffs(
+def get_work_item_diffs(
     work_item_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -1285,16 +1505,17 @@ async def get_work_item_diffs(
     Returns:
         WorkItemDiffsResponse with diff details for each affected requirement
     """
-    work_item = resolve_work_item_id(db, work_item_id)
+    # Affected requirements and their versions load up front; deployed and latest
+    # versions are picked from them rather than queried per requirement
+    work_item = resolve_work_item_id(db, work_item_id, options=(
+        selectinload(WorkItem.affected_requirements).selectinload(Requirement.versions),
+    ))
     if not work_item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Work Item not found: {work_item_id}"
         )
 
-    # Eager load affected requirements
-    db.refresh(work_item, ["affected_requirements"])
-
     diffs = []
     total_with_changes = 0
 
@@ -1304,17 +1525,15 @@ async def get_work_item_diffs(
         deployed_content = None
         deployed_version_num = None
         if req.deployed_version_id:
-            deployed_version = db.query(RequirementVersion).filter(
-                RequirementVersion.id == req.deployed_version_id
-            ).first()
+            deployed_version = next(
+                (v for v in req.versions if v.id == req.deployed_version_id), None
+            )
             if deployed_version:
                 deployed_content = deployed_version.content
                 deployed_version_num = deployed_version.version_number
 
         # Get latest version
-        latest_version = db.query(RequirementVersion).filter(
-            RequirementVersion.requirement_id == req.id
-        ).order_by(RequirementVersion.version_number.desc()).first()
+        latest_version = max(req.versions, key=lambda v: v.version_number, default=None)
 
         latest_content = latest_version.content if latest_version else None
         latest_version_num = latest_version.version_number if latest_version else None
@@ -1368,7 +1587,7 @@ async def get_work_item_diffs(
 
 
 @router.get("/{work_item_id}/check-conflicts", response_model=ConflictCheckResponse)
-async def check_work_item_conflicts(
+def check_work_item_conflicts(
     work_item_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -1384,16 +1603,19 @@ async def check_work_item_conflicts(
     Returns:
         ConflictCheckResponse with conflict status for each affected requirement
     """
-    work_item = resolve_work_item_id(db, work_item_id)
+    # Requirement title and content_hash come from the resolved version, so versions
+    # load with the requirements (markdown deferred; the stored hash is compared)
+    work_item = resolve_work_item_id(db, work_item_id, options=(
+        selectinload(WorkItem.affected_requirements)
+        .selectinload(Requirement.versions)
+        .defer(RequirementVersion.content),
+    ))
     if not work_item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Work Item not found: {work_item_id}"
         )
 
-    # Eager load affected requirements
-    db.refresh(work_item, ["affected_requirements"])
-
     baseline_hashes = work_item.baseline_hashes or {}
     conflicts = []
     conflict_count = 0
@@ -1441,7 +1663,7 @@ async def check_work_item_conflicts(
 
 
 @router.get("/{work_item_id}/drift", response_model=DriftCheckResponse)
-async def check_work_item_drift(
+def check_work_item_drift(
     work_item_id: str,
     db: Session = Depends(get_db),
     current_user: Optional[User] = Depends(get_current_user_optional),
@@ -1457,15 +1679,24 @@ async def check_work_item_drift(
     Returns:
         DriftCheckResponse with drift warnings for each affected requirement
     """
-    work_item = resolve_work_item_id(db, work_item_id)
+    work_item = resolve_work_item_id(db, work_item_id, options=(
+        selectinload(WorkItem.target_versions).joinedload(RequirementVersion.requirement),
+    ))
     if not work_item:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail=f"Work Item not found: {work_item_id}"
         )
 
-    # Eager load target versions and their requirements
-    db.refresh(work_item, ["target_versions"])
+    # Latest version number of every targeted requirement in one grouped query
+    # (CR-006: compare against latest, not current_version_id)
+    requirement_ids = {tv.requirement_id for tv in work_item.target_versions}
+    latest_version_nums = dict(
+        db.query(RequirementVersion.requirement_id, func.max(RequirementVersion.version_number))
+        .filter(RequirementVersion.requirement_id.in_(requirement_ids))
+        .group_by(RequirementVersion.requirement_id)
+        .all()
+    ) if requirement_ids else {}
 
     drift_warnings = []
 
@@ -1475,11 +1706,7 @@ async def check_work_item_drift(
         if not req:
             continue
 
-        # Get latest version number (CR-006: compare against latest, not current_version_id)
-        latest_version = db.query(RequirementVersion).filter(
-            RequirementVersion.requirement_id == req.id
-        ).order_by(RequirementVersion.version_number.desc()).first()
-        latest_version_num = latest_version.version_number if latest_version else 1
+        latest_version_num = latest_version_nums.get(req.id, 1)
 
         target_version_num = target_version.version_number
 
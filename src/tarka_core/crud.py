@@ -1,14 +1,19 @@
 """CRUD operations for requirements."""
 import logging
+import re
+import threading
+import time
+from datetime import datetime
 from typing import Optional
 from uuid import UUID
 
-from sqlalchemy import or_, and_, cast, case, String
+from sqlalchemy import or_, and_, cast, case, delete, exists, func, update, String, tuple_
 from sqlalchemy.dialects.postgresql import ARRAY
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, aliased, load_only, selectinload
 from sqlalchemy.exc import SQLAlchemyError
 
 from . import models, schemas
+from .pagination import paginate_with_total
 from .markdown_utils import (
     render_template,
     extract_metadata,
@@ -52,25 +57,101 @@ from .versioning import (
 logger = logging.getLogger("raas-api.crud")
 
 
+class InvalidStatusTransitionError(ValueError):
+    """Raised when a requirement status change is rejected by the state machine."""
+    pass
+
+
+class TransitionPersonaError(ValueError):
+    """Raised when the declared persona may not perform a status transition."""
+    pass
+
+
+class RequirementReferenceNotFoundError(ValueError):
+    """Raised when a batch item names a project or parent requirement that does not exist."""
+    pass
+
+
+# Human-readable requirement ID format: PROJECT-TYPE-###
+_READABLE_ID_RE = re.compile(r'^[A-Z0-9]{2,10}-(EPIC|COMP|FEAT|REQ)-[0-9]{3}$')
+
+# Process-local user ID -> (expires_at, organization IDs) map. Membership
+# changes made through this module invalidate it in this process only; in other
+# worker processes a revoked membership keeps granting access until the entry
+# expires (up to ORGANIZATION_IDS_TTL seconds). Sync handlers run in a
+# threadpool, so every access goes through _organization_ids_lock; the
+# generation counter stops a lookup that raced an invalidation from storing
+# the membership list it read before the change.
+ORGANIZATION_IDS_TTL = 30.0  # seconds
+ORGANIZATION_IDS_CACHE_MAX = 10000
+_organization_ids_cache: dict[UUID, tuple[float, list[UUID]]] = {}
+_organization_ids_lock = threading.Lock()
+_organization_ids_generation = 0
+
+
+def _invalidate_organization_ids(user_id: Optional[UUID] = None) -> None:
+    """Drop one user's cached organization IDs, or every user's if user_id is None."""
+    global _organization_ids_generation
+    with _organization_ids_lock:
+        _organization_ids_generation += 1
+        if user_id is None:
+            _organization_ids_cache.clear()
+        else:
+            _organization_ids_cache.pop(user_id, None)
+
+
+# Sort by type hierarchy: epic > component > feature > requirement
+TYPE_SORT_ORDER = {
+    models.RequirementType.EPIC: 1,
+    models.RequirementType.COMPONENT: 2,
+    models.RequirementType.FEATURE: 3,
+    models.RequirementType.REQUIREMENT: 4,
+}
+
+
 def _type_sort_expression():
     """Build SQLAlchemy CASE expression for type-based sorting.
 
     CR-009: Status no longer exists on Requirement (lives on versions).
     Sort by type hierarchy: epic > component > feature > requirement.
     """
-    type_order = {
-        models.RequirementType.EPIC: 1,
-        models.RequirementType.COMPONENT: 2,
-        models.RequirementType.FEATURE: 3,
-        models.RequirementType.REQUIREMENT: 4,
-    }
     return case(
         *[(models.Requirement.type == req_type, order)
-          for req_type, order in type_order.items()],
+          for req_type, order in TYPE_SORT_ORDER.items()],
         else_=99
     )
 
 
+def requirement_sort_key(requirement: models.Requirement) -> tuple[int, Optional[str], UUID]:
+    """Return the (type rank, human_readable_id, id) key that requirement lists sort on.
+
+    Used to build keyset cursors for get_requirements.
+    """
+    return TYPE_SORT_ORDER.get(requirement.type, 99), requirement.human_readable_id, requirement.id
+
+
+def _after_requirement_key(key: tuple[int, Optional[str], UUID]):
+    """Keyset predicate for rows after key in (type rank ASC, hrid DESC, id DESC) order.
+
+    PostgreSQL sorts NULLs first in DESC order, so requirements without a
+    readable ID precede the others within a type.
+    """
+    rank, hrid, row_id = key
+    rank_expr = _type_sort_expression()
+    hrid_col = models.Requirement.human_readable_id
+    if hrid is None:
+        within_rank = or_(
+            and_(hrid_col.is_(None), models.Requirement.id < row_id),
+            hrid_col.isnot(None),
+        )
+    else:
+        within_rank = or_(
+            hrid_col < hrid,
+            and_(hrid_col == hrid, models.Requirement.id < row_id),
+        )
+    return or_(rank_expr > rank, and_(rank_expr == rank, within_rank))
+
+
 def create_requirement(
     db: Session,
     requirement: schemas.RequirementCreate,
@@ -99,6 +180,123 @@ def create_requirement(
     Returns:
         Created requirement instance
 
+    Raises:
+        ValueError: If content is missing or invalid
+    """
+    db_requirement = _add_requirement(
+        db, requirement, organization_id, user_id, project_id, director_id, actor_id
+    )
+    try:
+        db.commit()
+    except SQLAlchemyError as e:
+        logger.error(f"Database error creating requirement: {e}", exc_info=True)
+        db.rollback()
+        raise
+    db.refresh(db_requirement)
+    logger.debug(f"Database: Created requirement {db_requirement.id} with v1 in org {organization_id}")
+
+    return db_requirement
+
+
+def create_requirements(
+    db: Session,
+    items: list[tuple[schemas.RequirementCreate, Optional[UUID]]],
+    user_id: UUID,
+    director_id: Optional[UUID] = None,
+    actor_id: Optional[UUID] = None,
+) -> list[models.Requirement]:
+    """
+    Create several requirements in a single transaction.
+
+    Every referenced project (epics) and parent requirement (other types) is
+    loaded up front with one IN query per table. Each item's organization
+    comes from those rows, and the per-item project/parent lookups are then
+    served from the session's identity map instead of the database.
+
+    Each item is validated and flushed in order, then everything is committed
+    once at the end. If any item is rejected, the whole batch is rolled back
+    and nothing is created.
+
+    Args:
+        db: Database session
+        items: (requirement creation data, frontmatter parent_id) pairs;
+            parent_id is None for epics, which use requirement.project_id
+        user_id: User UUID (creator)
+        director_id: BUG-003 - Human user who authorized the change
+        actor_id: BUG-003 - Agent account that executed the change (if applicable)
+
+    Returns:
+        Created requirement instances, in input order
+
+    Raises:
+        RequirementReferenceNotFoundError: If an item's project or parent does not exist
+        ValueError: If any item is invalid; the message names the item index
+    """
+    project_ids = {r.project_id for r, parent_id in items if parent_id is None and r.project_id}
+    parent_ids = {parent_id for _, parent_id in items if parent_id is not None}
+    # Keep strong references: the identity map only holds rows weakly
+    projects = {
+        p.id: p for p in db.query(models.Project).filter(models.Project.id.in_(project_ids)).all()
+    } if project_ids else {}
+    parents = {
+        r.id: r for r in db.query(models.Requirement).filter(models.Requirement.id.in_(parent_ids)).all()
+    } if parent_ids else {}
+
+    organization_ids = []
+    for index, (requirement, parent_id) in enumerate(items):
+        if parent_id is None:
+            project = projects.get(requirement.project_id)
+            if project is None:
+                raise RequirementReferenceNotFoundError(
+                    f"Item {index}: Project {requirement.project_id} not found"
+                )
+            organization_ids.append(project.organization_id)
+        else:
+            parent = parents.get(parent_id)
+            if parent is None:
+                raise RequirementReferenceNotFoundError(
+                    f"Item {index}: Parent requirement {parent_id} not found"
+                )
+            organization_ids.append(parent.organization_id)
+
+    created = []
+    try:
+        for index, ((requirement, _), organization_id) in enumerate(zip(items, organization_ids)):
+            try:
+                created.append(_add_requirement(
+                    db, requirement, organization_id, user_id,
+                    requirement.project_id, director_id, actor_id,
+                ))
+            except ValueError as e:
+                raise ValueError(f"Item {index}: {e}") from e
+        created_ids = [r.id for r in created]
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    # Reload the committed (expired) rows with their versions in one round trip
+    db.query(models.Requirement).filter(
+        models.Requirement.id.in_(created_ids)
+    ).options(selectinload(models.Requirement.versions)).populate_existing().all()
+    logger.debug(f"Database: Created {len(created)} requirements in one transaction")
+    return created
+
+
+def _add_requirement(
+    db: Session,
+    requirement: schemas.RequirementCreate,
+    organization_id: UUID,
+    user_id: UUID,
+    project_id: Optional[UUID] = None,
+    director_id: Optional[UUID] = None,
+    actor_id: Optional[UUID] = None,
+) -> models.Requirement:
+    """Validate a requirement and add it with its v1 version and history entry.
+
+    Flushes but does not commit, so callers decide the transaction boundary.
+    See create_requirement for the arguments and validation rules.
+
     Raises:
         ValueError: If content is missing or invalid
     """
@@ -146,9 +344,13 @@ def create_requirement(
         logger.warning(f"Reserved tag validation failed: {e}")
         raise ValueError(str(e))
 
+    # Load the parent once for the hierarchy check and project inheritance below.
+    # get() is served from the identity map when the caller preloaded it.
+    parent = get_requirement(db, parent_id) if parent_id else None
+
     # Validate parent-child type relationship (Epic > Component > Feature > Requirement)
     try:
-        validate_parent_type(db, requirement.type, parent_id)
+        validate_parent_type(db, requirement.type, parent_id, parent=parent)
     except HierarchyValidationError as e:
         # Return clear, actionable error message for hierarchy violations
         logger.warning(f"Hierarchy validation failed: {e.message}")
@@ -184,7 +386,6 @@ def create_requirement(
                 f"{requirement.type.value} requires a parent_id in the markdown frontmatter. "
                 f"Ensure the YAML frontmatter includes 'parent_id: <uuid>'"
             )
-        parent = get_requirement(db, parent_id)
         if not parent:
             logger.warning(f"Parent requirement {parent_id} not found for new {requirement.type.value}")
             raise ValueError(
@@ -287,25 +488,22 @@ def create_requirement(
             change_reason="Initial creation",
         )
 
-        db.commit()
-        db.refresh(db_requirement)
-        logger.debug(f"Database: Created requirement {db_requirement.id} with v1 in org {organization_id}")
+        # Create history entry (BUG-003: include director/actor for audit trail)
+        _create_history_entry(
+            db=db,
+            requirement_id=db_requirement.id,
+            change_type=models.ChangeType.CREATED,
+            new_value=f"Created {requirement.type.value}: {title}",
+            user_id=user_id,
+            director_id=director_id,
+            actor_id=actor_id,
+            commit=False,
+        )
     except SQLAlchemyError as e:
         logger.error(f"Database error creating requirement: {e}", exc_info=True)
         db.rollback()
         raise
 
-    # Create history entry (BUG-003: include director/actor for audit trail)
-    _create_history_entry(
-        db=db,
-        requirement_id=db_requirement.id,
-        change_type=models.ChangeType.CREATED,
-        new_value=f"Created {requirement.type.value}: {title}",
-        user_id=user_id,
-        director_id=director_id,
-        actor_id=actor_id,
-    )
-
     return db_requirement
 
 
@@ -320,7 +518,7 @@ def get_requirement(db: Session, requirement_id: UUID) -> Optional[models.Requir
     Returns:
         Requirement instance or None if not found
     """
-    return db.query(models.Requirement).filter(models.Requirement.id == requirement_id).first()
+    return db.get(models.Requirement, requirement_id)
 
 
 def get_requirement_by_any_id(db: Session, requirement_id: str) -> Optional[models.Requirement]:
@@ -338,27 +536,66 @@ def get_requirement_by_any_id(db: Session, requirement_id: str) -> Optional[mode
     Returns:
         Requirement instance or None if not found
     """
-    import re
-
-    # Try UUID first (most common case, faster)
-    try:
-        uuid_id = UUID(requirement_id)
-        return db.query(models.Requirement).filter(models.Requirement.id == uuid_id).first()
-    except (ValueError, AttributeError):
-        # Not a valid UUID, try human-readable ID
-        pass
-
-    # Validate human-readable ID format: PROJECT-TYPE-###
+    # Classify with the precompiled readable-ID pattern first so neither
+    # format pays for a raised-and-caught ValueError.
     # Pattern: 2-10 uppercase alphanumeric, dash, TYPE (EPIC|COMP|FEAT|REQ), dash, 3 digits
-    if not re.match(r'^[A-Z0-9]{2,10}-(EPIC|COMP|FEAT|REQ)-[0-9]{3}$', requirement_id.upper()):
-        return None
-
-    # Lookup by human-readable ID (case-insensitive)
+    readable_id = requirement_id.upper()
+    if not _READABLE_ID_RE.match(readable_id):
+        # UUID (most common case); get() is served from the identity map if loaded
+        try:
+            uuid_id = UUID(requirement_id)
+        except ValueError:
+            return None
+        return db.get(models.Requirement, uuid_id)
+
+    # Lookup by human-readable ID (case-insensitive). Stored IDs are uppercase
+    # (ck_requirements_hrid_uppercase), so comparing against the uppercased
+    # input hits the unique index without upper() on the column.
     return db.query(models.Requirement).filter(
-        models.Requirement.human_readable_id == requirement_id.upper()
+        models.Requirement.human_readable_id == readable_id
     ).first()
 
 
+def get_requirement_with_access(
+    db: Session,
+    requirement_id: str,
+    user_id: Optional[UUID],
+) -> tuple[Optional[models.Requirement], bool]:
+    """
+    Get a requirement by UUID or human-readable ID together with whether the
+    user belongs to its organization, in a single query.
+
+    Args:
+        db: Database session
+        requirement_id: Either UUID string or human-readable ID
+        user_id: User UUID, or None in solo mode (access always granted)
+
+    Returns:
+        Tuple of (requirement or None if not found, has_access)
+    """
+    if user_id is None:
+        return get_requirement_by_any_id(db, requirement_id), True
+
+    readable_id = requirement_id.upper()
+    if _READABLE_ID_RE.match(readable_id):
+        match_id = models.Requirement.human_readable_id == readable_id
+    else:
+        try:
+            match_id = models.Requirement.id == UUID(requirement_id)
+        except ValueError:
+            return None, False
+
+    is_member = (
+        exists()
+        .where(models.OrganizationMember.organization_id == models.Requirement.organization_id)
+        .where(models.OrganizationMember.user_id == user_id)
+    )
+    row = db.query(models.Requirement, is_member.label("has_access")).filter(match_id).first()
+    if row is None:
+        return None, False
+    return row[0], bool(row[1])
+
+
 def get_requirements(
     db: Session,
     skip: int = 0,
@@ -375,10 +612,17 @@ def get_requirements(
     include_deprecated: bool = False,
     ready_to_implement: Optional[bool] = None,
     blocked_by: Optional[UUID] = None,
-) -> tuple[list[models.Requirement], int]:
+    cursor: Optional[tuple[int, Optional[str], UUID]] = None,
+    with_total: bool = True,
+) -> tuple[list[models.Requirement], Optional[int]]:
     """
     Get requirements with optional filtering and pagination.
 
+    Requirements are ordered by type hierarchy, then human_readable_id
+    descending (id breaks ties). When cursor is given, rows strictly after
+    that key are returned (keyset pagination), skip is ignored and no total
+    count is computed; build cursors with requirement_sort_key.
+
     Args:
         db: Database session
         skip: Number of records to skip
@@ -395,9 +639,11 @@ def get_requirements(
         include_deprecated: Include deprecated items (default: False, deprecated items excluded)
         ready_to_implement: Filter for requirements with all dependencies code-complete (True) or with unmet dependencies (False). Code-complete = implemented, validated, or deployed.
         blocked_by: Filter for requirements that depend on the specified requirement ID
+        cursor: Optional sort key of the last requirement on the previous page
+        with_total: Compute the total count for page-based requests
 
     Returns:
-        Tuple of (requirements list, total count)
+        Tuple of (requirements list, total count or None in cursor mode / without total)
     """
     # CR-009: For filtering on version fields (status, title, tags, quality_score),
     # we need to join with the resolved version. Create a subquery to find each
@@ -491,46 +737,34 @@ def get_requirements(
             models.Requirement.id == models.requirement_dependencies.c.requirement_id
         ).filter(models.requirement_dependencies.c.depends_on_id == blocked_by)
 
-    # Get total count
-    total = query.count()
-
-    # Apply pagination and ordering
-    # Order by status priority (in_progress first, draft last), then by created_at
-    requirements = (
-        # CR-009: Sort by type hierarchy and human_readable_id
-        query.order_by(_type_sort_expression(), models.Requirement.human_readable_id.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
-
-    # Post-filter for ready_to_implement (requires checking each requirement's dependencies)
-    # This is less efficient but necessary as it requires checking related records
+    # Ready to implement = every dependency is code-complete (deployed_version_id
+    # set), including requirements with no dependencies at all
     if ready_to_implement is not None:
-        filtered_requirements = []
-        for req in requirements:
-            # Get dependencies for this requirement
-            deps = (
-                db.query(models.Requirement)
-                .join(
-                    models.requirement_dependencies,
-                    models.Requirement.id == models.requirement_dependencies.c.depends_on_id
-                )
-                .filter(models.requirement_dependencies.c.requirement_id == req.id)
-                .all()
-            )
+        dependency = aliased(models.Requirement)
+        has_unmet_dependency = (
+            exists()
+            .where(models.requirement_dependencies.c.requirement_id == models.Requirement.id)
+            .where(models.requirement_dependencies.c.depends_on_id == dependency.id)
+            .where(dependency.deployed_version_id.is_(None))
+        )
+        query = query.filter(~has_unmet_dependency if ready_to_implement else has_unmet_dependency)
 
-            # Check if ready to implement (all dependencies are code-complete or no dependencies)
-            # CR-004 Phase 4: Code-complete = deployed_version_id is set
-            is_ready = not deps or all(dep.deployed_version_id is not None for dep in deps)
+    # CR-009: Sort by type hierarchy and human_readable_id
+    query = query.order_by(
+        _type_sort_expression(),
+        models.Requirement.human_readable_id.desc(),
+        models.Requirement.id.desc(),
+    )
+    query = query.options(*_list_item_loaders())
 
-            if ready_to_implement == is_ready:
-                filtered_requirements.append(req)
+    if cursor:
+        return query.filter(_after_requirement_key(cursor)).limit(limit).all(), None
 
-        requirements = filtered_requirements
-        # Note: total count is not adjusted for ready_to_implement filter as it's applied post-pagination
+    if not with_total:
+        return query.offset(skip).limit(limit).all(), None
 
-    return requirements, total
+    # Apply pagination (total count comes back with the page)
+    return paginate_with_total(query, skip, limit)
 
 
 def update_requirement(
@@ -541,6 +775,7 @@ def update_requirement(
     persona: Optional[Persona] = None,
     director_id: Optional[UUID] = None,
     actor_id: Optional[UUID] = None,
+    db_requirement: Optional[models.Requirement] = None,
 ) -> Optional[models.Requirement]:
     """
     Update a requirement (CR-009 refactored).
@@ -566,6 +801,7 @@ def update_requirement(
         persona: Declared workflow persona for authorization
         director_id: CR-002 - Human user who authorized the change
         actor_id: CR-002 - Agent account that executed the change
+        db_requirement: Requirement already loaded by the caller (skips the re-fetch)
 
     Returns:
         Updated requirement or None if not found
@@ -573,7 +809,8 @@ def update_requirement(
     Raises:
         ValueError: If provided markdown content is invalid or persona not authorized
     """
-    db_requirement = get_requirement(db, requirement_id)
+    if db_requirement is None:
+        db_requirement = get_requirement(db, requirement_id)
     if not db_requirement:
         return None
 
@@ -663,7 +900,7 @@ def update_requirement(
                         change_reason=f"BLOCKED: {str(e)}",
                         user_id=user_id, director_id=director_id, actor_id=actor_id,
                     )
-                    raise ValueError(str(e))
+                    raise InvalidStatusTransitionError(str(e))
 
                 org = get_organization(db, db_requirement.organization_id) if db_requirement.organization_id else None
                 org_settings = org.settings if org else None
@@ -684,7 +921,7 @@ def update_requirement(
                         change_reason=f"BLOCKED (persona={persona_str}): {str(e)}",
                         user_id=user_id, director_id=director_id, actor_id=actor_id,
                     )
-                    raise ValueError(str(e))
+                    raise TransitionPersonaError(str(e))
 
                 changes.append(("status", current_status.value, metadata["status"].value))
                 new_status = metadata["status"]
@@ -756,7 +993,7 @@ def update_requirement(
                     change_reason=f"BLOCKED: {str(e)}",
                     user_id=user_id, director_id=director_id, actor_id=actor_id,
                 )
-                raise ValueError(str(e))
+                raise InvalidStatusTransitionError(str(e))
 
             org = get_organization(db, db_requirement.organization_id) if db_requirement.organization_id else None
             org_settings = org.settings if org else None
@@ -777,7 +1014,7 @@ def update_requirement(
                     change_reason=f"BLOCKED (persona={persona_str}): {str(e)}",
                     user_id=user_id, director_id=director_id, actor_id=actor_id,
                 )
-                raise ValueError(str(e))
+                raise TransitionPersonaError(str(e))
 
             changes.append(("status", current_status.value, update_data["status"].value))
             new_status = update_data["status"]
@@ -918,7 +1155,12 @@ def update_requirement(
     return db_requirement
 
 
-def delete_requirement(db: Session, requirement_id: UUID, user_id: Optional[UUID] = None) -> bool:
+def delete_requirement(
+    db: Session,
+    requirement_id: UUID,
+    user_id: Optional[UUID] = None,
+    db_requirement: Optional[models.Requirement] = None,
+) -> bool:
     """
     Delete a requirement and all its children recursively.
 
@@ -928,6 +1170,7 @@ def delete_requirement(db: Session, requirement_id: UUID, user_id: Optional[UUID
         db: Database session
         requirement_id: Requirement UUID
         user_id: User UUID (who is deleting)
+        db_requirement: Requirement already loaded by the caller (skips the re-fetch)
 
     Returns:
         True if deleted, False if not found
@@ -935,7 +1178,8 @@ def delete_requirement(db: Session, requirement_id: UUID, user_id: Optional[UUID
     Raises:
         ValueError: If other requirements depend on this one or permission denied
     """
-    db_requirement = get_requirement(db, requirement_id)
+    if db_requirement is None:
+        db_requirement = get_requirement(db, requirement_id)
     if not db_requirement:
         return False
 
@@ -971,7 +1215,7 @@ def delete_requirement(db: Session, requirement_id: UUID, user_id: Optional[UUID
     # Recursively delete all children first
     children = get_requirement_children(db, requirement_id)
     for child in children:
-        delete_requirement(db, child.id)
+        delete_requirement(db, child.id, db_requirement=child)
 
     # Create history entry before deletion
     _create_history_entry(
@@ -987,6 +1231,26 @@ def delete_requirement(db: Session, requirement_id: UUID, user_id: Optional[UUID
     return True
 
 
+def _list_item_loaders() -> tuple:
+    """Eager loaders for rows serialized as RequirementListItem.
+
+    List items resolve title/status/tags/version fields and child_count
+    through these relationships; load them once per result set instead of
+    once per row. Children are only counted, so just their keys are loaded.
+    Version markdown is not part of a list item, so it is deferred (it still
+    loads on access if a caller needs it).
+    """
+    return (
+        selectinload(models.Requirement.versions).defer(models.RequirementVersion.content),
+        selectinload(models.Requirement.deployed_version).defer(models.RequirementVersion.content),
+        selectinload(models.Requirement.deployed_by_release),
+        selectinload(models.Requirement.children).load_only(
+            models.Requirement.id, models.Requirement.parent_id
+        ),
+        selectinload(models.Requirement.dependencies),
+    )
+
+
 def get_requirement_children(
     db: Session, parent_id: UUID
 ) -> list[models.Requirement]:
@@ -1005,6 +1269,7 @@ def get_requirement_children(
         .filter(models.Requirement.parent_id == parent_id)
         # CR-009: Sort by type hierarchy and human_readable_id
         .order_by(_type_sort_expression(), models.Requirement.human_readable_id.desc())
+        .options(*_list_item_loaders())
         .all()
     )
 
@@ -1043,6 +1308,7 @@ def _create_history_entry(
     user_id: Optional[UUID] = None,
     director_id: Optional[UUID] = None,
     actor_id: Optional[UUID] = None,
+    commit: bool = True,
 ) -> None:
     """Create a history entry for a requirement change.
 
@@ -1059,6 +1325,7 @@ def _create_history_entry(
         user_id: Legacy field - user who made the change (kept for backwards compatibility)
         director_id: Human user who authorized the change
         actor_id: Agent account that executed the change (if applicable)
+        commit: Commit immediately; pass False to leave it to the caller's transaction
     """
     history_entry = models.RequirementHistory(
         requirement_id=requirement_id,
@@ -1072,7 +1339,8 @@ def _create_history_entry(
         actor_id=actor_id,
     )
     db.add(history_entry)
-    db.commit()
+    if commit:
+        db.commit()
 
 
 # ============================================================================
@@ -1120,7 +1388,7 @@ def get_organization(db: Session, organization_id: UUID) -> Optional[models.Orga
     Returns:
         Organization instance or None if not found
     """
-    return db.query(models.Organization).filter(models.Organization.id == organization_id).first()
+    return db.get(models.Organization, organization_id)
 
 
 def get_organization_by_slug(db: Session, slug: str) -> Optional[models.Organization]:
@@ -1223,6 +1491,8 @@ def delete_organization(db: Session, organization_id: UUID) -> bool:
 
     db.delete(db_org)
     db.commit()
+    # Members are removed by cascade; drop every cached membership list
+    _invalidate_organization_ids()
     logger.debug(f"Deleted organization {organization_id}")
     return True
 
@@ -1274,6 +1544,7 @@ def add_organization_member(
     db.add(db_member)
     db.commit()
     db.refresh(db_member)
+    _invalidate_organization_ids(user_id)
     logger.debug(f"Added user {user_id} to organization {organization_id} with role {role.value}")
     return db_member
 
@@ -1308,6 +1579,10 @@ def get_user_organization_ids(
     Get list of organization IDs where user is a member.
 
     Used for filtering requirements/projects by organization membership.
+    Results are cached per user for ORGANIZATION_IDS_TTL seconds, so
+    membership revocation is eventually consistent: membership changes made
+    through this module take effect at once in this process, but other worker
+    processes keep serving the old list until their entry expires.
 
     Args:
         db: Database session
@@ -1316,12 +1591,26 @@ def get_user_organization_ids(
     Returns:
         List of organization UUIDs where user is a member
     """
+    now = time.monotonic()
+    with _organization_ids_lock:
+        cached = _organization_ids_cache.get(user_id)
+        generation = _organization_ids_generation
+    if cached and cached[0] > now:
+        return list(cached[1])
+
     memberships = (
         db.query(models.OrganizationMember.organization_id)
         .filter(models.OrganizationMember.user_id == user_id)
         .all()
     )
-    return [m.organization_id for m in memberships]
+    organization_ids = [m.organization_id for m in memberships]
+    with _organization_ids_lock:
+        # Skip the store if membership changed while the query ran
+        if generation == _organization_ids_generation:
+            if len(_organization_ids_cache) >= ORGANIZATION_IDS_CACHE_MAX:
+                _organization_ids_cache.clear()
+            _organization_ids_cache[user_id] = (now + ORGANIZATION_IDS_TTL, organization_ids)
+    return list(organization_ids)
 
 
 def update_organization_member_role(
@@ -1393,6 +1682,7 @@ def remove_organization_member(
 
     db.delete(db_member)
     db.commit()
+    _invalidate_organization_ids(user_id)
     logger.debug(f"Removed user {user_id} from organization {organization_id}")
     return True
 
@@ -1467,7 +1757,43 @@ def get_project(db: Session, project_id: UUID) -> Optional[models.Project]:
     Returns:
         Project instance or None if not found
     """
-    return db.query(models.Project).filter(models.Project.id == project_id).first()
+    return db.get(models.Project, project_id)
+
+
+def validate_org_and_project(
+    db: Session, organization_id: UUID, project_id: Optional[UUID] = None
+) -> tuple[bool, bool, bool]:
+    """
+    Check an organization and optional project in one query.
+
+    Used by create paths that would otherwise load the organization and
+    the project separately just to confirm they exist and belong together.
+
+    Args:
+        db: Database session
+        organization_id: Organization UUID
+        project_id: Optional project UUID
+
+    Returns:
+        (org_exists, project_exists, project_matches_org). Without a
+        project_id the last two are True.
+    """
+    if project_id is None:
+        org_exists = db.query(
+            exists().where(models.Organization.id == organization_id)
+        ).scalar()
+        return bool(org_exists), True, True
+
+    row = (
+        db.query(models.Organization.id, models.Project.organization_id)
+        .outerjoin(models.Project, models.Project.id == project_id)
+        .filter(models.Organization.id == organization_id)
+        .first()
+    )
+    if row is None:
+        return False, False, False
+    project_org_id = row[1]
+    return True, project_org_id is not None, project_org_id == organization_id
 
 
 def get_project_by_slug(
@@ -1505,10 +1831,19 @@ def get_projects(
     skip: int = 0,
     limit: int = 100,
     user_id: Optional[UUID] = None,
-) -> tuple[list[models.Project], int]:
+    cursor: Optional[tuple[datetime, UUID]] = None,
+    summary: bool = False,
+) -> tuple[list[models.Project], Optional[int]]:
     """
     Get projects with optional filtering and pagination.
 
+    Projects are ordered newest first by (created_at, id). When cursor is
+    given, rows strictly after that key are returned (keyset pagination),
+    skip is ignored and no total count is computed.
+
+    With summary=True only the columns of schemas.ProjectListItem are
+    selected; other attributes are deferred and load on first access.
+
     Args:
         db: Database session
         organization_id: Optional organization UUID filter
@@ -1518,9 +1853,11 @@ def get_projects(
         skip: Number of records to skip
         limit: Maximum number of records to return
         user_id: If provided, only return projects from orgs where user is a member
+        cursor: Optional (created_at, id) of the last project on the previous page
+        summary: Load only the columns needed for list items
 
     Returns:
-        Tuple of (projects list, total count)
+        Tuple of (projects list, total count or None in cursor mode)
     """
     query = db.query(models.Project)
 
@@ -1548,15 +1885,27 @@ def get_projects(
             )
         )
 
-    total = query.count()
-    projects = (
-        query.order_by(models.Project.created_at.desc())
-        .offset(skip)
-        .limit(limit)
-        .all()
-    )
+    query = query.order_by(models.Project.created_at.desc(), models.Project.id.desc())
+
+    if summary:
+        # Skip description/value_statement TEXT and tags/settings JSON on list pages
+        query = query.options(load_only(
+            models.Project.organization_id,
+            models.Project.name,
+            models.Project.slug,
+            models.Project.status,
+            models.Project.visibility,
+            models.Project.created_at,
+            models.Project.updated_at,
+        ))
+
+    if cursor:
+        query = query.filter(
+            tuple_(models.Project.created_at, models.Project.id) < tuple_(*cursor)
+        )
+        return query.limit(limit).all(), None
 
-    return projects, total
+    return paginate_with_total(query, skip, limit)
 
 
 def update_project(
@@ -1593,49 +1942,55 @@ def update_project(
     Returns:
         Updated project or None if not found
     """
-    db_project = get_project(db, project_id)
+    changes = {
+        "name": name,
+        "description": description,
+        "visibility": visibility,
+        "status": status,
+        "value_statement": value_statement,
+        "project_type": project_type,
+        "tags": tags,
+        "settings": settings,
+        "organization_id": organization_id,
+        "updated_by_user_id": user_id,
+    }
+    changes = {field: value for field, value in changes.items() if value is not None}
+    if not changes:
+        return get_project(db, project_id)
+
+    # Single UPDATE ... RETURNING: existence check, update and reload in one round-trip
+    db_project = db.scalars(
+        update(models.Project)
+        .where(models.Project.id == project_id)
+        .values(**changes)
+        .returning(models.Project),
+        execution_options={"populate_existing": True},
+    ).first()
     if not db_project:
+        db.rollback()
         return None
 
-    if name is not None:
-        db_project.name = name
-    if description is not None:
-        db_project.description = description
-    if visibility is not None:
-        db_project.visibility = visibility
-    if status is not None:
-        db_project.status = status
-    if value_statement is not None:
-        db_project.value_statement = value_statement
-    if project_type is not None:
-        db_project.project_type = project_type
-    if tags is not None:
-        db_project.tags = tags
-    if settings is not None:
-        db_project.settings = settings
-    if organization_id is not None:
-        db_project.organization_id = organization_id
-    if user_id is not None:
-        db_project.updated_by_user_id = user_id
-
     db.commit()
-    db.refresh(db_project)
     logger.debug(f"Updated project {project_id}")
     return db_project
 
 
-def delete_project(db: Session, project_id: UUID) -> bool:
+def delete_project(
+    db: Session, project_id: UUID, db_project: Optional[models.Project] = None
+) -> bool:
     """
     Delete a project and all its requirements (cascading delete).
 
     Args:
         db: Database session
         project_id: Project UUID
+        db_project: Project already loaded by the caller (skips the re-fetch)
 
     Returns:
         True if deleted, False if not found
     """
-    db_project = get_project(db, project_id)
+    if db_project is None:
+        db_project = get_project(db, project_id)
     if not db_project:
         return False
 
@@ -1710,22 +2065,21 @@ def update_project_member_role(
     Returns:
         Updated project member or None if not found
     """
-    db_member = (
-        db.query(models.ProjectMember)
-        .filter(
-            and_(
-                models.ProjectMember.project_id == project_id,
-                models.ProjectMember.user_id == user_id,
-            )
+    db_member = db.scalars(
+        update(models.ProjectMember)
+        .where(
+            models.ProjectMember.project_id == project_id,
+            models.ProjectMember.user_id == user_id,
         )
-        .first()
-    )
+        .values(role=role)
+        .returning(models.ProjectMember),
+        execution_options={"populate_existing": True},
+    ).first()
     if not db_member:
+        db.rollback()
         return None
 
-    db_member.role = role
     db.commit()
-    db.refresh(db_member)
     logger.debug(f"Updated user {user_id} role in project {project_id} to {role.value}")
     return db_member
 
@@ -1746,20 +2100,16 @@ def remove_project_member(
     Returns:
         True if removed, False if not found
     """
-    db_member = (
-        db.query(models.ProjectMember)
-        .filter(
-            and_(
-                models.ProjectMember.project_id == project_id,
-                models.ProjectMember.user_id == user_id,
-            )
+    result = db.execute(
+        delete(models.ProjectMember).where(
+            models.ProjectMember.project_id == project_id,
+            models.ProjectMember.user_id == user_id,
         )
-        .first()
     )
-    if not db_member:
+    if result.rowcount == 0:
+        db.rollback()
         return False
 
-    db.delete(db_member)
     db.commit()
     logger.debug(f"Removed user {user_id} from project {project_id}")
     return True
@@ -2377,6 +2727,103 @@ def list_guardrails(
 # ============================================================================
 
 
+# Task lists sort by priority: critical first
+TASK_PRIORITY_ORDER = {
+    models.TaskPriority.CRITICAL: 0,
+    models.TaskPriority.HIGH: 1,
+    models.TaskPriority.MEDIUM: 2,
+    models.TaskPriority.LOW: 3,
+}
+
+
+def _task_order_by() -> tuple:
+    """ORDER BY for task lists: priority, due_date (earliest first, undated last), newest, id."""
+    return (
+        case(TASK_PRIORITY_ORDER, value=models.Task.priority),
+        models.Task.due_date.asc().nulls_last(),
+        models.Task.created_at.desc(),
+        models.Task.id.desc(),
+    )
+
+
+def _task_list_loaders() -> tuple:
+    """Loader options for rows serialized as TaskListItem.
+
+    Only the columns a list item shows are selected; source_context,
+    execution output and resolution text stay unloaded. Assignees are not
+    loaded at all: list items only report assignee_count, which comes from
+    get_task_assignee_counts.
+    """
+    return (
+        load_only(
+            models.Task.id,
+            models.Task.human_readable_id,
+            models.Task.organization_id,
+            models.Task.project_id,
+            models.Task.title,
+            models.Task.description,
+            models.Task.task_type,
+            models.Task.status,
+            models.Task.priority,
+            models.Task.due_date,
+            models.Task.source_type,
+            models.Task.artifact_type,
+            models.Task.artifact_id,
+            models.Task.created_at,
+            models.Task.updated_at,
+        ),
+    )
+
+
+def get_task_assignee_counts(db: Session, task_ids: list[UUID]) -> dict[UUID, int]:
+    """Count assignees for a page of tasks in one grouped query.
+
+    Args:
+        db: Database session
+        task_ids: Task UUIDs
+
+    Returns:
+        Map of task ID to assignee count (tasks without assignees are absent)
+    """
+    if not task_ids:
+        return {}
+    rows = db.query(
+        models.task_assignees.c.task_id, func.count()
+    ).filter(
+        models.task_assignees.c.task_id.in_(task_ids)
+    ).group_by(models.task_assignees.c.task_id).all()
+    return dict(rows)
+
+
+def task_sort_key(task: models.Task) -> tuple[int, Optional[datetime], datetime, UUID]:
+    """Return the (priority rank, due_date, created_at, id) key that task lists sort on.
+
+    Used to build keyset cursors for get_tasks.
+    """
+    return TASK_PRIORITY_ORDER[task.priority], task.due_date, task.created_at, task.id
+
+
+def _after_task_key(key: tuple[int, Optional[datetime], datetime, UUID]):
+    """Keyset predicate for tasks after key in _task_order_by() order."""
+    rank, due_date, created_at, task_id = key
+    rank_expr = case(TASK_PRIORITY_ORDER, value=models.Task.priority)
+    due_col = models.Task.due_date
+    newer_first = or_(
+        models.Task.created_at < created_at,
+        and_(models.Task.created_at == created_at, models.Task.id < task_id),
+    )
+    if due_date is None:
+        # Undated tasks sort last within a priority
+        within_rank = and_(due_col.is_(None), newer_first)
+    else:
+        within_rank = or_(
+            due_col > due_date,
+            due_col.is_(None),
+            and_(due_col == due_date, newer_first),
+        )
+    return or_(rank_expr > rank, and_(rank_expr == rank, within_rank))
+
+
 def _resolve_source_id(
     db: Session,
     source_type: Optional[str],
@@ -2534,10 +2981,14 @@ def get_tasks(
     source_id: Optional[UUID] = None,
     overdue_only: bool = False,
     include_completed: bool = False,
-) -> tuple[list[models.Task], int]:
+    cursor: Optional[tuple[int, Optional[datetime], datetime, UUID]] = None,
+) -> tuple[list[models.Task], Optional[int]]:
     """
     Get tasks with filtering and pagination.
 
+    Pass cursor (the task_sort_key of the last task on the previous page)
+    for keyset pagination; skip is then ignored and no total is computed.
+
     Args:
         db: Database session
         skip: Number of items to skip
@@ -2552,12 +3003,11 @@ def get_tasks(
         source_id: Filter by source artifact ID
         overdue_only: Only return overdue tasks
         include_completed: Include completed/cancelled tasks (default: false)
+        cursor: Optional sort key of the last task on the previous page
 
     Returns:
-        Tuple of (tasks, total_count)
+        Tuple of (tasks, total_count or None in cursor mode)
     """
-    from datetime import datetime
-
     query = db.query(models.Task)
 
     # Apply filters
@@ -2596,30 +3046,14 @@ def get_tasks(
             models.Task.status.notin_([models.TaskStatus.COMPLETED, models.TaskStatus.CANCELLED])
         )
 
-    # Get total count before pagination
-    total = query.count()
-
     # Order by priority (critical first) then due_date (earliest first) then created_at
-    priority_order = [
-        models.TaskPriority.CRITICAL,
-        models.TaskPriority.HIGH,
-        models.TaskPriority.MEDIUM,
-        models.TaskPriority.LOW,
-    ]
-    query = query.order_by(
-        # Custom priority ordering
-        case(
-            {p: i for i, p in enumerate(priority_order)},
-            value=models.Task.priority
-        ),
-        models.Task.due_date.asc().nulls_last(),
-        models.Task.created_at.desc()
-    )
+    query = query.order_by(*_task_order_by()).options(*_task_list_loaders())
 
-    # Apply pagination
-    tasks = query.offset(skip).limit(limit).all()
+    if cursor:
+        return query.filter(_after_task_key(cursor)).limit(limit).all(), None
 
-    return tasks, total
+    # Apply pagination (total count comes back with the page)
+    return paginate_with_total(query, skip, limit)
 
 
 def update_task(
@@ -2964,20 +3398,7 @@ def get_my_tasks(
         )
 
     # Order by priority then due_date
-    priority_order = [
-        models.TaskPriority.CRITICAL,
-        models.TaskPriority.HIGH,
-        models.TaskPriority.MEDIUM,
-        models.TaskPriority.LOW,
-    ]
-    query = query.order_by(
-        case(
-            {p: i for i, p in enumerate(priority_order)},
-            value=models.Task.priority
-        ),
-        models.Task.due_date.asc().nulls_last(),
-        models.Task.created_at.desc()
-    )
+    query = query.order_by(*_task_order_by()).options(*_task_list_loaders())
 
     return query.all()
 
@@ -3366,7 +3787,7 @@ def create_agent_director_mapping(
         raise ValueError(f"User {director_id} is not a human account")
 
     # Verify organization exists
-    org = db.query(models.Organization).filter(models.Organization.id == organization_id).first()
+    org = db.get(models.Organization, organization_id)
     if not org:
         raise ValueError(f"Organization not found: {organization_id}")
 
@@ -0,0 +1,61 @@
+"""HTTP entity tag (ETag) helpers for conditional GET requests.
+
+Clients that poll a resource send back the ETag they last saw in
+If-None-Match; when it still matches, the API answers 304 Not Modified with
+no body instead of re-sending the full representation.
+"""
+import hashlib
+from typing import Optional
+
+
+def etag_for_bytes(body: bytes) -> str:
+    """Build a strong ETag from a serialized response body.
+
+    Args:
+        body: Exact response bytes
+
+    Returns:
+        Quoted ETag value
+    """
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def etag_for_version(*parts: object) -> str:
+    """Build an ETag from values that change whenever the resource changes.
+
+    Use when the response is fully determined by columns such as updated_at,
+    so the body need not be serialized to answer a conditional request.
+
+    Args:
+        *parts: Version-identifying values (e.g. id, updated_at)
+
+    Returns:
+        Quoted ETag value
+    """
+    return '"' + "-".join(str(part) for part in parts) + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against the current ETag.
+
+    Uses weak comparison as RFC 9110 requires for If-None-Match: a W/ prefix
+    is ignored, the header may list several tags, and * matches anything.
+
+    Args:
+        if_none_match: Raw If-None-Match header value (or None)
+        etag: Current quoted ETag
+
+    Returns:
+        True if the client's cached representation is still current
+    """
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*":
+            return True
+        if candidate.startswith("W/"):
+            candidate = candidate[2:]
+        if candidate == etag:
+            return True
+    return False
@@ -75,19 +75,37 @@ def generate_webhook_secret() -> str:
 def verify_webhook_signature(payload: bytes, signature: str, secret: str) -> bool:
     """Verify GitHub webhook signature (HMAC-SHA256).
 
-    GitHub sends signature in format: sha256=<hex digest>
+    GitHub sends signature in format: sha256=<hex digest>. The digest is
+    computed by hashlib's OpenSSL-backed SHA-256 over the raw body and
+    compared against the full header in constant time.
     """
-    if not signature.startswith("sha256="):
-        return False
+    expected = "sha256=" + hmac.new(secret.encode(), payload, hashlib.sha256).hexdigest()
+    return hmac.compare_digest(expected.encode(), signature.encode())
 
-    expected_signature = signature[7:]  # Remove "sha256=" prefix
-    computed = hmac.new(
-        secret.encode(),
-        payload,
-        hashlib.sha256
-    ).hexdigest()
 
-    return hmac.compare_digest(computed, expected_signature)
+# Shared HTTP client for GitHub API calls. Reusing one AsyncClient keeps
+# connections to api.github.com alive across requests instead of paying a
+# fresh TCP + TLS handshake for every call.
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared GitHub HTTP client, creating it on first use."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+            timeout=30.0,
+        )
+    return _http_client
+
+
+async def close_http_client() -> None:
+    """Close the shared GitHub HTTP client (called on application shutdown)."""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
 
 
 class GitHubClient:
@@ -95,8 +113,13 @@ class GitHubClient:
 
     BASE_URL = "https://api.github.com"
 
-    def __init__(self, config: GitHubConfiguration):
+    def __init__(
+        self,
+        config: GitHubConfiguration,
+        http_client: Optional[httpx.AsyncClient] = None,
+    ):
         self.config = config
+        self._http = http_client or get_http_client()
         self._token: Optional[str] = None
 
     @property
@@ -181,28 +204,27 @@ class GitHubClient:
             labels.append(priority_labels[work_item.priority])
 
         # Create the issue
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.repo_url}/issues",
-                headers=self.headers,
-                json={
-                    "title": title,
-                    "body": body,
-                    "labels": labels,
-                },
+        response = await self._http.post(
+            f"{self.repo_url}/issues",
+            headers=self.headers,
+            json={
+                "title": title,
+                "body": body,
+                "labels": labels,
+            },
+        )
+
+        if response.status_code == 201:
+            data = response.json()
+            logger.info(
+                f"Created GitHub Issue #{data['number']} for Work Item {work_item.human_readable_id}"
             )
-
-            if response.status_code == 201:
-                data = response.json()
-                logger.info(
-                    f"Created GitHub Issue #{data['number']} for Work Item {work_item.human_readable_id}"
-                )
-                return data
-            else:
-                logger.error(
-                    f"Failed to create GitHub Issue: {response.status_code} - {response.text}"
-                )
-                raise Exception(f"GitHub API error: {response.status_code}")
+            return data
+        else:
+            logger.error(
+                f"Failed to create GitHub Issue: {response.status_code} - {response.text}"
+            )
+            raise Exception(f"GitHub API error: {response.status_code}")
 
     async def update_issue(
         self,
@@ -220,98 +242,92 @@ class GitHubClient:
         if body:
             update_data["body"] = body
 
-        async with httpx.AsyncClient() as client:
-            response = await client.patch(
-                f"{self.repo_url}/issues/{issue_number}",
-                headers=self.headers,
-                json=update_data,
+        response = await self._http.patch(
+            f"{self.repo_url}/issues/{issue_number}",
+            headers=self.headers,
+            json=update_data,
+        )
+
+        if response.status_code == 200:
+            return response.json()
+        else:
+            logger.error(
+                f"Failed to update GitHub Issue #{issue_number}: {response.status_code}"
             )
-
-            if response.status_code == 200:
-                return response.json()
-            else:
-                logger.error(
-                    f"Failed to update GitHub Issue #{issue_number}: {response.status_code}"
-                )
-                raise Exception(f"GitHub API error: {response.status_code}")
+            raise Exception(f"GitHub API error: {response.status_code}")
 
     async def get_issue(self, issue_number: int) -> dict:
         """Get a GitHub Issue by number."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                f"{self.repo_url}/issues/{issue_number}",
-                headers=self.headers,
-            )
+        response = await self._http.get(
+            f"{self.repo_url}/issues/{issue_number}",
+            headers=self.headers,
+        )
 
-            if response.status_code == 200:
-                return response.json()
-            else:
-                raise Exception(f"GitHub API error: {response.status_code}")
+        if response.status_code == 200:
+            return response.json()
+        else:
+            raise Exception(f"GitHub API error: {response.status_code}")
 
     async def add_issue_comment(self, issue_number: int, comment: str) -> dict:
         """Add a comment to a GitHub Issue."""
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.repo_url}/issues/{issue_number}/comments",
-                headers=self.headers,
-                json={"body": comment},
-            )
+        response = await self._http.post(
+            f"{self.repo_url}/issues/{issue_number}/comments",
+            headers=self.headers,
+            json={"body": comment},
+        )
 
-            if response.status_code == 201:
-                return response.json()
-            else:
-                raise Exception(f"GitHub API error: {response.status_code}")
+        if response.status_code == 201:
+            return response.json()
+        else:
+            raise Exception(f"GitHub API error: {response.status_code}")
 
     async def create_webhook(self, webhook_url: str, secret: str) -> dict:
         """Create a webhook on the repository.
 
         Returns the created webhook data including ID.
         """
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{self.repo_url}/hooks",
-                headers=self.headers,
-                json={
-                    "name": "web",
-                    "active": True,
-                    "events": ["issues", "pull_request", "release"],
-                    "config": {
-                        "url": webhook_url,
-                        "content_type": "json",
-                        "secret": secret,
-                        "insecure_ssl": "0",
-                    },
+        response = await self._http.post(
+            f"{self.repo_url}/hooks",
+            headers=self.headers,
+            json={
+                "name": "web",
+                "active": True,
+                "events": ["issues", "pull_request", "release"],
+                "config": {
+                    "url": webhook_url,
+                    "content_type": "json",
+                    "secret": secret,
+                    "insecure_ssl": "0",
                 },
+            },
+        )
+
+        if response.status_code == 201:
+            data = response.json()
+            logger.info(f"Created GitHub webhook {data['id']} for {self.config.full_repo_name}")
+            return data
+        else:
+            logger.error(
+                f"Failed to create webhook: {response.status_code} - {response.text}"
             )
-
-            if response.status_code == 201:
-                data = response.json()
-                logger.info(f"Created GitHub webhook {data['id']} for {self.config.full_repo_name}")
-                return data
-            else:
-                logger.error(
-                    f"Failed to create webhook: {response.status_code} - {response.text}"
-                )
-                raise Exception(f"GitHub API error: {response.status_code}")
+            raise Exception(f"GitHub API error: {response.status_code}")
 
     async def delete_webhook(self, webhook_id: str) -> bool:
         """Delete a webhook from the repository."""
-        async with httpx.AsyncClient() as client:
-            response = await client.delete(
-                f"{self.repo_url}/hooks/{webhook_id}",
-                headers=self.headers,
-            )
+        response = await self._http.delete(
+            f"{self.repo_url}/hooks/{webhook_id}",
+            headers=self.headers,
+        )
 
-            return response.status_code == 204
+        return response.status_code == 204
 
     async def verify_token(self) -> bool:
         """Verify that the token is valid and has access to the repo."""
-        async with httpx.AsyncClient() as client:
-            response = await client.get(
-                self.repo_url,
-                headers=self.headers,
-            )
-            return response.status_code == 200
+        response = await self._http.get(
+            self.repo_url,
+            headers=self.headers,
+        )
+        return response.status_code == 200
 
 
 class GitHubWebhookHandler:
@@ -47,6 +47,7 @@ def validate_parent_type(
     db: Session,
     child_type: models.RequirementType,
     parent_id: Optional[UUID],
+    parent: Optional[models.Requirement] = None,
 ) -> None:
     """Validate that the parent-child type relationship is valid.
 
@@ -54,6 +55,7 @@ def validate_parent_type(
         db: Database session
         child_type: The type of requirement being created/updated
         parent_id: The parent requirement ID (None for epics)
+        parent: The parent requirement if the caller already loaded it (skips the lookup)
 
     Raises:
         HierarchyValidationError: If the parent type is invalid for the child type
@@ -85,7 +87,8 @@ def validate_parent_type(
         )
 
     # Case 3: Validate parent exists and has correct type
-    parent = db.query(models.Requirement).filter(models.Requirement.id == parent_id).first()
+    if parent is None:
+        parent = db.query(models.Requirement).filter(models.Requirement.id == parent_id).first()
 
     if not parent:
         # Parent doesn't exist - this is a 404 case, not a validation error
@@ -116,12 +119,20 @@ def validate_parent_type(
 def find_hierarchy_violations(
     db: Session,
     project_id: Optional[UUID] = None,
+    after: Optional[UUID] = None,
+    limit: Optional[int] = None,
 ) -> list[dict]:
     """Find all requirements that violate hierarchy rules.
 
+    With a limit, requirements are scanned in id order (starting after
+    `after`) and the scan stops once `limit` violations are found, so callers
+    can page through large projects using the last requirement_id as cursor.
+
     Args:
         db: Database session
         project_id: Optional project ID filter
+        after: Only check requirements with an id greater than this (keyset cursor)
+        limit: Maximum number of violations to return (None for all)
 
     Returns:
         List of violation dictionaries with details for remediation
@@ -133,7 +144,13 @@ def find_hierarchy_violations(
     if project_id:
         query = query.filter(models.Requirement.project_id == project_id)
 
-    requirements = query.all()
+    if limit is None:
+        requirements = query.all()
+    else:
+        if after is not None:
+            query = query.filter(models.Requirement.id > after)
+        # Stream rows so a page never loads the whole project
+        requirements = query.order_by(models.Requirement.id).yield_per(500)
 
     for req in requirements:
         try:
@@ -172,5 +189,8 @@ def find_hierarchy_violations(
             violations.append(violation)
             logger.debug(f"Found orphaned requirement: {req.human_readable_id}")
 
+        if limit is not None and len(violations) >= limit:
+            break
+
     logger.info(f"Found {len(violations)} hierarchy violations")
     return violations
@@ -1,6 +1,8 @@
 """Utilities for working with markdown requirement templates."""
 import json
 import re
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any, Optional
 from uuid import UUID
@@ -12,6 +14,19 @@ from .models import RequirementType, LifecycleStatus
 
 TEMPLATES_DIR = Path(__file__).parent / "templates"
 
+# libyaml-backed loader (PyYAML wheels bundle it); same safe semantics as safe_load
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeLoader as _YamlLoader
+
+# Patterns used on every create/update parse, compiled once
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_DESCRIPTION_SECTION_RE = re.compile(
+    r'##\s+(?:Vision|Purpose|User Story|Description)\s*\n\n(.+?)(?:\n\n|\n#|$)', re.DOTALL
+)
+
 
 class MarkdownParseError(Exception):
     """Raised when markdown content cannot be parsed."""
@@ -72,9 +87,13 @@ def validate_tags_not_reserved(tags: list) -> None:
                 )
 
 
+@lru_cache(maxsize=None)
 def load_template(req_type: RequirementType) -> str:
     """Load the markdown template for a requirement type.
 
+    Templates ship with the package and do not change at runtime, so each
+    file is read once per process and served from memory afterwards.
+
     Args:
         req_type: The requirement type (epic, component, feature, requirement)
 
@@ -148,8 +167,7 @@ def parse_markdown(content: str) -> Dict[str, Any]:
         MarkdownParseError: If content cannot be parsed
     """
     # Match YAML frontmatter pattern (between --- markers)
-    frontmatter_pattern = r'^---\s*\n(.*?)\n---\s*\n(.*)$'
-    match = re.match(frontmatter_pattern, content, re.DOTALL)
+    match = _FRONTMATTER_RE.match(content)
 
     if not match:
         raise MarkdownParseError(
@@ -161,7 +179,7 @@ def parse_markdown(content: str) -> Dict[str, Any]:
     body = match.group(2).strip()
 
     try:
-        frontmatter = yaml.safe_load(frontmatter_str)
+        frontmatter = yaml.load(frontmatter_str, Loader=_YamlLoader)
     except yaml.YAMLError:
         # Try unsafe_load for legacy content with Python object tags
         try:
@@ -191,7 +209,6 @@ def parse_markdown(content: str) -> Dict[str, Any]:
 
                     # Handle lists
                     if value.startswith('['):
-                        import json
                         try:
                             value = json.loads(value)
                         except:
@@ -265,7 +282,7 @@ def _truncate_description(text: str, max_length: int = 500) -> str:
         Truncated text with ellipsis if needed
     """
     # Normalize whitespace (collapse newlines and multiple spaces to single space)
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WHITESPACE_RE.sub(' ', text.strip())
 
     if len(text) <= max_length:
         return text
@@ -305,7 +322,7 @@ def extract_metadata(content: str) -> Dict[str, Any]:
 
     # Extract description from body (first paragraph or first section)
     # Enforce 500 character limit with intelligent truncation
-    description_match = re.search(r'##\s+(?:Vision|Purpose|User Story|Description)\s*\n\n(.+?)(?:\n\n|\n#|$)', body, re.DOTALL)
+    description_match = _DESCRIPTION_SECTION_RE.search(body)
     raw_description = description_match.group(1).strip() if description_match else body[:500]
     description = _truncate_description(raw_description, max_length=500)
 
@@ -703,7 +720,6 @@ def inject_acceptance_criteria_into_content(
     sorted_acs = sorted(acceptance_criteria, key=get_ordinal)
 
     # Group ACs by category, preserving order
-    from collections import OrderedDict
     categories = OrderedDict()  # category -> list of ACs
 
     for ac in sorted_acs:
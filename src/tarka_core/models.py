@@ -16,9 +16,11 @@ from sqlalchemy import (
     ARRAY,
     Boolean,
     UniqueConstraint,
+    Index,
     Table,
     text,
     LargeBinary,
+    FetchedValue,
 )
 from sqlalchemy.dialects.postgresql import UUID, JSONB
 from sqlalchemy.orm import relationship
@@ -513,6 +515,14 @@ class Requirement(Base):
             "(type != 'epic' AND parent_id IS NOT NULL AND project_id IS NOT NULL)",
             name="valid_parent_and_project",
         ),
+        # Readable IDs are stored canonical (uppercase) so case-insensitive
+        # lookups can compare against the plain unique index
+        CheckConstraint(
+            "human_readable_id = upper(human_readable_id)",
+            name="ck_requirements_hrid_uppercase",
+        ),
+        # Project-scoped list filters combine project_id with type
+        Index("ix_requirements_project_type", "project_id", "type"),
     )
 
     @property
@@ -763,6 +773,11 @@ class RequirementHistory(Base):
     actor = relationship("User", foreign_keys=[actor_id])
     organization = relationship("Organization")
 
+    # History reads filter on requirement_id and take the newest entries first
+    __table_args__ = (
+        Index("ix_requirement_history_requirement_changed_at", "requirement_id", changed_at.desc()),
+    )
+
     def __repr__(self) -> str:
         return f"<RequirementHistory {self.change_type.value} at {self.changed_at}>"
 
@@ -1050,6 +1065,20 @@ class Task(Base):
     # History entries
     history = relationship("TaskHistory", back_populates="task", cascade="all, delete-orphan")
 
+    # Partial indexes over open tasks, the default task list (migration 063)
+    __table_args__ = (
+        Index(
+            "ix_tasks_open_org_status_priority_due",
+            "organization_id", "status", "priority", "due_date", "created_at",
+            postgresql_where=text("status NOT IN ('completed', 'cancelled')"),
+        ),
+        Index(
+            "ix_tasks_open_org_due_date",
+            "organization_id", "due_date",
+            postgresql_where=text("due_date IS NOT NULL AND status NOT IN ('completed', 'cancelled')"),
+        ),
+    )
+
     def __repr__(self) -> str:
         return f"<Task {self.human_readable_id}: {self.title[:30]}>"
 
@@ -1451,7 +1480,9 @@ class WorkItem(Base):
     __tablename__ = "work_items"
 
     id = Column(UUID(as_uuid=True), primary_key=True, default=uuid4)
-    human_readable_id = Column(String(20), unique=True, nullable=True, index=True)  # e.g., CR-010, IR-003
+    # e.g., CR-010, IR-003. Assigned by a BEFORE INSERT trigger; FetchedValue makes the
+    # INSERT return it (RETURNING) so it is available right after the flush.
+    human_readable_id = Column(String(20), unique=True, nullable=True, index=True, server_default=FetchedValue())
 
     # Scope
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id", ondelete="CASCADE"), nullable=False, index=True)
@@ -1539,6 +1570,28 @@ class WorkItem(Base):
         backref="included_in_releases",  # Reverse: which releases include this work item
     )
 
+    # Readable IDs are stored canonical (uppercase) so case-insensitive
+    # lookups can compare against the plain unique index
+    __table_args__ = (
+        CheckConstraint(
+            "human_readable_id = upper(human_readable_id)",
+            name="ck_work_items_hrid_uppercase",
+        ),
+        # Trigram GIN indexes back the ILIKE '%term%' search on GET /work-items
+        # (pg_trgm, migration 064)
+        *(
+            Index(
+                f"ix_work_items_{column}_trgm", column,
+                postgresql_using="gin", postgresql_ops={column: "gin_trgm_ops"},
+            )
+            for column in ("title", "description", "human_readable_id")
+        ),
+        # Tag containment filter and newest-first list order (migration 065)
+        Index("ix_work_items_tags", "tags", postgresql_using="gin"),
+        Index("ix_work_items_project_created_at", "project_id", text("created_at DESC")),
+        Index("ix_work_items_organization_created_at", "organization_id", text("created_at DESC")),
+    )
+
     @property
     def affects_count(self) -> int:
         """Count of affected requirements."""
@@ -1730,6 +1783,8 @@ class RequirementVersion(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint("requirement_id", "version_number", name="uq_requirement_version_number"),
+        # GIN index backs the tags @> filter on GET /requirements
+        Index("ix_requirement_versions_tags", "tags", postgresql_using="gin"),
     )
 
     def __repr__(self) -> str:
@@ -1898,5 +1953,15 @@ class GitHubConfiguration(Base):
         """Get full repository name (owner/name)."""
         return f"{self.repository_owner}/{self.repository_name}"
 
+    @property
+    def has_credentials(self) -> bool:
+        """True if credentials are configured (never exposes them)."""
+        return self.encrypted_credentials is not None
+
+    @property
+    def webhook_configured(self) -> bool:
+        """True if a repository webhook has been set up."""
+        return self.webhook_id is not None
+
     def __repr__(self) -> str:
         return f"<GitHubConfiguration {self.project_id}: {self.full_repo_name}>"
@@ -0,0 +1,83 @@
+"""Keyset (cursor) pagination helpers.
+
+List endpoints historically paginate with page/page_size, which becomes
+OFFSET on PostgreSQL and gets slower the deeper a client pages. Cursor
+pagination instead carries the sort key of the last row returned and asks
+for rows strictly after it, which the database can answer with an index
+range scan regardless of depth.
+
+Cursors are opaque to clients: a base64url-encoded JSON list of the sort key
+values of the last row on the page.
+
+Page-number pagination is still supported; paginate_with_total fetches a
+page and its total count in one query.
+"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable
+from uuid import UUID
+
+from sqlalchemy import func
+
+
+def encode_cursor(*values: Any) -> str:
+    """Encode the sort key of the last row on a page as an opaque cursor.
+
+    Args:
+        *values: Sort key values (datetime, UUID, str, int)
+
+    Returns:
+        URL-safe cursor string
+    """
+    payload = [
+        v.isoformat() if isinstance(v, datetime) else str(v) if isinstance(v, UUID) else v
+        for v in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: Callable[[Any], Any]) -> tuple:
+    """Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        *types: Converter for each sort key value, e.g. datetime.fromisoformat, UUID
+
+    Returns:
+        Tuple of converted sort key values
+
+    Raises:
+        ValueError: If the cursor is malformed or does not match the expected key
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        values = json.loads(raw)
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("unexpected cursor shape")
+        return tuple(convert(value) for convert, value in zip(types, values))
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid pagination cursor: {cursor}") from e
+
+
+def paginate_with_total(query, skip: int, limit: int) -> tuple[list, int]:
+    """Fetch one page of an ordered entity query together with its total count.
+
+    The total comes from COUNT(*) OVER () on the page query itself, so the
+    filtered query runs once instead of once for the rows and again for a
+    separate COUNT. A page past the end has no row to carry the total; only
+    then is a plain count issued.
+
+    Args:
+        query: Filtered and ordered single-entity Query
+        skip: Number of rows to skip
+        limit: Maximum rows to return
+
+    Returns:
+        Tuple of (rows, total)
+    """
+    rows = query.add_columns(func.count().over().label("total")).offset(skip).limit(limit).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    return [], query.order_by(None).count() if skip else 0
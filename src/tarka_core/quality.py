@@ -27,6 +27,10 @@ LENGTH_THRESHOLDS = {
     },
 }
 
+# Absolute cap on submitted markdown, checked at request validation. Far above
+# every hard_max (which only blocks approval), it just bounds parsing work.
+MAX_CONTENT_LENGTH = 100_000
+
 
 def calculate_quality_score(
     content_length: int,
@@ -28,6 +28,7 @@ from .models import (
     Environment,      # RAAS-FEAT-103: Deployment environments
     DeploymentStatus, # RAAS-FEAT-103: Deployment status
 )
+from .quality import MAX_CONTENT_LENGTH
 
 
 # Requirement Schemas
@@ -56,7 +57,12 @@ class RequirementCreate(BaseModel):
     """
 
     type: RequirementType
-    content: str = Field(..., min_length=1, description="Required markdown content with YAML frontmatter")
+    content: str = Field(
+        ...,
+        min_length=1,
+        max_length=MAX_CONTENT_LENGTH,
+        description="Required markdown content with YAML frontmatter",
+    )
     project_id: Optional[UUID] = Field(None, description="Project ID (required for epics, inherited from parent for other types)")
     # Legacy fields - DEPRECATED and ignored
     parent_id: Optional[UUID] = None
@@ -65,6 +71,12 @@ class RequirementCreate(BaseModel):
     tags: list[str] = Field(default_factory=list)
 
 
+class RequirementBatchCreate(BaseModel):
+    """Schema for creating several requirements in one request."""
+
+    requirements: list[RequirementCreate] = Field(..., min_length=1, max_length=100)
+
+
 class RequirementUpdate(BaseModel):
     """Schema for updating an existing requirement.
 
@@ -247,13 +259,18 @@ class RequirementHistoryResponse(BaseModel):
 # List Response Schemas
 
 class RequirementListResponse(BaseModel):
-    """Schema for paginated requirement list (uses lightweight RequirementListItem)."""
+    """Schema for paginated requirement list (uses lightweight RequirementListItem).
+
+    In cursor mode page, total and total_pages are omitted; pass next_cursor
+    back as ?cursor= to fetch the following page.
+    """
 
     items: list[RequirementListItem]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # Filter Schemas
@@ -397,14 +414,34 @@ class ProjectResponse(ProjectBase):
     model_config = ConfigDict(from_attributes=True, use_enum_values=True)
 
 
+class ProjectListItem(BaseModel):
+    """Schema for project list items (lightweight, no description/settings)."""
+
+    id: UUID
+    organization_id: UUID
+    name: str
+    slug: str
+    status: ProjectStatus
+    visibility: ProjectVisibility
+    created_at: datetime
+    updated_at: datetime
+
+    model_config = ConfigDict(from_attributes=True, use_enum_values=True)
+
+
 class ProjectListResponse(BaseModel):
-    """Schema for paginated project list."""
+    """Schema for paginated project list.
 
-    items: list[ProjectResponse]
-    total: int
-    page: int
+    In cursor mode page, total and total_pages are omitted; pass next_cursor
+    back as ?cursor= to fetch the following page.
+    """
+
+    items: list[ProjectListItem]
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 # ============================================================================
@@ -779,13 +816,18 @@ class TaskListItem(BaseModel):
 
 
 class TaskListResponse(BaseModel):
-    """Schema for paginated task list."""
+    """Schema for paginated task list.
+
+    In cursor mode page, total and total_pages are omitted; pass next_cursor
+    back as ?cursor= to fetch the following page.
+    """
 
     items: list[TaskListItem]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class TaskHistoryResponse(BaseModel):
@@ -1345,13 +1387,18 @@ class WorkItemListItem(BaseModel):
 
 
 class WorkItemListResponse(BaseModel):
-    """Schema for paginated Work Item list."""
+    """Schema for paginated Work Item list.
+
+    In cursor mode page, total and total_pages are omitted; pass next_cursor
+    back as ?cursor= to fetch the following page.
+    """
 
     items: list[WorkItemListItem]
-    total: int
-    page: int
+    total: Optional[int] = None
+    page: Optional[int] = None
     page_size: int
-    total_pages: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
 
 
 class WorkItemHistoryResponse(BaseModel):
@@ -1547,6 +1594,7 @@ class RequirementVersionDiff(BaseModel):
     from_title: str
     to_title: str
     changes_summary: str  # Human-readable summary of changes
+    unified_diff: str = ""  # Line diff of the content (unified format); empty if unchanged
 
 
 # CR-002 (RAAS-FEAT-104): Work Item Diff and Conflict Detection Schemas
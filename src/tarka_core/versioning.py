@@ -285,14 +285,14 @@ def should_regress_to_draft(requirement: models.Requirement) -> bool:
 def content_has_changed(old_content: Optional[str], new_content: str) -> bool:
     """Check if content has materially changed.
 
-    Uses hash comparison for efficiency on large content.
+    Compares the strings directly: equal content has equal hashes, and string
+    comparison stops at the first differing character instead of hashing both
+    sides in full.
     """
     if old_content is None:
         return True
 
-    old_hash = compute_content_hash(old_content)
-    new_hash = compute_content_hash(new_content)
-    return old_hash != new_hash
+    return old_content != new_content
 
 
 # =============================================================================
@@ -0,0 +1,91 @@
+"""Tests for transactional batch requirement creation."""
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+
+from tarka_core import crud, models
+from tarka_core.models import RequirementType
+from tarka_core.schemas import RequirementCreate
+
+
+VALID_CONTENT = "---\ntype: feature\ntitle: Valid\n---\n# Valid"
+
+
+def _make_db(projects=(), parents=()):
+    """Mock session whose IN lookups return the given Project/Requirement rows."""
+    rows = {models.Project: list(projects), models.Requirement: list(parents)}
+    db = MagicMock()
+    db.query.side_effect = lambda model: MagicMock(
+        **{"filter.return_value.all.return_value": rows.get(model, [])}
+    )
+    return db
+
+
+class TestCreateRequirements:
+    """Test that a batch is created, or rolled back, as one unit."""
+
+    def setup_method(self):
+        """Set up one parent feature's worth of fixtures."""
+        self.parent = SimpleNamespace(id=uuid4(), organization_id=uuid4())
+        self.added = []
+
+    def _fake_add(self, real_add):
+        """Record valid items; run the real validation on anything else."""
+        def add(db, requirement, *args, **kwargs):
+            if requirement.content != VALID_CONTENT:
+                return real_add(db, requirement, *args, **kwargs)
+            created = SimpleNamespace(id=uuid4())
+            self.added.append(created)
+            return created
+        return add
+
+    def test_invalid_item_rolls_back_whole_batch(self, monkeypatch):
+        """Test that a rejected item names its index and nothing is committed."""
+        monkeypatch.setattr(crud, "_add_requirement", self._fake_add(crud._add_requirement))
+        db = _make_db(parents=[self.parent])
+        items = [
+            (RequirementCreate(type=RequirementType.FEATURE, content=VALID_CONTENT), self.parent.id),
+            (RequirementCreate(type=RequirementType.FEATURE, content="no frontmatter"), self.parent.id),
+            (RequirementCreate(type=RequirementType.FEATURE, content=VALID_CONTENT), self.parent.id),
+        ]
+
+        with pytest.raises(ValueError, match=r"^Item 1: "):
+            crud.create_requirements(db, items, user_id=None)
+
+        assert len(self.added) == 1  # the item before the bad one was flushed...
+        db.rollback.assert_called()  # ...and rolled back with it
+        db.commit.assert_not_called()
+
+    def test_missing_parent_names_item_before_any_write(self, monkeypatch):
+        """Test that an unknown parent is reported by index without creating anything."""
+        monkeypatch.setattr(crud, "_add_requirement", self._fake_add(crud._add_requirement))
+        db = _make_db(parents=[self.parent])
+        missing_id = uuid4()
+        items = [
+            (RequirementCreate(type=RequirementType.FEATURE, content=VALID_CONTENT), self.parent.id),
+            (RequirementCreate(type=RequirementType.FEATURE, content=VALID_CONTENT), missing_id),
+        ]
+
+        with pytest.raises(crud.RequirementReferenceNotFoundError, match=f"^Item 1: Parent requirement {missing_id} not found"):
+            crud.create_requirements(db, items, user_id=None)
+
+        assert self.added == []
+        db.commit.assert_not_called()
+
+    def test_valid_batch_commits_once(self, monkeypatch):
+        """Test that a valid batch is committed in a single transaction."""
+        monkeypatch.setattr(crud, "_add_requirement", self._fake_add(crud._add_requirement))
+        db = _make_db(parents=[self.parent])
+        items = [
+            (RequirementCreate(type=RequirementType.FEATURE, content=VALID_CONTENT), self.parent.id)
+            for _ in range(3)
+        ]
+
+        created = crud.create_requirements(db, items, user_id=None)
+
+        assert created == self.added
+        assert len(created) == 3
+        db.commit.assert_called_once()
+        db.rollback.assert_not_called()
@@ -0,0 +1,48 @@
+"""Tests for ETag helpers used by conditional GET endpoints."""
+from datetime import datetime
+from uuid import uuid4
+
+from tarka_core.etag import etag_for_bytes, etag_for_version, etag_matches
+
+
+class TestEtagGeneration:
+    """Test ETag construction."""
+
+    def test_body_etag_is_quoted_and_stable(self):
+        """Test that the same body always yields the same quoted tag."""
+        etag = etag_for_bytes(b'{"id": 1}')
+        assert etag.startswith('"') and etag.endswith('"')
+        assert etag == etag_for_bytes(b'{"id": 1}')
+
+    def test_body_etag_changes_with_body(self):
+        """Test that different bodies yield different tags."""
+        assert etag_for_bytes(b'{"id": 1}') != etag_for_bytes(b'{"id": 2}')
+
+    def test_version_etag_changes_with_timestamp(self):
+        """Test that bumping updated_at changes the version tag."""
+        row_id = uuid4()
+        before = etag_for_version(row_id, datetime(2025, 1, 1, 12, 0, 0))
+        after = etag_for_version(row_id, datetime(2025, 1, 1, 12, 0, 1))
+        assert before != after
+
+
+class TestEtagMatching:
+    """Test If-None-Match comparison."""
+
+    def test_missing_header_never_matches(self):
+        """Test that no header means a full response."""
+        assert etag_matches(None, '"abc"') is False
+        assert etag_matches("", '"abc"') is False
+
+    def test_exact_match(self):
+        """Test that the current tag matches."""
+        assert etag_matches('"abc"', '"abc"') is True
+
+    def test_weak_and_listed_tags(self):
+        """Test weak comparison and comma-separated tag lists."""
+        assert etag_matches('"old", W/"abc"', '"abc"') is True
+        assert etag_matches('"old", "older"', '"abc"') is False
+
+    def test_wildcard_matches(self):
+        """Test that * matches any current representation."""
+        assert etag_matches("*", '"abc"') is True
@@ -381,6 +381,24 @@ class TestFindHierarchyViolations:
         # Verify project filter was applied
         self.db.query.return_value.filter.assert_called()
 
+    def test_limit_stops_after_enough_violations(self):
+        """Test that a limited scan returns at most limit violations."""
+        requirements = []
+        for i in range(3):
+            requirement = MagicMock(spec=Requirement)
+            requirement.id = uuid4()
+            requirement.type = RequirementType.FEATURE
+            requirement.parent_id = None  # VIOLATION: Feature needs parent
+            requirement.human_readable_id = f"TEST-FEAT-00{i}"
+            requirement.title = "Parentless Feature"
+            requirements.append(requirement)
+
+        self.db.query.return_value.order_by.return_value.yield_per.return_value = requirements
+
+        violations = find_hierarchy_violations(self.db, None, limit=2)
+
+        assert [v["requirement_id"] for v in violations] == [str(r.id) for r in requirements[:2]]
+
 
 class TestHierarchyValidationErrorAttributes:
     """Test HierarchyValidationError attributes."""
@@ -0,0 +1,51 @@
+"""Tests for keyset pagination cursor helpers."""
+from datetime import datetime
+from uuid import UUID, uuid4
+
+import pytest
+from tarka_core.pagination import encode_cursor, decode_cursor
+
+
+class TestCursorRoundTrip:
+    """Test encoding and decoding of pagination cursors."""
+
+    def test_datetime_and_uuid_round_trip(self):
+        """Test that a (created_at, id) key survives encode/decode."""
+        created_at = datetime(2025, 1, 2, 3, 4, 5, 678901)
+        row_id = uuid4()
+
+        cursor = encode_cursor(created_at, row_id)
+        assert decode_cursor(cursor, datetime.fromisoformat, UUID) == (created_at, row_id)
+
+    def test_mixed_key_round_trip(self):
+        """Test that int and str sort keys round-trip unchanged."""
+        cursor = encode_cursor(2, "RAAS-FEAT-042")
+        assert decode_cursor(cursor, int, str) == (2, "RAAS-FEAT-042")
+
+    def test_cursor_is_url_safe(self):
+        """Test that cursors need no escaping in a query string."""
+        cursor = encode_cursor(datetime.now(), uuid4())
+        assert "=" not in cursor
+        assert "+" not in cursor
+        assert "/" not in cursor
+
+
+class TestInvalidCursors:
+    """Test that malformed cursors are rejected with ValueError."""
+
+    def test_garbage_rejected(self):
+        """Test that a non-base64 cursor is rejected."""
+        with pytest.raises(ValueError):
+            decode_cursor("not a cursor!", datetime.fromisoformat, UUID)
+
+    def test_wrong_arity_rejected(self):
+        """Test that a cursor with the wrong number of keys is rejected."""
+        cursor = encode_cursor(datetime.now())
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, datetime.fromisoformat, UUID)
+
+    def test_wrong_type_rejected(self):
+        """Test that a cursor whose values do not convert is rejected."""
+        cursor = encode_cursor("yesterday", "not-a-uuid")
+        with pytest.raises(ValueError):
+            decode_cursor(cursor, datetime.fromisoformat, UUID)
@@ -0,0 +1,90 @@
+"""Tests for the GET /requirements/{id}/children response body."""
+import json
+from datetime import datetime
+from uuid import uuid4
+
+import pytest
+from starlette.requests import Request
+
+from tarka_core import crud, models
+
+# Importing the router creates the database engine, which needs the driver
+requirements_router = pytest.importorskip("tarka_core.api.routers.requirements")
+
+
+def _make_request(headers=None):
+    """Build a bare GET request (solo mode: no user on request.state)."""
+    raw_headers = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/", "headers": raw_headers})
+
+
+def _make_requirement(hrid, title, parent=None):
+    """Build a transient Requirement with a single approved version."""
+    requirement = models.Requirement(
+        id=uuid4(),
+        human_readable_id=hrid,
+        type=models.RequirementType.FEATURE,
+        organization_id=uuid4(),
+        project_id=uuid4(),
+        parent_id=parent.id if parent else None,
+    )
+    requirement.versions = [models.RequirementVersion(
+        id=uuid4(),
+        version_number=1,
+        status=models.LifecycleStatus.APPROVED,
+        content=f"# {title}",
+        content_hash="0" * 64,
+        title=title,
+        description=f"{title} description",
+        tags=["mvp"],
+        adheres_to=[],
+        content_length=len(title) + 2,
+        quality_score=models.QualityScore.OK,
+        created_at=datetime(2025, 1, 2, 3, 4, 5),
+    )]
+    return requirement
+
+
+@pytest.fixture
+def children(monkeypatch):
+    """Serve an epic with two children from patched CRUD lookups."""
+    parent = _make_requirement("RAAS-EPIC-001", "Parent")
+    kids = [
+        _make_requirement("RAAS-FEAT-002", "Second child", parent),
+        _make_requirement("RAAS-FEAT-001", "First child", parent),
+    ]
+    monkeypatch.setattr(crud, "get_requirement_with_access", lambda db, identifier, user_id: (parent, True))
+    monkeypatch.setattr(crud, "get_requirement_children", lambda db, parent_id: kids)
+    return kids
+
+
+class TestGetRequirementChildren:
+    """Test the serialized children payload."""
+
+    def test_children_payload_has_fields(self, children):
+        """Test that each child is serialized with its fields, not as {}."""
+        response = requirements_router.get_requirement_children("RAAS-EPIC-001", _make_request(), db=None)
+
+        assert response.status_code == 200
+        payload = json.loads(response.body)
+        assert [item["human_readable_id"] for item in payload] == ["RAAS-FEAT-002", "RAAS-FEAT-001"]
+        first = payload[0]
+        assert first["id"] == str(children[0].id)
+        assert first["title"] == "Second child"
+        assert first["description"] == "Second child description"
+        assert first["type"] == "feature"
+        assert first["status"] == "approved"
+        assert first["tags"] == ["mvp"]
+        assert first["version_number"] == 1
+        assert first["child_count"] == 0
+
+    def test_matching_etag_returns_304(self, children):
+        """Test that sending the returned ETag back yields 304 with no body."""
+        response = requirements_router.get_requirement_children("RAAS-EPIC-001", _make_request(), db=None)
+        etag = response.headers["etag"]
+
+        cached = requirements_router.get_requirement_children(
+            "RAAS-EPIC-001", _make_request({"If-None-Match": etag}), db=None
+        )
+        assert cached.status_code == 304
+        assert cached.body == b""